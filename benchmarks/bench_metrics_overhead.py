@@ -0,0 +1,47 @@
+"""지표 기록 오버헤드 측정
+
+핫 패스에서 호출되는 Counter.inc / Histogram.observe 비용을
+HTTP 요청 1회(수십~수백 ms)와 비교한다.
+
+실행: python -m benchmarks.bench_metrics_overhead [반복수]
+"""
+
+import sys
+import time
+
+from core.metrics import MetricsRegistry
+
+DEFAULT_ITERATIONS = 200_000
+
+
+def main(iterations: int = DEFAULT_ITERATIONS):
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "bench", ("site", "outcome"))
+    histogram = registry.histogram("bench_seconds", "bench", ("site", "outcome"))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        pass
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        counter.inc(site="danawa", outcome="ok")
+        histogram.observe(0.123, site="danawa", outcome="ok")
+    elapsed = time.perf_counter() - start - baseline
+
+    per_call_us = elapsed / iterations * 1e6
+    # _get_html 1회당 inc 2회 + observe 2회 수준
+    per_request_us = per_call_us * 2
+    print(f"반복: {iterations:,}")
+    print(f"inc+observe 1쌍: {per_call_us:.2f} µs")
+    print(f"요청 1회당 추정 오버헤드: {per_request_us:.2f} µs")
+    print(f"100ms 요청 대비: {per_request_us / 100_000 * 100:.4f}%")
+
+    start = time.perf_counter()
+    registry.render()
+    print(f"/metrics 렌더링: {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS)
@@ -0,0 +1,94 @@
+"""모델 메모리 벤치마크 (100k 객체)
+
+기존 방식(__dict__ 보유 dataclass + ISO 문자열 시각)과
+현재 모델(__slots__ + epoch 초 + 사이트명 intern)의 메모리 사용량 비교
+
+실행: python -m benchmarks.bench_models_memory [개수]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from core.models import PriceResult, TrackingState, now_epoch
+
+DEFAULT_COUNT = 100_000
+
+
+@dataclass
+class LegacyPriceResult:
+    """이전 PriceResult 구조 (비교용)"""
+
+    site: str
+    title: str
+    price: int
+    product_url: str
+    fetched_at: str
+
+
+def _site(i: int) -> str:
+    # 네트워크/파싱에서 생성된 것처럼 매번 새 문자열 객체로 만든다
+    return "".join(["dana", "wa"] if i % 2 else ["g", "market"])
+
+
+def _measure(factory, count: int) -> int:
+    tracemalloc.start()
+    objs = [factory(i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return current
+
+
+def legacy_result(i: int) -> LegacyPriceResult:
+    base = datetime(2026, 1, 1)
+    return LegacyPriceResult(
+        site=_site(i),
+        title="RTX 4070",
+        price=1_000_000 + i,
+        product_url="https://prod.danawa.com/info/?pcode=1",
+        fetched_at=(base + timedelta(seconds=i)).isoformat(),
+    )
+
+
+def compact_result(i: int) -> PriceResult:
+    return PriceResult(
+        site=_site(i),
+        title="RTX 4070",
+        price=1_000_000 + i,
+        product_url="https://prod.danawa.com/info/?pcode=1",
+        fetched_at=1_767_225_600 + i,
+    )
+
+
+def compact_state(i: int) -> TrackingState:
+    site = _site(i)
+    return TrackingState(
+        keyword="RTX 4070",
+        selected_sites=[site],
+        crawl_interval=30,
+        notify_interval=1440,
+        email="user@gmail.com",
+        selected_products={site: "https://prod.danawa.com/info/?pcode=1"},
+        last_prices={site: 1_000_000 + i},
+        last_crawl_at=now_epoch(),
+        last_notify_at=None,
+        status="active",
+    )
+
+
+def main(count: int = DEFAULT_COUNT):
+    legacy = _measure(legacy_result, count)
+    compact = _measure(compact_result, count)
+    states = _measure(compact_state, count)
+
+    print(f"객체 수: {count:,}")
+    print(f"PriceResult (기존 dict+ISO): {legacy / count:8.1f} B/객체")
+    print(f"PriceResult (slots+epoch)  : {compact / count:8.1f} B/객체")
+    print(f"절감률: {(1 - compact / legacy) * 100:.1f}%")
+    print(f"TrackingState (slots+epoch): {states / count:8.1f} B/객체")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,173 @@
+"""기록된 응답 기반 파서 벤치마크 (네트워크 불필요)
+
+benchmarks/fixtures에는 실제 페이지 구조를 따른 비식별 코퍼스(다나와/지마켓 검색·
+상품 페이지)와 정답 스냅샷(expected.json)이 들어 있어 바로 run 할 수 있다.
+실제 사이트로 코퍼스를 바꾸려면:
+
+1) 코퍼스 기록 (실제 사이트 접속):
+   python -m benchmarks.bench_parsers record --keyword "RTX 4070" --fetch 3
+   (또는 PRICE_ALERT_RECORD_DIR=benchmarks/fixtures python main.py 로 사용 중 기록)
+
+2) 정답 스냅샷 갱신 (파서 변경이 의도된 경우):
+   python -m benchmarks.bench_parsers run --update
+
+3) 벤치마크 + 정합성 검사:
+   python -m benchmarks.bench_parsers run --iterations 20
+
+사이트/작업(search|fetch)별로 초당 처리 페이지 수, 호출당 최대 할당량을
+출력하고, 스냅샷과 다르면(셀렉터 깨짐 등) 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from functools import partial
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from scrapers.fixtures import FixtureStore
+from scrapers.registry import SITE_REGISTRY
+from config.constants import DEFAULT_CANDIDATE_COUNT
+
+DEFAULT_FIXTURE_DIR = "benchmarks/fixtures"
+EXPECTED_FILE = "expected.json"
+
+# 사이트 → 스크래퍼 생성 함수 (등록부의 사이트 설정 적용)
+SCRAPERS = {site: partial(SITE_REGISTRY.create, site) for site in SITE_REGISTRY.sites()}
+
+
+def _operation(scraper, url: str):
+    """기록된 URL → (작업 이름, 호출 함수)"""
+    if url.startswith(scraper.BASE_SEARCH_URL):
+        params = parse_qs(urlparse(url).query)
+        keyword = params[scraper.SEARCH_QUERY_PARAM][0]
+        page = int(params.get(scraper.SEARCH_PAGE_PARAM, ["1"])[0])
+        if page > 1:
+            # 2페이지 이후는 iter_search가 더 불러온 페이지
+            return "search", lambda: scraper.search_page(keyword, page)
+        return "search", lambda: scraper.search(keyword, limit=DEFAULT_CANDIDATE_COUNT)
+    return "fetch", lambda: scraper.fetch(url)
+
+
+def _comparable(result):
+    """조회 시각을 제외한 비교용 값"""
+    if result is None:
+        return None
+    if isinstance(result, list):
+        return [item.to_dict() for item in result]
+    data = result.to_dict()
+    data.pop("fetched_at", None)
+    return data
+
+
+def record(args):
+    for site in args.site:
+        scraper = SCRAPERS[site](record_dir=args.dir)
+        candidates = scraper.search(args.keyword, limit=DEFAULT_CANDIDATE_COUNT)
+        print(f"[{site}] 검색 후보 {len(candidates)}개 기록")
+        for candidate in candidates[: args.fetch]:
+            result = scraper.fetch(candidate.product_url)
+            print(f"[{site}] 상품 기록: {candidate.product_url} → {result}")
+
+
+def run(args) -> int:
+    store = FixtureStore(args.dir)
+    if not len(store):
+        print(f"기록된 응답이 없습니다: {args.dir} (record 명령으로 먼저 기록)")
+        return 1
+
+    expected_path = Path(args.dir) / EXPECTED_FILE
+    expected = {}
+    if expected_path.exists() and not args.update:
+        with open(expected_path, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+
+    scrapers = {site: cls(replay_dir=args.dir) for site, cls in SCRAPERS.items()}
+    # 같은 응답을 반복 조회하므로 가격 영역 해시 캐시를 끄고 파서 자체를 측정
+    for scraper in scrapers.values():
+        if hasattr(scraper, "region_cache_size"):
+            scraper.region_cache_size = 0
+    elapsed = defaultdict(float)
+    pages = defaultdict(int)
+    peak_alloc = defaultdict(int)
+    actual = {}
+    failures = []
+
+    for url in store.urls():
+        site = store.entry(url)["site"]
+        if site not in scrapers:
+            continue
+        op, call = _operation(scrapers[site], url)
+        key = (site, op)
+
+        # 정합성 + 할당량 (tracemalloc은 느리므로 1회만)
+        tracemalloc.start()
+        result = call()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_alloc[key] = max(peak_alloc[key], peak)
+
+        actual[url] = _comparable(result)
+        if url in expected and expected[url] != actual[url]:
+            failures.append(url)
+
+        # 처리량
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            call()
+        elapsed[key] += time.perf_counter() - start
+        pages[key] += args.iterations
+
+    for site, op in sorted(pages):
+        key = (site, op)
+        rate = pages[key] / elapsed[key] if elapsed[key] else 0.0
+        print(
+            f"{site:8s} {op:6s} {rate:8.1f} pages/s  "
+            f"최대 할당 {peak_alloc[key] / 1024:8.1f} KiB/호출"
+        )
+
+    if args.update:
+        with open(expected_path, "w", encoding="utf-8") as f:
+            json.dump(actual, f, indent=2, ensure_ascii=False)
+        print(f"스냅샷 갱신: {expected_path}")
+        return 0
+
+    missing = [url for url in actual if url not in expected]
+    if missing:
+        print(f"스냅샷 없는 응답 {len(missing)}개 (--update로 생성)")
+    if failures:
+        print(f"결과 불일치 {len(failures)}개:")
+        for url in failures:
+            print(f"  {url}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="기록된 응답 기반 파서 벤치마크")
+    parser.add_argument("--dir", default=DEFAULT_FIXTURE_DIR, help="코퍼스 디렉터리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_record = sub.add_parser("record", help="실제 사이트 응답 기록")
+    p_record.add_argument("--keyword", required=True)
+    p_record.add_argument(
+        "--site", nargs="+", default=list(SCRAPERS), choices=list(SCRAPERS)
+    )
+    p_record.add_argument("--fetch", type=int, default=3, help="상세 조회할 후보 수")
+
+    p_run = sub.add_parser("run", help="벤치마크 + 정합성 검사")
+    p_run.add_argument("--iterations", type=int, default=20)
+    p_run.add_argument("--update", action="store_true", help="정답 스냅샷 갱신")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args)
+        return 0
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
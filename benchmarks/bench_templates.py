@@ -0,0 +1,113 @@
+"""가격 알림 메일 렌더링 비용 측정
+
+추적 대상(사이트 2개, 추이 30회)마다 컨텍스트 생성 + 텍스트/HTML 렌더링 비용을
+기존 f-string 텍스트 생성, MIME 메시지 직렬화와 비교하고 수신자 N명 digest
+발송 1회분의 렌더링 시간을 추정한다.
+
+실행: python -m benchmarks.bench_templates [수신자 수]
+"""
+
+import random
+import sys
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from core.models import PriceResult
+from notify.templates import build_price_context, render_price_alert
+from config.constants import PRICE_HISTORY_POINTS
+
+DEFAULT_RECIPIENTS = 20_000
+
+
+def _legacy_price_alert(keyword, results) -> tuple:
+    """템플릿 엔진 도입 전 create_price_alert_email (텍스트만)"""
+    subject = f"[최저가 알림] {keyword}"
+    site_info = []
+    for result in results:
+        site_name = "다나와" if result.site == "danawa" else "지마켓"
+        site_info.append(f"""
+【{site_name}】
+상품명: {result.title}
+가격: {result.price:,}원
+링크: {result.product_url}
+조회시각: {result.fetched_at_iso}
+        """.strip())
+    body = f"""
+안녕하세요, 최저가 알림이입니다.
+
+관심상품 '{keyword}'의 최신 가격 정보를 알려드립니다.
+
+{chr(10).join(site_info)}
+
+---
+본 알림은 자동으로 발송되었습니다.
+배송비, 카드할인, 쿠폰 등은 포함되지 않은 표시가 기준입니다.
+    """.strip()
+    return subject, body
+
+
+def _trackers(count: int, rng: random.Random):
+    """(키워드, 결과, 추이) 목록"""
+    trackers = []
+    now = int(time.time())
+    for i in range(count):
+        keyword = f"상품 {i} <특가>"
+        results, history = [], {}
+        for site in ("danawa", "gmarket"):
+            url = f"https://{site}.example/item?id={i}&q=1"
+            base = rng.randint(10_000, 2_000_000)
+            prices = [
+                base + rng.randint(-base // 10, base // 10)
+                for _ in range(PRICE_HISTORY_POINTS)
+            ]
+            results.append(PriceResult(site, f"{keyword} {site}", prices[-1], url, now))
+            history[url] = prices
+        trackers.append((keyword, results, history))
+    return trackers
+
+
+def _per_call_us(func, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(*item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def _mime(subject, text, html=None) -> bytes:
+    msg = MIMEMultipart("alternative" if html else "mixed")
+    msg["Subject"] = subject
+    msg.attach(MIMEText(text, "plain", "utf-8"))
+    if html:
+        msg.attach(MIMEText(html, "html", "utf-8"))
+    return msg.as_bytes()
+
+
+def main(recipients: int = DEFAULT_RECIPIENTS):
+    trackers = _trackers(min(recipients, 2_000), random.Random(0))
+
+    legacy_us = _per_call_us(lambda k, r, h: _legacy_price_alert(k, r), trackers)
+    context_us = _per_call_us(build_price_context, trackers)
+    contexts = [(build_price_context(*t),) for t in trackers]
+    render_us = _per_call_us(render_price_alert, contexts)
+    rendered = [render_price_alert(*c) for c in contexts]
+    mime_text_us = _per_call_us(lambda s, t, h: _mime(s, t), rendered[:200])
+    mime_us = _per_call_us(_mime, rendered[:200])
+
+    total_us = context_us + render_us
+    print(
+        f"표본: 추적 대상 {len(trackers):,}개 (사이트 2개, 추이 {PRICE_HISTORY_POINTS}회)"
+    )
+    print(f"기존 f-string (텍스트만):   {legacy_us:8.2f} µs")
+    print(f"컨텍스트 생성 (추이 포함):  {context_us:8.2f} µs")
+    print(f"텍스트+HTML 렌더링:         {render_us:8.2f} µs")
+    print(f"MIME 직렬화 (텍스트만):     {mime_text_us:8.2f} µs")
+    print(f"MIME 직렬화 (multipart):    {mime_us:8.2f} µs")
+    print(
+        f"수신자 {recipients:,}명 digest 렌더링: {total_us * recipients / 1e6:.2f} 초 "
+        f"(MIME 포함 {(total_us + mime_us) * recipients / 1e6:.2f} 초)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECIPIENTS)
@@ -0,0 +1,149 @@
+"""기록된 응답 재생 기반 메모리 소크 테스트 (네트워크 불필요)
+
+기록된 검색/상품 페이지를 지정한 시간 동안 반복 조회하면서 RSS(와 선택적으로
+tracemalloc 추적량)를 주기적으로 측정하고, 워밍업 이후 첫 구간과 마지막 구간의
+중앙값 차이가 한도를 넘으면 종료 코드 1을 반환한다.
+
+    python -m benchmarks.soak_memory --hours 4
+    python -m benchmarks.soak_memory --hours 0.1 --trace --max-growth-mb 4
+
+기본 코퍼스는 benchmarks/fixtures (저장소에 포함), 새로 기록하려면
+benchmarks/bench_parsers.py record 를 쓴다.
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.bench_parsers import DEFAULT_FIXTURE_DIR, SCRAPERS, _operation
+from core.memory import MemoryWatermark
+from scrapers.fixtures import FixtureStore
+
+
+def _window_median(samples, fraction: float) -> float:
+    """샘플 앞쪽 fraction 구간 중앙값 (음수면 뒤쪽)"""
+    count = max(1, int(len(samples) * abs(fraction)))
+    window = samples[:count] if fraction > 0 else samples[-count:]
+    return statistics.median(window)
+
+
+def _slope_per_hour(points) -> float:
+    """(경과 초, 바이트) 최소제곱 기울기 → 시간당 증가량 (바이트)"""
+    if len(points) < 2:
+        return 0.0
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    if not var:
+        return 0.0
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return cov / var * 3600
+
+
+def soak(args) -> int:
+    store = FixtureStore(args.dir)
+    if not len(store):
+        print(f"기록된 응답이 없습니다: {args.dir} (bench_parsers record로 먼저 기록)")
+        return 1
+
+    scrapers = {site: cls(replay_dir=args.dir) for site, cls in SCRAPERS.items()}
+    if not args.region_cache:
+        # 캐시 적중 시 파싱을 건너뛰므로 기본은 매번 DOM을 만들고 해체하도록 끈다
+        for scraper in scrapers.values():
+            if hasattr(scraper, "region_cache_size"):
+                scraper.region_cache_size = 0
+    calls = [
+        _operation(scrapers[store.entry(url)["site"]], url)[1]
+        for url in store.urls()
+        if store.entry(url)["site"] in scrapers
+    ]
+
+    watermark = MemoryWatermark("soak", trace=args.trace)
+    duration = args.hours * 3600
+    warmup = duration * args.warmup
+    start = time.monotonic()
+    next_sample = start
+    rss_points, traced_points = [], []
+    pages = 0
+
+    try:
+        while time.monotonic() - start < duration:
+            for call in calls:
+                call()
+            pages += len(calls)
+
+            now = time.monotonic()
+            if now < next_sample:
+                continue
+            next_sample = now + args.interval
+            # 순환 참조 잔여물이 아니라 실제 누적만 보도록 측정 전에 수거
+            gc.collect()
+            rss = watermark.sample()
+            elapsed = now - start
+            if elapsed >= warmup:
+                rss_points.append((elapsed, rss))
+                if tracemalloc.is_tracing():
+                    traced_points.append((elapsed, watermark.traced))
+            print(
+                f"{elapsed / 60:7.1f}분  {pages:9d} pages  {watermark.summary()}",
+                flush=True,
+            )
+    finally:
+        watermark.close()
+
+    if len(rss_points) < 2:
+        print(
+            "워밍업 이후 샘플이 부족합니다 (--hours를 늘리거나 --interval을 줄이세요)"
+        )
+        return 1
+
+    limit = args.max_growth_mb * 2**20
+    failed = False
+    for name, points in (("RSS", rss_points), ("tracemalloc", traced_points)):
+        if len(points) < 2:
+            continue
+        values = [y for _, y in points]
+        growth = _window_median(values, -args.window) - _window_median(
+            values, args.window
+        )
+        slope = _slope_per_hour(points)
+        print(
+            f"{name:12s} 증가 {growth / 2**20:+7.2f}MiB  "
+            f"기울기 {slope / 2**20:+7.2f}MiB/시간  (한도 {args.max_growth_mb}MiB)"
+        )
+        failed |= growth > limit
+
+    print(f"총 {pages}페이지, {pages / (time.monotonic() - start):.1f} pages/s")
+    if failed:
+        print("메모리 증가가 한도를 넘었습니다")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="기록된 응답 재생 메모리 소크 테스트")
+    parser.add_argument("--dir", default=DEFAULT_FIXTURE_DIR, help="코퍼스 디렉터리")
+    parser.add_argument("--hours", type=float, default=1.0, help="실행 시간 (시간)")
+    parser.add_argument("--interval", type=float, default=30, help="측정 주기 (초)")
+    parser.add_argument(
+        "--warmup", type=float, default=0.1, help="측정에서 제외할 앞부분 비율"
+    )
+    parser.add_argument(
+        "--window", type=float, default=0.2, help="처음/마지막 비교 구간 비율"
+    )
+    parser.add_argument(
+        "--max-growth-mb", type=float, default=8, help="허용 메모리 증가량 (MiB)"
+    )
+    parser.add_argument("--trace", action="store_true", help="tracemalloc 수위도 측정")
+    parser.add_argument(
+        "--region-cache", action="store_true", help="다나와 가격 영역 캐시 사용"
+    )
+    return soak(parser.parse_args())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,7 @@ EMAIL_DOMAINS = ["gmail.com", "naver.com"]
 DEFAULT_CRAWL_INTERVAL = 30  # 기본: 30분, 테스트: 1분
 DEFAULT_NOTIFY_INTERVAL = 1440  # 24시간
 DEFAULT_CANDIDATE_COUNT = 10  # 검색 결과 후보 개수
+SEARCH_MAX_PAGES = 10  # iter_search가 따라가는 최대 검색 결과 페이지 수
 
 # 지터 설정 (초 단위)
 JITTER_MIN = 0
@@ -25,6 +26,45 @@ BACKOFF_DELAYS = [1, 5, 15]  # 1분 → 5분 → 15분 → 다음 주기
 PRICE_CHANGE_THRESHOLD = 0.30  # ±30%
 TOKEN_MISMATCH_THRESHOLD = 0.5  # 핵심 토큰 50% 이상 불일치
 
+# 상품명 토큰 캐시 크기 (LRU)
+TOKEN_CACHE_SIZE = 4096
+
+# 상품명 변경 감지용 토큰 서명 크기 (비트)
+TITLE_SIGNATURE_BITS = 128
+
+# 다나와 쇼핑몰 가격 영역 해시 캐시 (상품 URL 수, 0이면 비활성화)
+REGION_CACHE_SIZE = 1024
+
+# 후보 선택 시 상품 페이지 선행 조회
+PREFETCH_TTL = 120  # 선행 조회 결과를 재사용할 수 있는 시간 (초)
+PREFETCH_WORKERS = 2  # 동시 선행 조회 수
+PREFETCH_WAIT = 3.0  # 추적 시작 시 진행 중인 선행 조회를 기다리는 최대 시간 (초)
+PREFETCH_POLL = 0.1  # 진행 중인 선행 조회 결과 확인 간격 (초, UI 스레드를 막지 않음)
+PREFETCH_DEBOUNCE = 0.4  # 후보 선택이 이만큼 멈춰야 선행 조회 시작 (초)
+
+# 상품별 최저가 집계 인덱스
+PRICE_INDEX_PATH = "data/price_index.json"
+PRICE_INDEX_SAVE_INTERVAL = 60  # 인덱스 파일 최소 저장 간격 (초, 전체를 다시 씀)
+PRICE_LOW_WINDOW_DAYS = 30  # 기간 최저가 기간 (일)
+PRICE_HISTORY_POINTS = 30  # 상품별로 보관할 최근 관측 가격 수 (알림 메일 추이 그래프)
+
+# 사이트 등록부 설정 파일 (없으면 기본 사이트만, scrapers.registry 참고)
+SITES_CONFIG_PATH = "config/sites.json"
+SITES_CONFIG_ENV = "PRICE_ALERT_SITES_FILE"
+ALL_SITES_LABEL = "전체"  # 사이트 선택: 등록된 모든 사이트
+
+# 일괄 등록 (키워드 검색 후 자동 선택)
+BULK_IMPORT_MATCH_THRESHOLD = 0.8  # 키워드 토큰이 상품명에 포함된 비율 하한
+BULK_IMPORT_WORKERS = 4  # 동시 검색 수
+BULK_IMPORT_BATCH_SIZE = 20  # 한 번에 제출하는 검색 수
+BULK_SEARCH_RATE_LIMIT = 1.0  # 사이트별 검색 요청 허용량 (초당)
+BULK_SEARCH_RATE_BURST = 3
+
+# 사이트 간 상품 매칭 (MinHash/LSH)
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16  # 밴드당 4행
+CROSS_SITE_MATCH_THRESHOLD = 0.3  # 사이트별 상품명 표기 차이를 감안한 최소 유사도
+
 # 상태 코드
 STATE_ACTIVE = "active"
 STATE_NOT_FOUND = "not_found"
@@ -36,3 +76,79 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
 # 타임아웃 (초)
 REQUEST_TIMEOUT = 15
+
+# HTML 파서 (BeautifulSoup 파서 이름, 사이트 설정 parser로 변경 가능)
+HTML_PARSER = "lxml"
+
+# HTTP 연결 풀 (호스트당 keep-alive 연결 재사용)
+POOL_CONNECTIONS = 4  # 풀을 유지할 호스트 수
+POOL_MAXSIZE = 4  # 호스트당 최대 연결 수 (초과 요청은 대기)
+HTTP_RETRIES = 2  # 연결 오류/429/5xx 재시도 횟수
+HTTP_RETRY_BACKOFF = 0.5  # 재시도 백오프 계수 (초)
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)  # 재시도할 응답 상태
+FETCH_MAX_WORKERS = 4  # fetch_many 기본 동시 요청 수
+
+# 세션 유지 (재시작 후 첫 요청 지연 완화)
+SESSION_DIR = "data/sessions"  # 사이트별 쿠키 파일 디렉터리
+COOKIE_SAVE_INTERVAL = 60  # 새 쿠키를 받았을 때 저장하는 최소 간격 (초)
+WARM_UP_ON_START = True  # 시작 시 사이트 호스트에 keep-alive 연결을 미리 열어 둠
+WARM_UP_CONNECTIONS = 2  # 호스트당 미리 열어 둘 연결 수 (POOL_MAXSIZE 이하)
+WARM_UP_TIMEOUT = 5  # 예열 요청 타임아웃 (초)
+
+# 크롤링 파이프라인 (단계 사이 큐가 차면 앞 단계가 대기)
+PIPELINE_FETCH_WORKERS = 4
+PIPELINE_PARSE_WORKERS = 2
+PIPELINE_QUEUE_SIZE = 32  # 단계 사이 큐 최대 길이
+PIPELINE_PERSIST_BATCH = 16  # 한 번에 저장할 최대 추적 대상 수
+PIPELINE_PERSIST_INTERVAL = 0.5  # 저장 배치를 모으는 최대 시간 (초)
+CRAWL_SKIP_RETRY = 30  # 이전 크롤링이 파이프라인에서 처리 중일 때 다시 확인할 간격 (초)
+
+# 다중 프로세스 작업자 (SQLite 임대 큐)
+LEASE_DB_PATH = "data/queue.db"
+LEASE_SECONDS = 120  # 임대 유효 시간 (크롤링 1회 + 지터보다 길어야 함)
+LEASE_HEARTBEAT = 30  # 임대 갱신 주기 (초)
+WORKER_THREADS = 4  # 작업자 프로세스당 동시 처리 추적 대상 수
+WORKER_POLL_INTERVAL = 1.0  # 실행할 대상이 없을 때 대기 (초)
+COORDINATOR_EXPORT_INTERVAL = 60  # 큐 → 상태 파일 내보내기 주기 (초)
+WORKER_MAX_TASKS = 5000  # 이만큼 처리하면 작업자 프로세스 재시작 (0이면 무제한)
+WORKER_MAX_RSS_MB = 512  # RSS가 이를 넘으면 작업자 프로세스 재시작 (0이면 무제한)
+MEMORY_TRACE_ENV = "PRICE_ALERT_TRACE_MEMORY"  # 1이면 작업자별 tracemalloc 수위 기록
+SMTP_USER_ENV = "PRICE_ALERT_SMTP_USER"  # 작업자 프로세스의 발신 계정
+SMTP_PASSWORD_ENV = "PRICE_ALERT_SMTP_PASSWORD"
+
+# 마감 시간 / 헤지 요청 (꼬리 지연 완화)
+CRAWL_TICK_BUDGET = 20  # 크롤링 틱 1회의 전체 시간 예산 (초)
+MIN_REQUEST_BUDGET = 0.5  # 남은 시간이 이보다 적으면 요청하지 않고 late 처리
+HEDGE_REQUESTS = False  # True면 p95 지연을 넘긴 요청에 두 번째 요청을 보냄
+HEDGE_QUANTILE = 0.95
+HEDGE_MIN_SAMPLES = 20  # 이 수 이상의 지연 기록이 쌓여야 헤지 시작
+LATENCY_WINDOW = 200  # 호스트별 지연 기록 개수
+HEDGE_RATE_LIMIT = 0.2  # 호스트별 헤지 요청 허용량 (초당)
+HEDGE_RATE_BURST = 2
+
+# 일괄 조회 항목 상태
+FETCH_OK = "ok"
+FETCH_FAILED = "failed"
+FETCH_LATE = "late"  # 배치 마감 시간 초과
+
+# 이메일 발송 재시도 간격 (초, 모두 실패하면 발송 실패로 처리)
+MAIL_RETRY_DELAYS = [60, 300, 900]
+
+# 지표 엔드포인트 (환경변수에 포트를 지정하면 로컬 /metrics 활성화)
+METRICS_PORT_ENV = "PRICE_ALERT_METRICS_PORT"
+
+# 로깅
+LOG_DIR = "logs"
+LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB마다 회전
+LOG_BACKUP_COUNT = 5
+LOG_JSON_ENV = "PRICE_ALERT_LOG_JSON"  # 1이면 JSON Lines 출력
+LOG_LEVEL_ENV = "PRICE_ALERT_LOG_LEVEL"
+
+# 온디맨드 프로파일링 (환경변수 또는 SIGUSR1로 다음 N틱 프로파일링)
+PROFILE_DIR = "logs/profiles"
+PROFILE_TICKS_ENV = "PRICE_ALERT_PROFILE_TICKS"
+DEFAULT_PROFILE_TICKS = 5
+PROFILE_TOP_ALLOCATIONS = 25
+
+# 원본 응답 기록 디렉터리 (지정 시 모든 요청의 응답을 저장, 오프라인 재생/벤치마크용)
+RECORD_DIR_ENV = "PRICE_ALERT_RECORD_DIR"
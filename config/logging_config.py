@@ -1,16 +1,131 @@
+"""로깅 설정 (QueueHandler/QueueListener 기반 비동기 파이프라인)
+
+- 각 모듈은 logging.getLogger(__name__) 로 기록만 하고
+  파일/콘솔 I/O는 QueueListener 스레드에서 처리한다 (크롤링 스레드 블로킹 없음)
+- 파일은 크기 기준으로 회전한다
+- json_lines=True 이면 JSON Lines로 기록하며, extra로 넘긴
+  tracker/site/url/duration 필드를 그대로 포함한다
+
+    logger.info("가격 조회", extra={"site": site, "url": url, "duration": 0.42})
+"""
+
+import atexit
+import json
 import logging
+import os
+import queue
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+from config.constants import (
+    LOG_DIR,
+    LOG_MAX_BYTES,
+    LOG_BACKUP_COUNT,
+    LOG_JSON_ENV,
+    LOG_LEVEL_ENV,
+)
+
+# JSON Lines에 포함할 구조화 필드
+STRUCTURED_FIELDS = ("tracker", "site", "url", "duration")
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in STRUCTURED_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
 
+def setup_logging(
+    level: Optional[int] = None,
+    json_lines: Optional[bool] = None,
+    log_dir: str = LOG_DIR,
+    max_bytes: int = LOG_MAX_BYTES,
+    backup_count: int = LOG_BACKUP_COUNT,
+) -> QueueListener:
+    """
+    루트 로거에 QueueHandler를 달고 파일/콘솔 출력은 리스너 스레드로 넘긴다
 
-def setup_logging():
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    Args:
+        level: 로그 레벨 (기본: 환경변수 PRICE_ALERT_LOG_LEVEL 또는 INFO)
+        json_lines: JSON Lines 파일 출력 여부 (기본: 환경변수 PRICE_ALERT_LOG_JSON)
+        log_dir: 로그 디렉터리
+        max_bytes: 파일 회전 크기
+        backup_count: 보관할 회전 파일 개수
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.FileHandler("logs/app.log", encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
+    Returns:
+        QueueListener (중복 호출 시 기존 리스너)
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    if level is None:
+        level = getattr(logging, os.environ.get(LOG_LEVEL_ENV, "INFO").upper())
+    if json_lines is None:
+        json_lines = os.environ.get(LOG_JSON_ENV, "") not in ("", "0")
+
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+    text_format = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    if json_lines:
+        file_handler = RotatingFileHandler(
+            Path(log_dir) / "app.jsonl",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(JsonLinesFormatter())
+    else:
+        file_handler = RotatingFileHandler(
+            Path(log_dir) / "app.log",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(text_format)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(text_format)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    _listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """대기 중인 로그를 모두 기록하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
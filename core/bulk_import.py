@@ -0,0 +1,332 @@
+"""관심 상품 일괄 등록 (CSV/JSON)
+
+한 줄에 추적 대상 하나씩 키워드, 사이트, 이메일, 주기를 적는다.
+상품 URL을 직접 주면 검색 없이 그대로 쓰고, 없으면 키워드로 검색해
+키워드 토큰 포함 비율이 임계값 이상인 최상위 후보를 자동 선택한다.
+
+CSV 열: keyword, site(사이트 이름/표시 이름/별칭 | both), email, crawl_interval,
+        notify_interval, product_url(단일 사이트) 또는 <사이트>_url (danawa_url 등)
+JSON: 같은 키를 가진 객체 배열 (product_urls: {site: url} 도 허용)
+
+실행: python -m core.bulk_import watchlist.csv [--dry-run]
+"""
+
+import argparse
+import csv
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.models import Candidate, TrackingState
+from core.normalizer import Normalizer
+from core.rate_limit import HostRateLimiter
+from core.state_store import StateStore
+from scrapers.registry import SITE_REGISTRY
+from config.constants import (
+    CRAWL_INTERVALS,
+    NOTIFY_INTERVALS,
+    DEFAULT_CRAWL_INTERVAL,
+    DEFAULT_NOTIFY_INTERVAL,
+    DEFAULT_CANDIDATE_COUNT,
+    STATE_ACTIVE,
+    BULK_IMPORT_MATCH_THRESHOLD,
+    BULK_IMPORT_WORKERS,
+    BULK_IMPORT_BATCH_SIZE,
+    BULK_SEARCH_RATE_LIMIT,
+    BULK_SEARCH_RATE_BURST,
+)
+
+logger = logging.getLogger(__name__)
+
+# 등록된 모든 사이트를 뜻하는 site 값
+ALL_SITES_ALIASES = ("both", "all", "둘 다", "전체")
+
+# 등록 스레드들이 공유하는 사이트별 검색 요청 제한
+SEARCH_LIMITER = HostRateLimiter(BULK_SEARCH_RATE_LIMIT, BULK_SEARCH_RATE_BURST)
+
+
+@dataclass(slots=True)
+class WatchlistEntry:
+    """일괄 등록 파일의 한 줄"""
+
+    line: int
+    keyword: str
+    sites: List[str]
+    email: str
+    crawl_interval: int
+    notify_interval: int
+    product_urls: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ImportReport:
+    """일괄 등록 결과"""
+
+    imported: List[TrackingState] = field(default_factory=list)
+    unresolved: List[Tuple[WatchlistEntry, str]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    saved: bool = False
+
+    def summary(self) -> str:
+        lines = [
+            f"등록: {len(self.imported)}개, 미해결: {len(self.unresolved)}개, "
+            f"오류: {len(self.errors)}개"
+        ]
+        for entry, reason in self.unresolved:
+            lines.append(f"  {entry.line}행 '{entry.keyword}': {reason}")
+        for error in self.errors:
+            lines.append(f"  {error}")
+        return "\n".join(lines)
+
+
+def _interval(value, choices: list, default: int, name: str) -> int:
+    if value in (None, ""):
+        return default
+    interval = int(value)
+    if interval not in choices:
+        raise ValueError(f"{name}는 {choices} 중 하나여야 합니다: {interval}")
+    return interval
+
+
+def _resolve_sites(site_key: str) -> List[str]:
+    """site 값 → 사이트 이름 목록 (모르는 값이면 빈 목록)"""
+    if site_key in ALL_SITES_ALIASES:
+        return SITE_REGISTRY.sites()
+    site = SITE_REGISTRY.resolve(site_key)
+    return [site] if site else []
+
+
+def _parse_entry(line: int, record: dict) -> WatchlistEntry:
+    """레코드 → WatchlistEntry (형식 오류는 ValueError)"""
+    from notify.emailer import Emailer
+
+    keyword = (record.get("keyword") or "").strip()
+    if not keyword:
+        raise ValueError("keyword가 비어 있습니다")
+
+    site_key = (record.get("site") or "both").strip().lower()
+    sites = _resolve_sites(site_key)
+    if not sites:
+        raise ValueError(f"알 수 없는 site: {site_key}")
+
+    email = (record.get("email") or "").strip()
+    if not Emailer.validate_email(email):
+        raise ValueError(f"유효하지 않은 이메일: {email}")
+
+    product_urls = {
+        site: url.strip()
+        for site, url in (record.get("product_urls") or {}).items()
+        if url and url.strip()
+    }
+    for site in sites:
+        url = (record.get(f"{site}_url") or "").strip()
+        if url:
+            product_urls[site] = url
+    url = (record.get("product_url") or "").strip()
+    if url:
+        if len(sites) != 1:
+            raise ValueError("product_url은 단일 사이트에만 쓸 수 있습니다")
+        product_urls[sites[0]] = url
+
+    return WatchlistEntry(
+        line=line,
+        keyword=keyword,
+        sites=sites,
+        email=email,
+        crawl_interval=_interval(
+            record.get("crawl_interval"),
+            CRAWL_INTERVALS,
+            DEFAULT_CRAWL_INTERVAL,
+            "crawl_interval",
+        ),
+        notify_interval=_interval(
+            record.get("notify_interval"),
+            NOTIFY_INTERVALS,
+            DEFAULT_NOTIFY_INTERVAL,
+            "notify_interval",
+        ),
+        product_urls={
+            site: product_urls[site] for site in sites if site in product_urls
+        },
+    )
+
+
+def read_watchlist(path: str) -> Tuple[List[WatchlistEntry], List[str]]:
+    """
+    CSV/JSON 파일 읽기 (확장자로 판별)
+
+    Returns:
+        (항목 리스트, 행별 오류 메시지 리스트)
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            records = list(enumerate(json.load(f), start=1))
+    else:
+        # 엑셀에서 저장한 CSV의 BOM 허용, 1행은 헤더
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            records = list(enumerate(csv.DictReader(f), start=2))
+
+    entries: List[WatchlistEntry] = []
+    errors: List[str] = []
+    for line, record in records:
+        try:
+            entries.append(_parse_entry(line, record))
+        except (ValueError, TypeError, AttributeError) as e:
+            errors.append(f"{line}행: {e}")
+    return entries, errors
+
+
+def best_candidate(
+    keyword: str, candidates: List[Candidate], threshold: float
+) -> Tuple[Optional[Candidate], float]:
+    """
+    키워드 포함 비율이 가장 높은 후보 (동점이면 검색 순위가 앞선 후보)
+
+    Returns:
+        (임계값 이상이면 후보 아니면 None, 최고 비율)
+    """
+    best, best_score = None, 0.0
+    for candidate in candidates:
+        score = Normalizer.keyword_coverage(keyword, candidate.title)
+        if score > best_score:
+            best, best_score = candidate, score
+    if best_score < threshold:
+        return None, best_score
+    return best, best_score
+
+
+def resolve_entries(
+    entries: List[WatchlistEntry],
+    scrapers: dict,
+    threshold: float = BULK_IMPORT_MATCH_THRESHOLD,
+    workers: int = BULK_IMPORT_WORKERS,
+    batch_size: int = BULK_IMPORT_BATCH_SIZE,
+    limiter: HostRateLimiter = SEARCH_LIMITER,
+) -> Tuple[List[TrackingState], List[Tuple[WatchlistEntry, str]]]:
+    """
+    URL이 없는 (사이트, 키워드)를 병렬 검색해 추적 상태 생성
+
+    같은 (사이트, 키워드)는 한 번만 검색하고, 검색은 batch_size개씩 나눠 제출해
+    진행 로그를 남기며, 모든 스레드가 사이트별 limiter를 공유한다.
+
+    Returns:
+        (추적 상태 리스트, (항목, 사유) 미해결 리스트)
+    """
+    lookups = sorted(
+        {
+            (site, entry.keyword)
+            for entry in entries
+            for site in entry.sites
+            if site not in entry.product_urls and site in scrapers
+        }
+    )
+
+    def search(lookup):
+        site, keyword = lookup
+        limiter.acquire(site)
+        try:
+            candidates = scrapers[site].search(keyword, limit=DEFAULT_CANDIDATE_COUNT)
+        except Exception as e:
+            logger.error("일괄 등록 검색 실패 (%s, %s): %s", site, keyword, e)
+            candidates = []
+        return best_candidate(keyword, candidates, threshold)
+
+    resolved: Dict[Tuple[str, str], Tuple[Optional[Candidate], float]] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import") as pool:
+        for start in range(0, len(lookups), batch_size):
+            batch = lookups[start : start + batch_size]
+            resolved.update(zip(batch, pool.map(search, batch)))
+            logger.info("일괄 등록 검색 %d/%d", start + len(batch), len(lookups))
+
+    states: List[TrackingState] = []
+    unresolved: List[Tuple[WatchlistEntry, str]] = []
+    for entry in entries:
+        selected_products: Dict[str, str] = {}
+        title_signatures: Dict[str, int] = {}
+        reasons = []
+        for site in entry.sites:
+            if site in entry.product_urls:
+                # 상품명 서명은 첫 조회 결과로 채워진다
+                selected_products[site] = entry.product_urls[site]
+                continue
+            if site not in scrapers:
+                reasons.append(f"{site}: 스크래퍼 없음")
+                continue
+            candidate, score = resolved[(site, entry.keyword)]
+            if candidate is None:
+                reasons.append(f"{site}: 일치 후보 없음 (최고 {score:.2f})")
+                continue
+            selected_products[site] = candidate.product_url
+            title_signatures[site] = Normalizer.title_signature(candidate.title)
+
+        if reasons:
+            unresolved.append((entry, ", ".join(reasons)))
+            continue
+
+        states.append(
+            TrackingState(
+                keyword=entry.keyword,
+                selected_sites=list(selected_products),
+                crawl_interval=entry.crawl_interval,
+                notify_interval=entry.notify_interval,
+                email=entry.email,
+                selected_products=selected_products,
+                last_prices={},
+                last_crawl_at=None,
+                last_notify_at=None,
+                status=STATE_ACTIVE,
+                title_signatures=title_signatures,
+            )
+        )
+
+    return states, unresolved
+
+
+def import_watchlist(
+    path: str, store: StateStore, scrapers: dict, dry_run: bool = False, **kwargs
+) -> ImportReport:
+    """
+    파일을 읽어 추적 대상을 만들고 저장소에 한 번에 저장
+
+    (키워드, 이메일)이 같은 기존 추적 대상은 새 항목으로 교체한다.
+    """
+    entries, errors = read_watchlist(path)
+    states, unresolved = resolve_entries(entries, scrapers, **kwargs)
+    report = ImportReport(imported=states, unresolved=unresolved, errors=errors)
+
+    if dry_run or not states:
+        return report
+
+    report.saved = store.merge_many(states)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관심 상품 일괄 등록")
+    parser.add_argument("path", help="CSV 또는 JSON 파일")
+    parser.add_argument("--state", default="data/state.json", help="상태 파일 경로")
+    parser.add_argument("--threshold", type=float, default=BULK_IMPORT_MATCH_THRESHOLD)
+    parser.add_argument("--workers", type=int, default=BULK_IMPORT_WORKERS)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="저장하지 않고 결과만 출력"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    report = import_watchlist(
+        args.path,
+        StateStore(args.state),
+        SITE_REGISTRY.scrapers(),
+        dry_run=args.dry_run,
+        threshold=args.threshold,
+        workers=args.workers,
+    )
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""시계/대기 추상화 (실제 시간 / 가상 시간)
+
+Scheduler는 datetime.now()/time.sleep() 대신 Clock을 사용한다.
+시뮬레이션에서는 VirtualClock을 주입해 일주일치 주기도 즉시 실행한다.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+
+class Clock:
+    """시계 인터페이스"""
+
+    def time(self) -> float:
+        """현재 시각 (epoch 초)"""
+        raise NotImplementedError
+
+    def now(self) -> datetime:
+        """현재 시각 (로컬 datetime)"""
+        return datetime.fromtimestamp(self.time())
+
+    def sleep(self, seconds: float):
+        """대기"""
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """실제 시계"""
+
+    def time(self) -> float:
+        return time.time()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """가상 시계 (sleep은 즉시 반환하고 시각만 진행)"""
+
+    def __init__(self, start: float = 0.0):
+        """
+        Args:
+            start: 시작 시각 (epoch 초, 기본: 현재 시각)
+        """
+        self._now = start or time.time()
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+    def advance(self, seconds: float):
+        """시각 진행"""
+        if seconds > 0:
+            with self._lock:
+                self._now += seconds
+
+    def advance_to(self, timestamp: float):
+        """지정 시각까지 진행 (과거로는 되돌리지 않음)"""
+        with self._lock:
+            self._now = max(self._now, timestamp)
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,299 @@
+"""상태/결과 직렬화 코덱 (json, orjson, msgpack, struct)
+
+- 모든 코덱은 bytes를 입출력한다
+- 로드 시에는 detect_codec()이 선두 바이트로 포맷을 판별한다
+  - JSON(json/orjson): '{' 또는 '[' 로 시작
+  - msgpack: MAGIC_MSGPACK 접두사
+  - struct: MAGIC_STRUCT 접두사
+- msgpack/orjson은 설치된 경우에만 사용 (없으면 stdlib로 대체)
+"""
+
+import json
+import struct
+from typing import Iterable, List, Optional, Type
+
+from core.models import PriceResult, TrackingState
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+
+MAGIC_MSGPACK = b"PAM\x01"
+MAGIC_STRUCT = b"PAS\x01"
+
+# 바이너리 코덱에서는 ISO 문자열 대신 epoch 초를 그대로 저장
+_TIME_FIELDS = ("fetched_at", "last_crawl_at", "last_notify_at")
+
+
+def _record(obj) -> dict:
+    """모델 → 직렬화용 dict (시각 필드는 epoch 초)"""
+    data = obj.to_dict()
+    for key in _TIME_FIELDS:
+        if key in data:
+            data[key] = getattr(obj, key)
+    return data
+
+
+class Codec:
+    """코덱 기본 인터페이스"""
+
+    name = ""
+
+    def encode(self, obj) -> bytes:
+        return self.encode_many([obj])
+
+    def decode(self, raw: bytes, cls: Type):
+        items = self.decode_many(raw, cls)
+        return items[0] if items else None
+
+    def encode_many(self, objs: Iterable) -> bytes:
+        raise NotImplementedError
+
+    def decode_many(self, raw: bytes, cls: Type) -> list:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """stdlib json 코덱 (기존 state.json 포맷 호환)"""
+
+    name = "json"
+
+    def __init__(self, indent: Optional[int] = None):
+        self.indent = indent
+
+    def _dumps(self, data) -> bytes:
+        if self.indent is None:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            )
+        return json.dumps(data, indent=self.indent, ensure_ascii=False).encode("utf-8")
+
+    def encode(self, obj) -> bytes:
+        # 단일 객체는 기존과 동일하게 dict 하나로 저장
+        return self._dumps(obj.to_dict())
+
+    def encode_many(self, objs: Iterable) -> bytes:
+        return self._dumps([obj.to_dict() for obj in objs])
+
+    def decode_many(self, raw: bytes, cls: Type) -> list:
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        if isinstance(data, dict):
+            data = [data]
+        return [cls.from_dict(item) for item in data]
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson 코덱 (출력은 JSON과 동일하게 판별/로드 가능)"""
+
+    name = "orjson"
+
+    def _dumps(self, data) -> bytes:
+        option = orjson.OPT_INDENT_2 if self.indent else 0
+        return orjson.dumps(data, option=option)
+
+
+class MsgpackCodec(Codec):
+    """msgpack 코덱"""
+
+    name = "msgpack"
+
+    def encode(self, obj) -> bytes:
+        return MAGIC_MSGPACK + msgpack.packb(_record(obj), use_bin_type=True)
+
+    def encode_many(self, objs: Iterable) -> bytes:
+        return MAGIC_MSGPACK + msgpack.packb(
+            [_record(obj) for obj in objs], use_bin_type=True
+        )
+
+    def decode_many(self, raw: bytes, cls: Type) -> list:
+        data = msgpack.unpackb(raw[len(MAGIC_MSGPACK) :], raw=False)
+        if isinstance(data, dict):
+            data = [data]
+        return [cls.from_dict(item) for item in data]
+
+
+class StructCodec(Codec):
+    """
+    stdlib struct 코덱 (의존성 없는 바이너리 포맷)
+
+    레코드 = 타입 태그(1B) + 고정 필드(struct) + 길이 접두 UTF-8 문자열
+    TrackingState의 가변 필드(사이트/상품/가격 dict)는 compact JSON으로 넣는다.
+    시각 필드의 None은 -1로 표현한다.
+    """
+
+    name = "struct"
+
+    _TAG_PRICE = 1
+    _TAG_STATE = 2
+
+    _COUNT = struct.Struct("<I")
+    _HEADER = struct.Struct("<BI")  # tag, 레코드 길이
+    _STR_LEN = struct.Struct("<I")
+    _PRICE_FIXED = struct.Struct("<qq")  # price, fetched_at
+    # crawl, notify, last_crawl, last_notify, backoff
+    _STATE_FIXED = struct.Struct("<IIqqI")
+
+    @classmethod
+    def _pack_str(cls, value: str) -> bytes:
+        data = value.encode("utf-8")
+        return cls._STR_LEN.pack(len(data)) + data
+
+    @classmethod
+    def _unpack_strs(cls, buf: memoryview, offset: int, count: int):
+        values = []
+        for _ in range(count):
+            (length,) = cls._STR_LEN.unpack_from(buf, offset)
+            offset += cls._STR_LEN.size
+            values.append(bytes(buf[offset : offset + length]).decode("utf-8"))
+            offset += length
+        return values, offset
+
+    def _pack_one(self, obj) -> bytes:
+        if isinstance(obj, PriceResult):
+            tag = self._TAG_PRICE
+            body = self._PRICE_FIXED.pack(obj.price, obj.fetched_at) + b"".join(
+                self._pack_str(v) for v in (obj.site, obj.title, obj.product_url)
+            )
+        elif isinstance(obj, TrackingState):
+            tag = self._TAG_STATE
+            variable = json.dumps(
+                {
+                    "selected_sites": obj.selected_sites,
+                    "selected_products": obj.selected_products,
+                    "last_prices": obj.last_prices,
+                    "title_signatures": {
+                        s: format(sig, "x") for s, sig in obj.title_signatures.items()
+                    },
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            body = self._STATE_FIXED.pack(
+                obj.crawl_interval,
+                obj.notify_interval,
+                -1 if obj.last_crawl_at is None else obj.last_crawl_at,
+                -1 if obj.last_notify_at is None else obj.last_notify_at,
+                obj.backoff_count,
+            ) + b"".join(
+                self._pack_str(v)
+                for v in (obj.keyword, obj.email, obj.status, variable)
+            )
+        else:
+            raise TypeError(f"struct 코덱이 지원하지 않는 타입: {type(obj).__name__}")
+        return self._HEADER.pack(tag, len(body)) + body
+
+    def _unpack_one(self, tag: int, buf: memoryview):
+        if tag == self._TAG_PRICE:
+            price, fetched_at = self._PRICE_FIXED.unpack_from(buf, 0)
+            (site, title, url), _ = self._unpack_strs(buf, self._PRICE_FIXED.size, 3)
+            return PriceResult(
+                site=site,
+                title=title,
+                price=price,
+                product_url=url,
+                fetched_at=fetched_at,
+            )
+
+        crawl, notify, last_crawl, last_notify, backoff = self._STATE_FIXED.unpack_from(
+            buf, 0
+        )
+        (keyword, email, status, variable), _ = self._unpack_strs(
+            buf, self._STATE_FIXED.size, 4
+        )
+        extra = json.loads(variable)
+        return TrackingState(
+            keyword=keyword,
+            selected_sites=extra["selected_sites"],
+            crawl_interval=crawl,
+            notify_interval=notify,
+            email=email,
+            selected_products=extra["selected_products"],
+            last_prices=extra["last_prices"],
+            last_crawl_at=None if last_crawl < 0 else last_crawl,
+            last_notify_at=None if last_notify < 0 else last_notify,
+            status=status,
+            backoff_count=backoff,
+            title_signatures=extra.get("title_signatures", {}),
+        )
+
+    def encode_many(self, objs: Iterable) -> bytes:
+        records = [self._pack_one(obj) for obj in objs]
+        return MAGIC_STRUCT + self._COUNT.pack(len(records)) + b"".join(records)
+
+    def decode_many(self, raw: bytes, cls: Type) -> list:
+        buf = memoryview(raw)
+        offset = len(MAGIC_STRUCT)
+        (count,) = self._COUNT.unpack_from(buf, offset)
+        offset += self._COUNT.size
+
+        items = []
+        for _ in range(count):
+            tag, length = self._HEADER.unpack_from(buf, offset)
+            offset += self._HEADER.size
+            items.append(self._unpack_one(tag, buf[offset : offset + length]))
+            offset += length
+        return items
+
+
+def available_codecs() -> List[str]:
+    """현재 환경에서 사용 가능한 코덱 이름"""
+    names = ["json", "struct"]
+    if orjson:
+        names.append("orjson")
+    if msgpack:
+        names.append("msgpack")
+    return names
+
+
+def get_codec(name: str, **kwargs) -> Codec:
+    """
+    이름으로 코덱 생성
+
+    - "fast": msgpack > orjson > struct 순으로 설치된 것 선택
+    """
+    if name == "fast":
+        name = "msgpack" if msgpack else ("orjson" if orjson else "struct")
+
+    if name == "json":
+        return JsonCodec(**kwargs)
+    if name == "orjson":
+        if not orjson:
+            raise ValueError("orjson이 설치되어 있지 않습니다.")
+        return OrjsonCodec(**kwargs)
+    if name == "msgpack":
+        if not msgpack:
+            raise ValueError("msgpack이 설치되어 있지 않습니다.")
+        return MsgpackCodec()
+    if name == "struct":
+        return StructCodec()
+    raise ValueError(f"알 수 없는 코덱: {name}")
+
+
+def detect_codec(raw: bytes) -> Codec:
+    """선두 바이트로 포맷 판별"""
+    if raw.startswith(MAGIC_STRUCT):
+        return StructCodec()
+    if raw.startswith(MAGIC_MSGPACK):
+        if not msgpack:
+            raise ValueError("msgpack 포맷이지만 msgpack이 설치되어 있지 않습니다.")
+        return MsgpackCodec()
+    if raw.lstrip()[:1] in (b"{", b"["):
+        return JsonCodec()
+    raise ValueError("알 수 없는 직렬화 포맷")
+
+
+def loads(raw: bytes, cls: Type):
+    """포맷 자동 판별 후 단일 객체 로드"""
+    return detect_codec(raw).decode(raw, cls)
+
+
+def loads_many(raw: bytes, cls: Type) -> list:
+    """포맷 자동 판별 후 객체 리스트 로드"""
+    return detect_codec(raw).decode_many(raw, cls)
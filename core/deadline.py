@@ -0,0 +1,61 @@
+"""마감 시간(budget) 전파
+
+배치(틱) 단위로 시간 예산을 정하고, 그 안의 요청은 남은 시간만큼만 기다린다.
+현재 마감 시간은 스레드 로컬로 전달되므로 스크래퍼 시그니처를 바꾸지 않아도 된다.
+
+    with deadline_scope(Deadline(30)):
+        scraper.fetch(url)  # 요청 타임아웃 = min(REQUEST_TIMEOUT, 남은 시간)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+_local = threading.local()
+
+
+class Deadline:
+    """단조 시계 기준 마감 시각"""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, budget: float):
+        """
+        Args:
+            budget: 지금부터 주어진 시간 (초)
+        """
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 음수 없음)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def earliest(self, other: Optional["Deadline"]) -> "Deadline":
+        """둘 중 먼저 끝나는 마감 시간"""
+        if other is None or self.expires_at <= other.expires_at:
+            return self
+        return other
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 스레드의 마감 시간 (없으면 None)"""
+    return getattr(_local, "deadline", None)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]):
+    """
+    마감 시간 적용 범위 (중첩 시 더 이른 마감 시간이 우선)
+
+    다른 스레드로 작업을 넘길 때는 그 스레드에서 다시 deadline_scope를 연다.
+    """
+    previous = current_deadline()
+    _local.deadline = deadline.earliest(previous) if deadline else previous
+    try:
+        yield _local.deadline
+    finally:
+        _local.deadline = previous
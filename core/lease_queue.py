@@ -0,0 +1,286 @@
+"""SQLite 기반 추적 대상 임대 큐 (다중 프로세스/호스트 작업자용)
+
+추적 대상마다 다음 실행 시각(due_at = min(다음 크롤링, 다음 알림)), 다음 크롤링
+시각(crawl_at)과 임대 정보를 한 행에 둔다.
+작업자는 실행 시각이 된 행을 임대하고, 주기적으로 heartbeat를 보내
+임대를 연장한다. 작업자가 죽으면 임대가 만료되어 다른 작업자가 가져간다.
+
+- 임대/완료는 BEGIN IMMEDIATE 트랜잭션으로 처리해 두 작업자가 같은 행을 잡지 않는다
+- 저장/완료는 임대 소유자가 일치할 때만 반영 (임대를 잃은 작업자의 늦은 쓰기 차단)
+- 살아 있는 작업자끼리는 같은 대상을 동시에 크롤링하지 않는다. 작업자가 크롤링 도중
+  죽으면 그 결과는 기록되지 않았으므로 임대 만료 후 다른 작업자가 다시 크롤링한다
+- 상태는 코덱으로 직렬화한 bytes로 보관 (기본 struct: 표준 라이브러리만 사용)
+- 여러 호스트가 공유 파일시스템으로 쓸 수 있도록 WAL 대신 기본 저널 모드를 쓰며,
+  호스트 간 시계 차이는 임대 시간보다 충분히 작아야 한다
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.codec import Codec, get_codec, loads
+from core.models import TrackingState
+from config.constants import LEASE_DB_PATH, LEASE_SECONDS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trackers (
+    id TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    due_at REAL NOT NULL,
+    crawl_at REAL NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL NOT NULL DEFAULT 0,
+    crawls INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS trackers_due ON trackers (due_at);
+"""
+
+
+def tracker_key(state: TrackingState) -> str:
+    """추적 대상 식별자 (이메일 + 키워드)"""
+    raw = f"{state.email}\0{state.keyword}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+class LeaseQueue:
+    """추적 대상 실행 시각/임대 큐"""
+
+    def __init__(self, db_path: str = LEASE_DB_PATH, codec: Optional[Codec] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (작업자 간 공유)
+            codec: 상태 직렬화 코덱 (기본: struct)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or get_codec("struct")
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """이전 버전 DB에 없는 열 추가 (crawl_at 0: 다음 실행에서 바로 크롤링)"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(trackers)")}
+        if "crawl_at" not in columns:
+            self._conn.execute(
+                "ALTER TABLE trackers ADD COLUMN crawl_at REAL NOT NULL DEFAULT 0"
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (임대 경쟁 방지)"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    # === 코디네이터 ===
+
+    def add(
+        self, states: Iterable[TrackingState], due_at: Optional[float] = None
+    ) -> int:
+        """
+        새 추적 대상 등록 (이미 있는 대상은 그대로 둠, 첫 실행에서 바로 크롤링)
+
+        Returns:
+            새로 등록된 개수
+        """
+        due_at = time.time() if due_at is None else due_at
+        rows = [(tracker_key(s), self.codec.encode(s), due_at) for s in states]
+        with self._lock, self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT INTO trackers (id, payload, due_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO NOTHING",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def sync(self, states: Iterable[TrackingState]) -> Tuple[int, int]:
+        """
+        상태 파일의 추적 대상을 큐에 반영
+
+        새 대상은 바로 실행하도록 등록하고, 이미 있는 대상은 설정(이메일, 주기,
+        선택 상품 등)만 파일 값으로 바꾼다. 가격/시각/상태는 큐 값을 유지한다.
+
+        Returns:
+            (추가된 개수, 설정이 바뀐 개수)
+        """
+        now = time.time()
+        added = updated = 0
+        with self._lock, self._transaction() as conn:
+            for state in states:
+                tracker_id = tracker_key(state)
+                row = conn.execute(
+                    "SELECT payload FROM trackers WHERE id = ?", (tracker_id,)
+                ).fetchone()
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO trackers (id, payload, due_at) VALUES (?, ?, ?)",
+                        (tracker_id, self.codec.encode(state), now),
+                    )
+                    added += 1
+                    continue
+                current = loads(row[0], TrackingState)
+                state.copy_runtime(current)
+                if state != current:
+                    conn.execute(
+                        "UPDATE trackers SET payload = ? WHERE id = ?",
+                        (self.codec.encode(state), tracker_id),
+                    )
+                    updated += 1
+        return added, updated
+
+    def states(self) -> List[TrackingState]:
+        """모든 추적 대상의 최신 상태"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM trackers ORDER BY id"
+            ).fetchall()
+        return [loads(payload, TrackingState) for (payload,) in rows]
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, int]:
+        """전체/실행 대기/임대 중 개수와 누적 처리 횟수"""
+        now = time.time() if now is None else now
+        with self._lock:
+            total, due, leased, crawls = self._conn.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(due_at <= ?), 0), "
+                "COALESCE(SUM(lease_owner IS NOT NULL AND lease_expires >= ?), 0), "
+                "COALESCE(SUM(crawls), 0) FROM trackers",
+                (now, now),
+            ).fetchone()
+        return {"total": total, "due": due, "leased": leased, "crawls": crawls}
+
+    # === 작업자 ===
+
+    def lease(
+        self,
+        owner: str,
+        limit: int,
+        lease_seconds: float = LEASE_SECONDS,
+        now: Optional[float] = None,
+    ) -> List[Tuple[str, TrackingState, float]]:
+        """
+        실행 시각이 된 추적 대상을 최대 limit개 임대
+
+        임대가 없거나 만료된 행만 가져가므로 죽은 작업자의 대상도 여기서 회수된다.
+
+        Returns:
+            (추적 대상 id, 상태, 다음 크롤링 시각) 목록
+        """
+        if limit <= 0:
+            return []
+        now = time.time() if now is None else now
+        with self._lock, self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, payload, crawl_at FROM trackers "
+                "WHERE due_at <= ? AND (lease_owner IS NULL OR lease_expires < ?) "
+                "ORDER BY due_at LIMIT ?",
+                (now, now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE trackers SET lease_owner = ?, lease_expires = ? WHERE id = ?",
+                [(owner, now + lease_seconds, tracker_id) for tracker_id, _, _ in rows],
+            )
+        return [
+            (tracker_id, loads(payload, TrackingState), crawl_at)
+            for tracker_id, payload, crawl_at in rows
+        ]
+
+    def heartbeat(
+        self,
+        owner: str,
+        tracker_ids: Iterable[str],
+        lease_seconds: float = LEASE_SECONDS,
+        now: Optional[float] = None,
+    ) -> List[str]:
+        """
+        임대 연장 (만료되기 전인 것만)
+
+        Returns:
+            아직 소유 중인 추적 대상 id
+        """
+        tracker_ids = list(tracker_ids)
+        if not tracker_ids:
+            return []
+        now = time.time() if now is None else now
+        owned = []
+        with self._lock, self._transaction() as conn:
+            for tracker_id in tracker_ids:
+                cursor = conn.execute(
+                    "UPDATE trackers SET lease_expires = ? "
+                    "WHERE id = ? AND lease_owner = ? AND lease_expires >= ?",
+                    (now + lease_seconds, tracker_id, owner, now),
+                )
+                if cursor.rowcount:
+                    owned.append(tracker_id)
+        return owned
+
+    def save(
+        self,
+        owner: str,
+        tracker_id: str,
+        state: TrackingState,
+        now: Optional[float] = None,
+    ) -> bool:
+        """처리 중 상태 저장 (임대 소유자만)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE trackers SET payload = ? "
+                "WHERE id = ? AND lease_owner = ? AND lease_expires >= ?",
+                (self.codec.encode(state), tracker_id, owner, now),
+            )
+        return cursor.rowcount == 1
+
+    def complete(
+        self,
+        owner: str,
+        tracker_id: str,
+        state: TrackingState,
+        due_at: float,
+        crawl_at: float,
+    ) -> bool:
+        """
+        처리 완료: 상태와 다음 실행/크롤링 시각 기록 후 임대 해제
+
+        Returns:
+            임대를 잃어 반영되지 않았으면 False
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE trackers SET payload = ?, due_at = ?, crawl_at = ?, "
+                "lease_owner = NULL, lease_expires = 0, crawls = crawls + 1 "
+                "WHERE id = ? AND lease_owner = ?",
+                (self.codec.encode(state), due_at, crawl_at, tracker_id, owner),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, owner: str) -> int:
+        """작업자 종료 시 남은 임대 반납 (즉시 다른 작업자가 가져갈 수 있음)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE trackers SET lease_owner = NULL, lease_expires = 0 "
+                "WHERE lease_owner = ?",
+                (owner,),
+            )
+        return cursor.rowcount
@@ -0,0 +1,221 @@
+"""사이트 간 상품 매칭 인덱스 (토큰 역색인 + MinHash/LSH)
+
+다나와 상품과 동일한 지마켓 상품처럼, 한 사이트의 상품명에 대응하는
+다른 사이트 상품을 전체 쌍 비교(O(n·m)) 없이 찾는다.
+
+1. LSH: MinHash 서명을 밴드로 나눠 버킷에 넣고, 같은 버킷 항목만 후보로 본다
+2. 역색인: 드문 토큰의 포스팅 리스트로 LSH가 놓친 후보를 보충한다
+3. 최종 순위는 후보에 대해서만 정확한 Jaccard 유사도로 매긴다
+"""
+
+import random
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.models import Candidate
+from core.normalizer import Normalizer, token_hash
+from config.constants import (
+    MINHASH_PERMUTATIONS,
+    MINHASH_BANDS,
+    TOKEN_MISMATCH_THRESHOLD,
+)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# 역색인 보충 시 참조할 드문 토큰 수
+_RARE_TOKEN_COUNT = 3
+
+
+class _Entry:
+    __slots__ = ("item_id", "site", "tokens", "signature", "payload")
+
+    def __init__(self, item_id, site, tokens, signature, payload):
+        self.item_id = item_id
+        self.site = site
+        self.tokens = tokens
+        self.signature = signature
+        self.payload = payload
+
+
+class ProductMatcher:
+    """상품명 매칭 인덱스"""
+
+    def __init__(
+        self,
+        num_perm: int = MINHASH_PERMUTATIONS,
+        bands: int = MINHASH_BANDS,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            num_perm: MinHash 순열 개수
+            bands: LSH 밴드 수 (num_perm의 약수)
+            seed: 순열 계수 시드 (인덱스 간 서명 호환을 위해 고정)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self._entries: Dict[Any, _Entry] = {}
+        self._buckets: List[Dict[tuple, set]] = [defaultdict(set) for _ in range(bands)]
+        self._postings: Dict[str, set] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """토큰 집합의 MinHash 서명"""
+        hashes = [token_hash(t) for t in tokens]
+        if not hashes:
+            return ()
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows : (band + 1) * rows]
+
+    def add(self, item_id, site: str, title: str, payload=None):
+        """
+        항목 추가 (같은 item_id가 있으면 교체)
+
+        Args:
+            item_id: 고유 키 (보통 상품 URL)
+            site: 사이트 이름
+            title: 상품명
+            payload: 매칭 결과로 돌려줄 객체 (기본: item_id)
+        """
+        if item_id in self._entries:
+            self.remove(item_id)
+
+        tokens = Normalizer.token_set(title)
+        if not tokens:
+            return
+
+        signature = self.signature(tokens)
+        entry = _Entry(
+            item_id, site, tokens, signature, item_id if payload is None else payload
+        )
+        self._entries[item_id] = entry
+
+        for band, key in self._band_keys(signature):
+            self._buckets[band][key].add(item_id)
+        for token in tokens:
+            self._postings[token].add(item_id)
+
+    def add_candidates(self, candidates: Iterable[Candidate]):
+        """검색 후보 일괄 추가 (키: product_url)"""
+        for candidate in candidates:
+            self.add(candidate.product_url, candidate.site, candidate.title, candidate)
+
+    def remove(self, item_id):
+        """항목 제거"""
+        entry = self._entries.pop(item_id, None)
+        if not entry:
+            return
+
+        for band, key in self._band_keys(entry.signature):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del self._buckets[band][key]
+        for token in entry.tokens:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(item_id)
+                if not posting:
+                    del self._postings[token]
+
+    def _candidate_ids(self, tokens, signature, site, exclude_site) -> set:
+        def accept(item_id) -> bool:
+            entry_site = self._entries[item_id].site
+            if site and entry_site != site:
+                return False
+            return not (exclude_site and entry_site == exclude_site)
+
+        ids = set()
+        for band, key in self._band_keys(signature):
+            ids |= self._buckets[band].get(key, set())
+        ids = {item_id for item_id in ids if accept(item_id)}
+
+        # 드문 토큰(모델명 등)의 포스팅으로 LSH가 놓친 후보 보충
+        postings = sorted(
+            (self._postings[t] for t in tokens if t in self._postings), key=len
+        )
+        used = 0
+        for posting in postings:
+            accepted = {item_id for item_id in posting if accept(item_id)}
+            if accepted:
+                ids |= accepted
+                used += 1
+                if used >= _RARE_TOKEN_COUNT:
+                    break
+        return ids
+
+    def query(
+        self,
+        title: str,
+        site: Optional[str] = None,
+        exclude_site: Optional[str] = None,
+        top_k: int = 1,
+        min_similarity: float = 1 - TOKEN_MISMATCH_THRESHOLD,
+    ) -> List[Tuple[float, Any]]:
+        """
+        상품명과 유사한 항목 검색
+
+        Args:
+            title: 기준 상품명
+            site: 이 사이트 항목만 대상
+            exclude_site: 이 사이트 항목은 제외 (다른 사이트 매칭용)
+            top_k: 최대 반환 개수
+            min_similarity: 최소 Jaccard 유사도
+
+        Returns:
+            (유사도, payload) 리스트 (유사도 내림차순)
+        """
+        tokens = Normalizer.token_set(title)
+        if not tokens or not self._entries:
+            return []
+
+        signature = self.signature(tokens)
+        scored = []
+        for item_id in self._candidate_ids(tokens, signature, site, exclude_site):
+            entry = self._entries[item_id]
+            intersection = len(tokens & entry.tokens)
+            score = intersection / (len(tokens) + len(entry.tokens) - intersection)
+            if score >= min_similarity:
+                scored.append((score, entry.payload))
+
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return scored[:top_k]
+
+    def best_match(
+        self,
+        title: str,
+        site: Optional[str] = None,
+        exclude_site: Optional[str] = None,
+        min_similarity: float = 1 - TOKEN_MISMATCH_THRESHOLD,
+    ) -> Optional[Tuple[float, Any]]:
+        """가장 유사한 항목 하나 (없으면 None)"""
+        matches = self.query(
+            title,
+            site=site,
+            exclude_site=exclude_site,
+            top_k=1,
+            min_similarity=min_similarity,
+        )
+        return matches[0] if matches else None
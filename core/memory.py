@@ -0,0 +1,99 @@
+"""작업자 메모리 수위 측정 (RSS/tracemalloc)
+
+오래 실행되는 작업자는 큰 페이지를 파싱하며 메모리 단편화가 쌓일 수 있으므로
+현재/최고 RSS와 (켜져 있으면) tracemalloc 추적량을 작업자별로 기록한다.
+tracemalloc은 할당마다 비용이 들어 환경변수로 켤 때만 사용한다.
+"""
+
+import os
+import sys
+import tracemalloc
+from typing import Optional
+
+from core.metrics import MEMORY_BYTES
+from config.constants import MEMORY_TRACE_ENV
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes() -> Optional[int]:
+    """
+    현재 프로세스 RSS (바이트)
+
+    Linux는 /proc/self/statm의 현재 값, 그 밖의 POSIX는 getrusage의 최고 값,
+    둘 다 없으면 None.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux/BSD는 KiB
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def trace_enabled() -> bool:
+    return os.environ.get(MEMORY_TRACE_ENV) == "1"
+
+
+class MemoryWatermark:
+    """작업자 1개의 메모리 수위 (현재/최고 RSS, tracemalloc 현재/최고)"""
+
+    def __init__(self, worker: str, trace: Optional[bool] = None):
+        """
+        Args:
+            worker: 지표 레이블 (작업자 이름)
+            trace: tracemalloc 사용 여부 (기본: 환경변수 PRICE_ALERT_TRACE_MEMORY=1)
+        """
+        self.worker = worker
+        self.rss = 0
+        self.rss_peak = 0
+        self.traced = 0
+        self.traced_peak = 0
+
+        trace = trace_enabled() if trace is None else trace
+        self._started_trace = trace and not tracemalloc.is_tracing()
+        if self._started_trace:
+            tracemalloc.start()
+
+    def sample(self) -> int:
+        """
+        현재 수위를 측정해 지표에 기록
+
+        Returns:
+            현재 RSS (바이트, 측정할 수 없으면 0)
+        """
+        self.rss = rss_bytes() or 0
+        self.rss_peak = max(self.rss_peak, self.rss)
+        MEMORY_BYTES.set(self.rss, worker=self.worker, kind="rss")
+        MEMORY_BYTES.set(self.rss_peak, worker=self.worker, kind="rss_peak")
+
+        if tracemalloc.is_tracing():
+            self.traced, peak = tracemalloc.get_traced_memory()
+            self.traced_peak = max(self.traced_peak, peak)
+            MEMORY_BYTES.set(self.traced, worker=self.worker, kind="traced")
+            MEMORY_BYTES.set(self.traced_peak, worker=self.worker, kind="traced_peak")
+        return self.rss
+
+    def summary(self) -> str:
+        text = f"RSS {self.rss / 2**20:.1f}MiB (최고 {self.rss_peak / 2**20:.1f}MiB)"
+        if self.traced_peak:
+            text += (
+                f", 추적 {self.traced / 2**20:.1f}MiB "
+                f"(최고 {self.traced_peak / 2**20:.1f}MiB)"
+            )
+        return text
+
+    def close(self):
+        """직접 시작한 tracemalloc 중지"""
+        if self._started_trace and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_trace = False
@@ -0,0 +1,294 @@
+"""크롤링 지표 수집 (카운터/게이지/지연 히스토그램) 및 /metrics 엔드포인트
+
+Prometheus 텍스트 포맷으로 노출하지만 외부 라이브러리는 사용하지 않는다.
+기록 비용은 잠금 1회 + dict 조회 수준이며, 오버헤드는
+benchmarks/bench_metrics_overhead.py 로 측정한다.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 지연 버킷 (초) - 요청 타임아웃(15초)까지 커버
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 30)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{v}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+    def _samples(self):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+
+
+class Gauge(_Metric):
+    """현재 값 (메모리 사용량 등)"""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+
+
+class Histogram(_Metric):
+    """지연 히스토그램 (버킷별 카운트 + 합계)"""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [버킷별 카운트..., +Inf 카운트, 합계]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * (len(self.buckets) + 2)
+            row[index] += 1
+            row[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        row = self._values.get(self._key(labels))
+        return sum(row[:-1]) if row else 0
+
+    def _samples(self):
+        with self._lock:
+            items = [(key, list(row)) for key, row in self._values.items()]
+        for key, row in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, row):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            cumulative += row[len(self.buckets)]
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+            base = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{base} {row[-1]}"
+            yield f"{self.name}_count{base} {cumulative}"
+
+
+class MetricsRegistry:
+    """지표 등록소"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(m.render() for m in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# === 공용 지표 ===
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "price_alert_http_requests_total", "HTTP 요청 수", ("site", "outcome")
+)
+HTTP_SECONDS = REGISTRY.histogram(
+    "price_alert_http_request_seconds", "HTTP 요청 지연", ("site", "outcome")
+)
+HTTP_BYTES = REGISTRY.counter(
+    "price_alert_http_response_bytes_total", "HTTP 응답 바이트", ("site",)
+)
+HTTP_HEDGES = REGISTRY.counter(
+    "price_alert_http_hedges_total",
+    "헤지 요청 수 (sent | won | limited)",
+    ("site", "outcome"),
+)
+PARSE_SECONDS = REGISTRY.histogram(
+    "price_alert_parse_seconds", "HTML 파싱(DOM 생성) 시간", ("site",)
+)
+PARSE_SHORTCUTS = REGISTRY.counter(
+    "price_alert_parse_shortcut_total",
+    "가격 영역 해시 비교 결과 (hit: 파싱 생략 | miss | unavailable)",
+    ("site", "outcome"),
+)
+PREFETCH_LOOKUPS = REGISTRY.counter(
+    "price_alert_prefetch_lookups_total",
+    "선행 조회 캐시 조회 결과 (hit | miss | pending | failed)",
+    ("site", "outcome"),
+)
+SCRAPE_SECONDS = REGISTRY.histogram(
+    "price_alert_scrape_seconds",
+    "search/fetch 전체 시간 (요청+파싱+추출)",
+    ("site", "op", "outcome"),
+)
+TICK_SECONDS = REGISTRY.histogram(
+    "price_alert_scheduler_tick_seconds", "스케줄러 틱 시간", ("tick", "outcome")
+)
+PIPELINE_STAGE_SECONDS = REGISTRY.histogram(
+    "price_alert_pipeline_stage_seconds", "파이프라인 단계별 처리 시간", ("stage",)
+)
+PIPELINE_BLOCKED = REGISTRY.counter(
+    "price_alert_pipeline_blocked_total",
+    "다음 단계 큐가 가득 차 대기한 횟수 (backpressure)",
+    ("stage",),
+)
+MEMORY_BYTES = REGISTRY.gauge(
+    "price_alert_memory_bytes",
+    "작업자 메모리 수위 (rss | rss_peak | traced | traced_peak)",
+    ("worker", "kind"),
+)
+WORKER_RECYCLES = REGISTRY.counter(
+    "price_alert_worker_recycles_total",
+    "메모리/처리 수 한도로 재시작한 작업자 수 (memory | tasks)",
+    ("reason",),
+)
+EMAIL_SENDS = REGISTRY.counter(
+    "price_alert_email_sends_total", "이메일 발송 수", ("domain", "outcome")
+)
+EMAIL_DEFERRALS = REGISTRY.counter(
+    "price_alert_email_deferrals_total",
+    "이메일 지연 발송 수 (quota: 계정 한도 초과 | retry: 실패 후 재시도)",
+    ("domain", "reason"),
+)
+EMAIL_SECONDS = REGISTRY.histogram(
+    "price_alert_email_send_seconds", "이메일 발송 시간", ("domain", "outcome")
+)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프 요청마다 stderr 출력하지 않음
+        pass
+
+
+def start_metrics_server(
+    port: int, host: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None
+) -> ThreadingHTTPServer:
+    """
+    로컬 /metrics 엔드포인트 시작 (데몬 스레드)
+
+    Returns:
+        서버 객체 (shutdown()으로 중지)
+    """
+    handler = type(
+        "MetricsHandler", (_MetricsHandler,), {"registry": registry or REGISTRY}
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info(
+        "지표 엔드포인트 시작: http://%s:%s/metrics", host, server.server_address[1]
+    )
+    return server
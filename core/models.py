@@ -1,11 +1,40 @@
 """데이터 모델 정의"""
 
-from dataclasses import dataclass
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple, Union
 
 
-@dataclass
+def now_epoch() -> int:
+    """현재 시각 (epoch 초)"""
+    return int(time.time())
+
+
+def to_epoch(value: Union[int, float, str, None]) -> Optional[int]:
+    """ISO 8601 문자열 또는 epoch 값을 epoch 초로 변환 (기존 JSON 호환)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(datetime.fromisoformat(value).timestamp())
+
+
+def to_iso(value: Optional[int]) -> Optional[str]:
+    """epoch 초를 ISO 8601 문자열(로컬 시각)로 변환"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value).isoformat()
+
+
+def _intern(value: str) -> str:
+    """사이트명 등 반복되는 짧은 문자열 intern"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
 class Candidate:
     """검색 후보 상품"""
 
@@ -14,6 +43,9 @@ class Candidate:
     price: Optional[int]  # 가격 없을 수도 있음
     product_url: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "site", _intern(self.site))
+
     def to_dict(self):
         return {
             "site": self.site,
@@ -23,7 +55,7 @@ class Candidate:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PriceResult:
     """가격 조회 결과"""
 
@@ -31,7 +63,15 @@ class PriceResult:
     title: str
     price: int
     product_url: str
-    fetched_at: str  # ISO 8601 형식
+    fetched_at: int  # epoch 초 (JSON에는 ISO 8601로 저장)
+
+    def __post_init__(self):
+        object.__setattr__(self, "site", _intern(self.site))
+        object.__setattr__(self, "fetched_at", to_epoch(self.fetched_at))
+
+    @property
+    def fetched_at_iso(self) -> str:
+        return to_iso(self.fetched_at)
 
     def to_dict(self):
         return {
@@ -39,7 +79,7 @@ class PriceResult:
             "title": self.title,
             "price": self.price,
             "product_url": self.product_url,
-            "fetched_at": self.fetched_at,
+            "fetched_at": self.fetched_at_iso,
         }
 
     @classmethod
@@ -47,7 +87,17 @@ class PriceResult:
         return cls(**data)
 
 
-@dataclass
+# 크롤링/알림 결과로 바뀌는 필드 (나머지는 사용자가 정한 설정)
+RUNTIME_FIELDS = (
+    "last_prices",
+    "last_crawl_at",
+    "last_notify_at",
+    "status",
+    "backoff_count",
+)
+
+
+@dataclass(slots=True)
 class TrackingState:
     """추적 상태 (최소 상태만 저장)"""
 
@@ -62,12 +112,28 @@ class TrackingState:
 
     # 최소 상태
     last_prices: dict  # {site: price}
-    last_crawl_at: Optional[str]  # ISO 8601
-    last_notify_at: Optional[str]  # ISO 8601
+    last_crawl_at: Optional[int]  # epoch 초 (JSON에는 ISO 8601로 저장)
+    last_notify_at: Optional[int]  # epoch 초 (JSON에는 ISO 8601로 저장)
 
     status: str  # active | not_found | needs_confirmation | blocked_suspected
     backoff_count: int = 0  # 재시도 카운트
 
+    # 사이트별 최초 선택 상품명의 토큰 서명 (상품명 변경 감지용)
+    title_signatures: dict = field(default_factory=dict)  # {site: int}
+
+    def __post_init__(self):
+        self.selected_sites = [_intern(s) for s in self.selected_sites]
+        self.selected_products = {
+            _intern(s): url for s, url in self.selected_products.items()
+        }
+        self.last_prices = {_intern(s): p for s, p in self.last_prices.items()}
+        self.last_crawl_at = to_epoch(self.last_crawl_at)
+        self.last_notify_at = to_epoch(self.last_notify_at)
+        self.title_signatures = {
+            _intern(s): int(sig, 16) if isinstance(sig, str) else sig
+            for s, sig in self.title_signatures.items()
+        }
+
     def to_dict(self):
         return {
             "keyword": self.keyword,
@@ -77,24 +143,28 @@ class TrackingState:
             "email": self.email,
             "selected_products": self.selected_products,
             "last_prices": self.last_prices,
-            "last_crawl_at": self.last_crawl_at,
-            "last_notify_at": self.last_notify_at,
+            "last_crawl_at": to_iso(self.last_crawl_at),
+            "last_notify_at": to_iso(self.last_notify_at),
             "status": self.status,
             "backoff_count": self.backoff_count,
+            # 128비트 서명은 JSON/msgpack 정수 범위를 넘으므로 16진수 문자열로 저장
+            "title_signatures": {
+                s: format(sig, "x") for s, sig in self.title_signatures.items()
+            },
         }
 
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
 
-    def update_price(self, site: str, price: int):
-        """가격 업데이트"""
-        self.last_prices[site] = price
-        self.last_crawl_at = datetime.now().isoformat()
+    def update_price(self, site: str, price: int, at: Optional[int] = None):
+        """가격 업데이트 (at: epoch 초, 기본 현재 시각)"""
+        self.last_prices[_intern(site)] = price
+        self.last_crawl_at = now_epoch() if at is None else at
 
-    def update_notify(self):
-        """알림 시각 업데이트"""
-        self.last_notify_at = datetime.now().isoformat()
+    def update_notify(self, at: Optional[int] = None):
+        """알림 시각 업데이트 (at: epoch 초, 기본 현재 시각)"""
+        self.last_notify_at = now_epoch() if at is None else at
 
     def reset_backoff(self):
         """백오프 카운트 초기화"""
@@ -103,3 +173,95 @@ class TrackingState:
     def increment_backoff(self):
         """백오프 카운트 증가"""
         self.backoff_count += 1
+
+    def copy_runtime(self, other: "TrackingState"):
+        """other의 크롤링/알림 결과(RUNTIME_FIELDS)만 가져오기 (설정은 유지)"""
+        for name in RUNTIME_FIELDS:
+            value = getattr(other, name)
+            setattr(self, name, dict(value) if isinstance(value, dict) else value)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MallPriceTable:
+    """
+    쇼핑몰별 가격 목록 (열 단위 저장)
+
+    행 객체 대신 열마다 튜플/array를 두어 쇼핑몰이 수십 개여도 객체 수가
+    늘지 않는다. 순서는 페이지에 표시된 순서 그대로다.
+    array는 해시할 수 없으므로 비교/해시는 객체 동일성 기준이다 (값 비교는 to_dict).
+    """
+
+    malls: Tuple[str, ...]
+    prices: array  # array("q"), 원
+    links: Tuple[str, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "malls", tuple(_intern(m) for m in self.malls))
+        if not isinstance(self.prices, array):
+            object.__setattr__(self, "prices", array("q", self.prices))
+        object.__setattr__(self, "links", tuple(self.links))
+        if not len(self.malls) == len(self.prices) == len(self.links):
+            raise ValueError("열 길이가 서로 다릅니다")
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def rows(self) -> Iterator[Tuple[str, int, str]]:
+        """(쇼핑몰, 가격, 링크) 순회"""
+        return zip(self.malls, self.prices, self.links)
+
+    def ranked(self) -> List[int]:
+        """가격 오름차순 행 번호 (같은 가격은 표시 순서 유지)"""
+        return sorted(range(len(self.prices)), key=self.prices.__getitem__)
+
+    def cheapest(self, rank: int = 0) -> Optional[Tuple[str, int, str]]:
+        """rank번째로 싼 (쇼핑몰, 가격, 링크) (0: 최저가, 1: 두 번째)"""
+        order = self.ranked()
+        if rank >= len(order):
+            return None
+        i = order[rank]
+        return self.malls[i], self.prices[i], self.links[i]
+
+    def price_of(self, mall: str) -> Optional[int]:
+        """특정 쇼핑몰의 최저 가격"""
+        prices = [p for m, p in zip(self.malls, self.prices) if m == mall]
+        return min(prices) if prices else None
+
+    def to_dict(self):
+        return {
+            "malls": list(self.malls),
+            "prices": self.prices.tolist(),
+            "links": list(self.links),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["malls"], data["prices"], data["links"])
+
+
+@dataclass(frozen=True, slots=True)
+class DetailedPriceResult:
+    """가격 조회 결과 + 같은 페이지의 쇼핑몰별 전체 가격"""
+
+    result: PriceResult
+    malls: MallPriceTable
+
+    def to_dict(self):
+        return {"result": self.result.to_dict(), "malls": self.malls.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            PriceResult.from_dict(data["result"]),
+            MallPriceTable.from_dict(data["malls"]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FetchOutcome:
+    """일괄 조회(fetch_many) 항목별 결과"""
+
+    url: str
+    result: Optional[PriceResult]
+    status: str  # ok | failed | late
+    elapsed: float = 0.0  # 초
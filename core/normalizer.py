@@ -1,8 +1,49 @@
 """가격 파싱, 토큰 추출, 이상징후 감지"""
 
+import hashlib
 import re
-from typing import Optional, Set
-from config.constants import PRICE_CHANGE_THRESHOLD, TOKEN_MISMATCH_THRESHOLD
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Set
+from config.constants import (
+    PRICE_CHANGE_THRESHOLD,
+    TOKEN_MISMATCH_THRESHOLD,
+    TOKEN_CACHE_SIZE,
+    TITLE_SIGNATURE_BITS,
+)
+
+# 미리 컴파일한 패턴 (호출마다 패턴 조회/컴파일 방지)
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+_NON_WORD_RE = re.compile(r"[^\w\s가-힣]")
+_DIGIT_RE = re.compile(r"\d")
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _token_set(title: str) -> FrozenSet[str]:
+    """상품명별 핵심 토큰 집합 (LRU 캐시)"""
+    # 소문자 변환 및 특수문자 제거
+    normalized = _NON_WORD_RE.sub(" ", title.lower())
+
+    # 토큰 분리 (의미있는 단어만): 2글자 이상 또는 숫자 포함 토큰만
+    return frozenset(
+        token
+        for token in normalized.split()
+        if len(token) >= 2 or _DIGIT_RE.search(token)
+    )
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def token_hash(token: str) -> int:
+    """프로세스와 무관하게 고정된 64비트 토큰 해시"""
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _jaccard(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> float:
+    """두 토큰 집합의 Jaccard 유사도"""
+    if not tokens1 or not tokens2:
+        return 0.0
+    intersection = len(tokens1 & tokens2)
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
 
 
 class Normalizer:
@@ -18,7 +59,7 @@ class Normalizer:
             return None
 
         # 숫자만 추출
-        digits = re.sub(r"[^\d]", "", price_text)
+        digits = _NON_DIGIT_RE.sub("", price_text)
 
         try:
             return int(digits) if digits else None
@@ -34,17 +75,15 @@ class Normalizer:
         if not title:
             return set()
 
-        # 소문자 변환 및 특수문자 제거
-        normalized = re.sub(r"[^\w\s가-힣]", " ", title.lower())
+        # 캐시된 frozenset을 공유하지 않도록 복사본 반환
+        return set(_token_set(title))
 
-        # 토큰 분리 (의미있는 단어만)
-        tokens = set()
-        for token in normalized.split():
-            # 2글자 이상 또는 숫자 포함 토큰만
-            if len(token) >= 2 or re.search(r"\d", token):
-                tokens.add(token)
-
-        return tokens
+    @staticmethod
+    def token_set(title: str) -> FrozenSet[str]:
+        """핵심 토큰 집합 (캐시 공유, 읽기 전용)"""
+        if not title:
+            return frozenset()
+        return _token_set(title)
 
     @staticmethod
     def check_token_mismatch(title1: str, title2: str) -> bool:
@@ -52,18 +91,72 @@ class Normalizer:
         두 상품명의 핵심 토큰 불일치 여부 확인
         Returns: True if mismatch detected
         """
-        tokens1 = Normalizer.extract_core_tokens(title1)
-        tokens2 = Normalizer.extract_core_tokens(title2)
+        tokens1 = Normalizer.token_set(title1)
+        tokens2 = Normalizer.token_set(title2)
 
         if not tokens1 or not tokens2:
             return True
 
         # 교집합 비율 계산
-        intersection = tokens1 & tokens2
-        union = tokens1 | tokens2
+        similarity = _jaccard(tokens1, tokens2)
+
+        return similarity < (1 - TOKEN_MISMATCH_THRESHOLD)
+
+    @staticmethod
+    def similarity(title1: str, title2: str) -> float:
+        """두 상품명의 핵심 토큰 Jaccard 유사도 (0.0 ~ 1.0)"""
+        return _jaccard(Normalizer.token_set(title1), Normalizer.token_set(title2))
+
+    @staticmethod
+    def keyword_coverage(keyword: str, title: str) -> float:
+        """
+        키워드 토큰 중 상품명에 포함된 비율 (0.0 ~ 1.0)
 
-        similarity = len(intersection) / len(union) if union else 0
+        상품명은 키워드보다 토큰이 훨씬 많아 Jaccard는 낮게 나오므로,
+        검색 키워드와 후보를 비교할 때는 포함 비율을 쓴다.
+        """
+        keyword_tokens = Normalizer.token_set(keyword)
+        if not keyword_tokens:
+            return 0.0
+        title_tokens = Normalizer.token_set(title)
+        return len(keyword_tokens & title_tokens) / len(keyword_tokens)
+
+    @staticmethod
+    def title_signature(title: str) -> int:
+        """
+        상품명 토큰 서명 (TITLE_SIGNATURE_BITS 비트 정수)
+
+        토큰마다 해시 위치의 비트 하나를 켠 비트셋이다.
+        원문 상품명 없이 서명끼리 Jaccard 유사도를 근사할 수 있다.
+        """
+        signature = 0
+        for token in Normalizer.token_set(title):
+            signature |= 1 << (token_hash(token) % TITLE_SIGNATURE_BITS)
+        return signature
+
+    @staticmethod
+    def signature_similarity(signature1: int, signature2: int) -> float:
+        """
+        두 서명의 근사 Jaccard 유사도 (상수 시간)
 
+        해시 충돌은 유사도를 높이는 방향으로만 작용하므로 오탐보다 미탐 쪽이다.
+        """
+        union = (signature1 | signature2).bit_count()
+        if not union:
+            return 0.0
+        return (signature1 & signature2).bit_count() / union
+
+    @staticmethod
+    def check_signature_mismatch(signature: int, title: str) -> bool:
+        """
+        저장된 서명과 새 상품명의 핵심 토큰 불일치 여부
+        Returns: True if mismatch detected
+        """
+        current = Normalizer.title_signature(title)
+        if not signature or not current:
+            return True
+
+        similarity = Normalizer.signature_similarity(signature, current)
         return similarity < (1 - TOKEN_MISMATCH_THRESHOLD)
 
     @staticmethod
@@ -84,3 +177,31 @@ class Normalizer:
         """상품명 정리 (공백 제거, 길이 제한)"""
         cleaned = " ".join(title.split())
         return cleaned[:max_length] if len(cleaned) > max_length else cleaned
+
+    # === 배치 API (대량 재검증/후보 랭킹용) ===
+
+    @staticmethod
+    def parse_prices(price_texts: Iterable[str]) -> List[Optional[int]]:
+        """가격 문자열 리스트 일괄 파싱"""
+        parse = Normalizer.parse_price
+        return [parse(text) for text in price_texts]
+
+    @staticmethod
+    def token_sets(titles: Iterable[str]) -> List[FrozenSet[str]]:
+        """상품명 리스트의 핵심 토큰 집합 일괄 추출"""
+        token_set = Normalizer.token_set
+        return [token_set(title) for title in titles]
+
+    @staticmethod
+    def similarity_matrix(
+        titles_a: Iterable[str], titles_b: Iterable[str]
+    ) -> List[List[float]]:
+        """
+        상품명 목록 간 Jaccard 유사도 행렬
+
+        Returns:
+            matrix[i][j] = similarity(titles_a[i], titles_b[j])
+        """
+        sets_a = Normalizer.token_sets(titles_a)
+        sets_b = Normalizer.token_sets(titles_b)
+        return [[_jaccard(a, b) for b in sets_b] for a in sets_a]
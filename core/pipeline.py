@@ -0,0 +1,346 @@
+"""단계별 크롤링 파이프라인
+
+    fetch → parse → validate → persist → notify
+
+단계 사이는 크기가 정해진 큐로 연결되어, 파싱이나 저장이 밀리면 큐가 차고
+앞 단계(결국 submit을 호출한 스케줄러)가 대기한다. 메모리는 큐 길이로 제한된다.
+
+- fetch: 응답만 받는다 (parse_fetch가 없는 스크래퍼는 여기서 fetch 전체 실행)
+- parse: scraper.parse_fetch(url, response)로 가격 추출
+- validate: 상품명 변경/가격 급변 검사, 백오프 반영 (단일 스레드, 추적 대상 순서 보장)
+- persist: 완료된 추적 대상을 모아 한 번에 저장
+- notify: UI 콜백 호출, 다음 크롤링 시각 재계산
+
+    pipeline = CrawlPipeline()
+    pipeline.start()
+    scheduler = Scheduler(state, store, scrapers, emailer, pipeline=pipeline)
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from core.deadline import Deadline, deadline_scope
+from core.metrics import PIPELINE_STAGE_SECONDS, PIPELINE_BLOCKED
+from core.models import PriceResult
+from config.constants import (
+    CRAWL_TICK_BUDGET,
+    PIPELINE_FETCH_WORKERS,
+    PIPELINE_PARSE_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_PERSIST_BATCH,
+    PIPELINE_PERSIST_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass(slots=True)
+class CrawlBatch:
+    """추적 대상 1개의 크롤링 1회분"""
+
+    scheduler: object
+    deadline: Deadline
+    pending: int
+    results: List[PriceResult] = field(default_factory=list)
+    changed: bool = False
+    completed: bool = False  # crawl_completed() 호출 여부 (단계 오류로 중단 포함)
+
+
+@dataclass(slots=True)
+class CrawlJob:
+    """사이트 1개 조회 작업"""
+
+    batch: CrawlBatch
+    site: str
+    url: str
+    scraper: object
+    response: object = None
+    result: Optional[PriceResult] = None
+    error: Optional[Exception] = None
+
+
+class CrawlPipeline:
+    """여러 스케줄러가 공유하는 크롤링 파이프라인"""
+
+    def __init__(
+        self,
+        fetch_workers: int = PIPELINE_FETCH_WORKERS,
+        parse_workers: int = PIPELINE_PARSE_WORKERS,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        persist_batch: int = PIPELINE_PERSIST_BATCH,
+        persist_interval: float = PIPELINE_PERSIST_INTERVAL,
+        budget: float = CRAWL_TICK_BUDGET,
+    ):
+        """
+        Args:
+            fetch_workers: 요청 워커 수
+            parse_workers: 파싱 워커 수
+            queue_size: 단계 사이 큐 최대 길이
+            persist_batch: 한 번에 저장할 최대 추적 대상 수
+            persist_interval: 저장 배치를 모으는 최대 시간 (초)
+            budget: 크롤링 1회 시간 예산 (초, 큐 대기 시간 포함)
+        """
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.persist_batch = persist_batch
+        self.persist_interval = persist_interval
+        self.budget = budget
+
+        self.fetch_queue: queue.Queue = queue.Queue(queue_size)
+        self.parse_queue: queue.Queue = queue.Queue(queue_size)
+        self.validate_queue: queue.Queue = queue.Queue(queue_size)
+        self.persist_queue: queue.Queue = queue.Queue(queue_size)
+        self.notify_queue: queue.Queue = queue.Queue(queue_size)
+
+        self._stages: List[List[threading.Thread]] = []
+        self.running = False
+
+    def start(self):
+        """단계별 워커 시작"""
+        if self.running:
+            return
+        self.running = True
+
+        layout = [
+            ("fetch", self.fetch_queue, self.fetch_workers, self._fetch),
+            ("parse", self.parse_queue, self.parse_workers, self._parse),
+            ("validate", self.validate_queue, 1, self._validate),
+            ("notify", self.notify_queue, 1, self._notify),
+        ]
+        self._stages = []
+        for name, inbox, workers, handler in layout:
+            threads = [
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(name, inbox, handler),
+                    name=f"pipeline-{name}-{i}",
+                    daemon=True,
+                )
+                for i in range(workers)
+            ]
+            self._stages.append(threads)
+
+        persist = threading.Thread(
+            target=self._run_persist, name="pipeline-persist-0", daemon=True
+        )
+        # 종료 시 단계 순서대로 비우기 위해 validate 다음에 둔다
+        self._stages.insert(3, [persist])
+
+        for threads in self._stages:
+            for thread in threads:
+                thread.start()
+        logger.info("크롤링 파이프라인 시작")
+
+    def stop(self, timeout: float = 10):
+        """앞 단계부터 차례로 남은 작업을 처리하고 종료"""
+        if not self.running:
+            return
+        self.running = False
+
+        inboxes = [
+            self.fetch_queue,
+            self.parse_queue,
+            self.validate_queue,
+            self.persist_queue,
+            self.notify_queue,
+        ]
+        for inbox, threads in zip(inboxes, self._stages):
+            for _ in threads:
+                inbox.put(_STOP)
+            for thread in threads:
+                thread.join(timeout=timeout)
+        logger.info("크롤링 파이프라인 중지")
+
+    def submit(self, scheduler) -> CrawlBatch:
+        """
+        추적 대상 1개의 크롤링 요청 (fetch 큐가 가득 차면 대기)
+
+        완료되면 scheduler.crawl_completed()가 notify 단계에서 (단계 오류로
+        중단되면 오류가 난 단계에서) 호출된다.
+        """
+        with scheduler.state_lock:
+            targets = [
+                (site, url, scheduler.scrapers.get(site))
+                for site, url in scheduler.state.selected_products.items()
+            ]
+        targets = [(site, url, scraper) for site, url, scraper in targets if scraper]
+
+        batch = CrawlBatch(scheduler, Deadline(self.budget), len(targets))
+        if not targets:
+            self._put(self.persist_queue, batch, "submit")
+            return batch
+
+        for site, url, scraper in targets:
+            self._put(self.fetch_queue, CrawlJob(batch, site, url, scraper), "submit")
+        return batch
+
+    def _put(self, outbox: queue.Queue, item, stage: str):
+        """다음 단계로 전달 (가득 차면 backpressure 기록 후 대기)"""
+        try:
+            outbox.put_nowait(item)
+        except queue.Full:
+            PIPELINE_BLOCKED.inc(stage=stage)
+            outbox.put(item)
+
+    def _run_stage(self, name: str, inbox: queue.Queue, handler: Callable):
+        while True:
+            item = inbox.get()
+            if item is _STOP:
+                return
+            start = time.perf_counter()
+            try:
+                handler(item)
+            except Exception as e:
+                self._abort(item.batch if isinstance(item, CrawlJob) else item, name, e)
+            finally:
+                PIPELINE_STAGE_SECONDS.observe(time.perf_counter() - start, stage=name)
+
+    def _abort(self, batch: CrawlBatch, stage: str, error: Exception):
+        """
+        단계 오류로 크롤링 1회를 중단
+
+        crawl_completed()를 호출하지 않으면 crawl_in_flight가 남아 이후 틱이 모두
+        건너뛰어지므로, 중단한 배치도 완료 처리한다 (남은 작업은 validate에서 버림).
+        """
+        scheduler = batch.scheduler
+        logger.error(
+            "파이프라인 %s 단계 오류: %s",
+            stage,
+            error,
+            extra={"tracker": scheduler.state.keyword},
+        )
+        if not batch.completed:
+            self._complete(batch)
+
+    def _complete(self, batch: CrawlBatch):
+        """크롤링 1회 완료 처리 (배치당 1번만)"""
+        batch.completed = True
+        try:
+            batch.scheduler.crawl_completed()
+        except Exception as e:
+            logger.error("크롤링 완료 처리 오류: %s", e)
+
+    # === 단계 ===
+
+    def _fetch(self, job: CrawlJob):
+        if not job.batch.deadline.expired():
+            try:
+                with deadline_scope(job.batch.deadline):
+                    if hasattr(job.scraper, "parse_fetch"):
+                        job.response = job.scraper._get_response(job.url)
+                    else:
+                        job.result = job.scraper.fetch(job.url)
+            except Exception as e:
+                job.error = e
+        self._put(self.parse_queue, job, "fetch")
+
+    def _parse(self, job: CrawlJob):
+        if job.response is not None:
+            try:
+                job.result = job.scraper.parse_fetch(job.url, job.response)
+            except Exception as e:
+                job.error = e
+            finally:
+                # 응답 본문은 파싱 직후 놓아 큐에 쌓인 작업의 메모리를 줄인다
+                job.response = None
+        self._put(self.validate_queue, job, "parse")
+
+    def _validate(self, job: CrawlJob):
+        batch = job.batch
+        scheduler = batch.scheduler
+        if batch.completed:
+            return
+
+        with scheduler.state_lock:
+            if job.error is not None:
+                logger.error(
+                    "크롤링 오류 (%s): %s",
+                    job.site,
+                    job.error,
+                    extra={
+                        "tracker": scheduler.state.keyword,
+                        "site": job.site,
+                        "url": job.url,
+                    },
+                )
+                batch.changed |= scheduler.apply_failure(job.site)
+            elif job.result:
+                batch.results.append(job.result)
+                batch.changed |= scheduler.apply_result(job.site, job.result)
+            elif batch.deadline.expired():
+                scheduler.log_late(job.site)
+            else:
+                batch.changed |= scheduler.apply_failure(job.site)
+
+            batch.pending -= 1
+            if batch.pending:
+                return
+            batch.changed |= scheduler.apply_results(batch.results)
+
+        self._put(self.persist_queue, batch, "validate")
+
+    def _run_persist(self):
+        """완료된 추적 대상을 모아 저장 (같은 대상은 배치당 1회)"""
+        stopping = False
+        while not stopping:
+            first = self.persist_queue.get()
+            if first is _STOP:
+                return
+
+            batches = [first]
+            until = time.perf_counter() + self.persist_interval
+            while len(batches) < self.persist_batch:
+                left = until - time.perf_counter()
+                if left <= 0:
+                    break
+                try:
+                    item = self.persist_queue.get(timeout=left)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batches.append(item)
+
+            start = time.perf_counter()
+            saved = set()
+            indexes = {}
+            for batch in batches:
+                scheduler = batch.scheduler
+                if not batch.changed or id(scheduler) in saved:
+                    continue
+                saved.add(id(scheduler))
+                indexes[id(scheduler.price_index)] = scheduler.price_index
+                try:
+                    with scheduler.state_lock:
+                        scheduler.state_store.save(scheduler.state)
+                except Exception as e:
+                    logger.error(
+                        "상태 저장 실패: %s",
+                        e,
+                        extra={"tracker": scheduler.state.keyword},
+                    )
+            # 최저가 인덱스는 여러 추적 대상이 공유하므로 배치당 한 번, 저장 간격마다
+            for index in indexes.values():
+                try:
+                    index.save_if_due()
+                except Exception as e:
+                    logger.error("최저가 인덱스 저장 실패: %s", e)
+            PIPELINE_STAGE_SECONDS.observe(time.perf_counter() - start, stage="persist")
+
+            for batch in batches:
+                self._put(self.notify_queue, batch, "persist")
+
+    def _notify(self, batch: CrawlBatch):
+        scheduler = batch.scheduler
+        try:
+            if batch.changed and scheduler.on_status_change:
+                scheduler.on_status_change(scheduler.state)
+        finally:
+            self._complete(batch)
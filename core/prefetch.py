@@ -0,0 +1,113 @@
+"""후보 선택 시 상품 페이지 선행 조회 (짧은 TTL 캐시)
+
+사용자가 후보를 고르는 동안 백그라운드에서 fetch를 미리 실행해 두면,
+추적 시작 시 바로 확인된 상품명/가격을 보여주고 첫 크롤링 틱도 요청 없이
+그 결과를 재사용할 수 있다. 결과는 TTL이 지나면 버려 오래된 가격을 쓰지 않는다.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Callable, Dict, Optional, Tuple
+
+from core.metrics import PREFETCH_LOOKUPS
+from core.models import PriceResult
+from config.constants import PREFETCH_TTL, PREFETCH_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchCache:
+    """상품 URL별 선행 조회 결과 (진행 중인 요청 포함)"""
+
+    def __init__(
+        self,
+        ttl: float = PREFETCH_TTL,
+        workers: int = PREFETCH_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl: 요청 시작부터 결과를 재사용할 수 있는 시간 (초)
+            workers: 동시 선행 조회 수
+            clock: 단조 시계
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="prefetch"
+        )
+        self._entries: Dict[str, Tuple[float, Future]] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, site: str, scraper, product_url: str):
+        """선행 조회 시작 (이미 유효한 결과나 진행 중인 요청이 있으면 무시)"""
+        with self._lock:
+            self._evict()
+            if product_url in self._entries:
+                return
+            future = self._pool.submit(scraper.fetch, product_url)
+            self._entries[product_url] = (self.clock(), future)
+        logger.debug("선행 조회 시작 (%s): %s", site, product_url)
+
+    def get(
+        self, site: str, product_url: str, timeout: float = 0
+    ) -> Optional[PriceResult]:
+        """
+        선행 조회 결과 (캐시 유지)
+
+        Args:
+            timeout: 요청이 진행 중이면 기다릴 최대 시간 (초, 0이면 기다리지 않음)
+
+        Returns:
+            결과가 없거나 만료/실패/미완료면 None
+        """
+        with self._lock:
+            self._evict()
+            entry = self._entries.get(product_url)
+        return self._result(site, entry, timeout)
+
+    def done(self, product_url: str) -> bool:
+        """진행 중인 선행 조회가 없는지 (결과가 있거나, 끝났거나, 요청하지 않음)"""
+        with self._lock:
+            entry = self._entries.get(product_url)
+        return entry is None or entry[1].done()
+
+    def pop(self, site: str, product_url: str) -> Optional[PriceResult]:
+        """완료된 선행 조회 결과를 꺼내고 캐시에서 제거 (한 번만 재사용)"""
+        with self._lock:
+            self._evict()
+            entry = self._entries.get(product_url)
+            if entry and entry[1].done():
+                del self._entries[product_url]
+        return self._result(site, entry, 0)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _evict(self):
+        """TTL이 지난 항목 제거 (잠금 안에서 호출)"""
+        cutoff = self.clock() - self.ttl
+        for url in [u for u, (at, _) in self._entries.items() if at < cutoff]:
+            del self._entries[url]
+
+    def _result(self, site: str, entry, timeout: float) -> Optional[PriceResult]:
+        if entry is None:
+            PREFETCH_LOOKUPS.inc(site=site, outcome="miss")
+            return None
+
+        future = entry[1]
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeout:
+            PREFETCH_LOOKUPS.inc(site=site, outcome="pending")
+            return None
+        except Exception as e:
+            logger.warning("선행 조회 실패 (%s): %s", site, e)
+            PREFETCH_LOOKUPS.inc(site=site, outcome="failed")
+            return None
+
+        PREFETCH_LOOKUPS.inc(site=site, outcome="hit" if result else "failed")
+        return result
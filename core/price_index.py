@@ -0,0 +1,300 @@
+"""상품별 최저가 집계 인덱스 (가격 히스토리 없이 O(1) 조회)
+
+가격 조회 결과가 들어올 때마다 상품(URL)별 집계를 갱신한다.
+
+- 역대 최저가와 그 시각
+- 최근 window 기간 최저가: (시각, 가격)을 가격 오름차순으로 유지하는 단조 deque.
+  새 가격보다 비싼 뒤쪽 항목은 다시 최저가가 될 수 없으므로 버리고,
+  기간을 벗어난 앞쪽 항목은 관측/조회 시 제거한다 (관측당 분할 상환 O(1))
+- 마지막 가격 / 마지막 알림 가격
+- 최근 PRICE_HISTORY_POINTS회 관측 가격 (알림 메일의 가격 추이 그래프용)
+
+상품 키는 추적 대상이 선택한 상품 URL이다 (다나와 결과의 product_url은 최저가
+쇼핑몰 링크라 최저가 쇼핑몰이 바뀔 때마다 달라지므로 키로 쓰지 않는다).
+
+파일 저장은 전체를 다시 쓰므로 저장 요청마다 하지 않고, 변경이 있을 때
+PRICE_INDEX_SAVE_INTERVAL마다 한 번만 쓴다 (save_if_due).
+
+"지금 역대/30일 최저가인 상품" 목록은 관측 시점에 갱신되는 집합으로 유지해
+전체 추적 대상을 훑지 않고 답한다. 마지막 관측이 기간 안에 있는 한
+기간 최저가 여부는 새 관측이 들어올 때만 바뀐다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.models import PriceResult
+from config.constants import (
+    PRICE_HISTORY_POINTS,
+    PRICE_INDEX_SAVE_INTERVAL,
+    PRICE_LOW_WINDOW_DAYS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PriceAggregate:
+    """상품 1개의 가격 집계"""
+
+    __slots__ = (
+        "site",
+        "product_url",
+        "min_price",
+        "min_at",
+        "last_price",
+        "last_at",
+        "notified_price",
+        "history",
+        "_window",
+    )
+
+    def __init__(self, site: str, product_url: str):
+        self.site = site
+        self.product_url = product_url
+        self.min_price: Optional[int] = None
+        self.min_at: Optional[int] = None
+        self.last_price: Optional[int] = None
+        self.last_at: Optional[int] = None
+        self.notified_price: Optional[int] = None
+        self.history: deque = deque(maxlen=PRICE_HISTORY_POINTS)
+        # (epoch 초, 가격), 가격 오름차순 = 시각 오름차순
+        self._window: deque = deque()
+
+    def observe(self, price: int, at: int, window_seconds: int):
+        """새 가격 반영 (기간을 벗어난 앞쪽 항목도 함께 정리)"""
+        if self.min_price is None or price < self.min_price:
+            self.min_price, self.min_at = price, at
+        self.last_price, self.last_at = price, at
+        self.history.append(price)
+
+        window = self._window
+        while window and window[-1][1] >= price:
+            window.pop()
+        window.append((at, price))
+        self._expire(at - window_seconds)
+
+    def window_min(self, window_seconds: int, now: int) -> Optional[int]:
+        """최근 window_seconds 동안의 최저가 (관측이 없으면 None)"""
+        self._expire(now - window_seconds)
+        return self._window[0][1] if self._window else None
+
+    def _expire(self, cutoff: int):
+        window = self._window
+        while window and window[0][0] < cutoff:
+            window.popleft()
+
+    def at_all_time_low(self) -> bool:
+        return self.last_price is not None and self.last_price <= self.min_price
+
+    def at_window_low(self) -> bool:
+        """마지막 가격이 기간 최저가인지 (뒤쪽 항목이 곧 마지막 관측)"""
+        return bool(self._window) and self._window[0][1] >= self.last_price
+
+    def to_dict(self):
+        return {
+            "site": self.site,
+            "product_url": self.product_url,
+            "min_price": self.min_price,
+            "min_at": self.min_at,
+            "last_price": self.last_price,
+            "last_at": self.last_at,
+            "notified_price": self.notified_price,
+            "history": list(self.history),
+            "window": [list(item) for item in self._window],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        aggregate = cls(data["site"], data["product_url"])
+        aggregate.min_price = data.get("min_price")
+        aggregate.min_at = data.get("min_at")
+        aggregate.last_price = data.get("last_price")
+        aggregate.last_at = data.get("last_at")
+        aggregate.notified_price = data.get("notified_price")
+        aggregate.history.extend(data.get("history", ()))
+        aggregate._window = deque(tuple(item) for item in data.get("window", ()))
+        return aggregate
+
+
+class PriceIndex:
+    """상품 URL별 가격 집계 (스레드 안전)"""
+
+    def __init__(
+        self,
+        filepath: Optional[str] = None,
+        window_days: int = PRICE_LOW_WINDOW_DAYS,
+        save_interval: float = PRICE_INDEX_SAVE_INTERVAL,
+    ):
+        """
+        Args:
+            filepath: 저장 파일 경로 (None이면 메모리에만 유지)
+            window_days: 기간 최저가 기간 (일)
+            save_interval: save_if_due의 최소 저장 간격 (초)
+        """
+        self.filepath = Path(filepath) if filepath else None
+        self.window_seconds = window_days * 86400
+        self.save_interval = save_interval
+        self._dirty = False
+        self._saved_at = 0.0
+        self._aggregates: Dict[str, PriceAggregate] = {}
+        self._all_time_lows: set = set()
+        self._window_lows: set = set()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._aggregates)
+
+    def observe(
+        self, result: PriceResult, product_url: Optional[str] = None
+    ) -> PriceAggregate:
+        """
+        가격 조회 결과 반영
+
+        Args:
+            product_url: 집계 키 (추적 대상이 선택한 상품 URL, 기본: result.product_url)
+        """
+        url = product_url or result.product_url
+        with self._lock:
+            self._dirty = True
+            aggregate = self._aggregates.get(url)
+            if aggregate is None:
+                aggregate = self._aggregates[url] = PriceAggregate(result.site, url)
+            aggregate.observe(result.price, result.fetched_at, self.window_seconds)
+            self._update_lows(url, aggregate)
+        return aggregate
+
+    def mark_notified(self, product_url: str, price: int):
+        """알림으로 보낸 가격 기록"""
+        with self._lock:
+            aggregate = self._aggregates.get(product_url)
+            if aggregate is not None:
+                aggregate.notified_price = price
+                self._dirty = True
+
+    def get(self, product_url: str) -> Optional[PriceAggregate]:
+        return self._aggregates.get(product_url)
+
+    def all_time_low(self, product_url: str) -> Optional[int]:
+        aggregate = self._aggregates.get(product_url)
+        return aggregate.min_price if aggregate else None
+
+    def window_low(self, product_url: str, now: Optional[int] = None) -> Optional[int]:
+        """기간 최저가 (기간 안 관측이 없으면 None)"""
+        now = int(time.time()) if now is None else now
+        with self._lock:
+            aggregate = self._aggregates.get(product_url)
+            if aggregate is None:
+                return None
+            return aggregate.window_min(self.window_seconds, now)
+
+    def history(self, product_url: str) -> List[int]:
+        """최근 관측 가격 (오래된 순)"""
+        with self._lock:
+            aggregate = self._aggregates.get(product_url)
+            return list(aggregate.history) if aggregate else []
+
+    def is_new_low(self, product_url: str) -> bool:
+        """마지막 가격이 역대 최저가인지"""
+        return product_url in self._all_time_lows
+
+    def at_all_time_low(self) -> List[str]:
+        """지금 역대 최저가인 상품 URL"""
+        with self._lock:
+            return list(self._all_time_lows)
+
+    def at_window_low(self, now: Optional[int] = None) -> List[str]:
+        """지금 기간 최저가인 상품 URL (마지막 관측이 기간을 벗어난 상품 제외)"""
+        now = int(time.time()) if now is None else now
+        cutoff = now - self.window_seconds
+        with self._lock:
+            return [
+                url
+                for url in self._window_lows
+                if self._aggregates[url].last_at >= cutoff
+            ]
+
+    def _update_lows(self, url: str, aggregate: PriceAggregate):
+        for lows, low in (
+            (self._all_time_lows, aggregate.at_all_time_low()),
+            (self._window_lows, aggregate.at_window_low()),
+        ):
+            if low:
+                lows.add(url)
+            else:
+                lows.discard(url)
+
+    # === 저장/로드 ===
+
+    def save(self) -> bool:
+        """파일로 저장 (임시 파일에 쓰고 교체)"""
+        if self.filepath is None:
+            return False
+        with self._lock:
+            data = [a.to_dict() for a in self._aggregates.values()]
+            self._dirty = False
+            self._saved_at = time.monotonic()
+        try:
+            self._write(data)
+            return True
+        except Exception as e:
+            self._dirty = True
+            logger.error("가격 인덱스 저장 실패: %s", e)
+            return False
+
+    def save_if_due(self) -> bool:
+        """변경이 있고 마지막 저장 후 save_interval이 지났으면 저장 (상태 저장 경로용)"""
+        if self.filepath is None or not self._dirty:
+            return False
+        if time.monotonic() - self._saved_at < self.save_interval:
+            return False
+        return self.save()
+
+    def flush(self) -> bool:
+        """변경이 있으면 바로 저장 (종료 시)"""
+        if self.filepath is None or not self._dirty:
+            return False
+        return self.save()
+
+    def _write(self, data: list):
+        """임시 파일에 쓰고 교체 (여러 스케줄러 스레드가 동시에 저장할 수 있음)"""
+        with self._save_lock:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+
+    def load(self) -> bool:
+        """저장된 집계 로드 (파일이 없으면 빈 인덱스)"""
+        if self.filepath is None or not self.filepath.exists():
+            return False
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error("가격 인덱스 로드 실패: %s", e)
+            return False
+
+        with self._lock:
+            self._aggregates = {}
+            self._all_time_lows.clear()
+            self._window_lows.clear()
+            for item in data:
+                aggregate = PriceAggregate.from_dict(item)
+                self._aggregates[aggregate.product_url] = aggregate
+                if aggregate.last_price is not None:
+                    self._update_lows(aggregate.product_url, aggregate)
+        return True
+
+
+# 기본 인덱스 (메모리 전용, UI는 파일에 저장하는 인덱스를 Scheduler에 넘긴다)
+PRICE_INDEX = PriceIndex()
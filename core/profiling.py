@@ -0,0 +1,207 @@
+"""온디맨드 틱 프로파일링 (cProfile/tracemalloc + 단계별 소요 시간)
+
+재시작 없이 느린 틱의 원인(네트워크/파싱/상태 저장 등)을 확인하기 위한 훅.
+
+- 환경변수 PRICE_ALERT_PROFILE_TICKS=N 또는 SIGUSR1 신호로 다음 N틱을 프로파일링
+- 프로파일링 중인 틱은 logs/profiles/ 에 다음 파일을 남긴다
+  - *.pstats: cProfile 결과 (python -m pstats 로 확인)
+  - *.alloc.txt: tracemalloc 상위 할당 위치
+  - *.phases.json: 단계별 wall time (wait, fetch, parse, validate, persist, notify)
+- 단계 시간은 배타적으로 집계한다 (하위 단계 시간은 상위 단계에서 제외)
+"""
+
+import cProfile
+import json
+import logging
+import os
+import signal
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from config.constants import (
+    PROFILE_DIR,
+    PROFILE_TICKS_ENV,
+    DEFAULT_PROFILE_TICKS,
+    PROFILE_TOP_ALLOCATIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _TickRecord:
+    """틱 하나의 단계별 시간 (스레드 로컬)"""
+
+    __slots__ = ("phases", "stack")
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        # [단계 이름, 마지막 재개 시각]
+        self.stack = []
+
+
+class TickProfiler:
+    """다음 N틱을 프로파일링하는 훅"""
+
+    def __init__(self, output_dir: str = PROFILE_DIR):
+        self.output_dir = Path(output_dir)
+        self._remaining = 0
+        # SIGUSR1로 요청된 틱 수 (핸들러는 값만 쓰고, 예약/로그는 다음 틱에서)
+        self._signalled = 0
+        self._lock = threading.Lock()
+        # cProfile은 동시에 하나만 활성화할 수 있다
+        self._profile_lock = threading.Lock()
+        self._local = threading.local()
+
+        env_ticks = os.environ.get(PROFILE_TICKS_ENV)
+        if env_ticks:
+            self.request(int(env_ticks))
+
+    def request(self, ticks: int = DEFAULT_PROFILE_TICKS):
+        """다음 N틱 프로파일링 예약"""
+        with self._lock:
+            self._remaining = max(self._remaining, ticks)
+        logger.info("다음 %d틱 프로파일링 예약", ticks)
+
+    def install_signal_handler(self, ticks: int = DEFAULT_PROFILE_TICKS) -> bool:
+        """
+        SIGUSR1 수신 시 프로파일링 예약 (메인 스레드에서 호출, POSIX 전용)
+
+        핸들러는 락/로깅 중간에 끼어들 수 있으므로 요청 값만 남기고, 예약과
+        로그는 다음 틱 시작 시 처리한다.
+        """
+        if not hasattr(signal, "SIGUSR1"):
+            return False
+
+        def handler(signum, frame):
+            self._signalled = ticks
+
+        signal.signal(signal.SIGUSR1, handler)
+        return True
+
+    def _take(self) -> bool:
+        """
+        예약된 틱 1개를 차감하고 프로파일링 시작 여부 반환
+
+        다른 틱이 프로파일링 중이면(_profile_lock을 못 얻으면) 차감하지 않고
+        다음 틱으로 넘긴다. True면 호출 측이 _profile_lock을 해제한다.
+        """
+        signalled = self._signalled
+        if signalled:
+            self._signalled = 0
+            self.request(signalled)
+        if self._remaining <= 0:
+            return False
+        if not self._profile_lock.acquire(blocking=False):
+            return False
+        with self._lock:
+            if self._remaining > 0:
+                self._remaining -= 1
+                return True
+        self._profile_lock.release()
+        return False
+
+    # === 단계 기록 ===
+
+    @contextmanager
+    def phase(self, name: str):
+        """단계 소요 시간 기록 (틱 밖에서는 아무 것도 하지 않음)"""
+        record: Optional[_TickRecord] = getattr(self._local, "record", None)
+        if record is None:
+            yield
+            return
+
+        now = time.perf_counter()
+        if record.stack:
+            parent = record.stack[-1]
+            record.phases[parent[0]] = record.phases.get(parent[0], 0.0) + (
+                now - parent[1]
+            )
+        record.stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            current = record.stack.pop()
+            record.phases[name] = record.phases.get(name, 0.0) + (now - current[1])
+            if record.stack:
+                record.stack[-1][1] = now
+
+    # === 틱 래핑 ===
+
+    @contextmanager
+    def tick(self, label: str):
+        """
+        틱 실행 래핑
+
+        단계 시간은 항상 기록하고(디버그 로그), 프로파일링이 예약된 경우에만
+        cProfile/tracemalloc 결과를 파일로 남긴다.
+        """
+        record = _TickRecord()
+        self._local.record = record
+
+        profiling = self._take()
+        profiler = None
+        started_tracemalloc = False
+        if profiling:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracemalloc = True
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            total = time.perf_counter() - start
+            self._local.record = None
+
+            if profiling:
+                profiler.disable()
+                snapshot = tracemalloc.take_snapshot()
+                if started_tracemalloc:
+                    tracemalloc.stop()
+                try:
+                    self._write(label, total, record, profiler, snapshot)
+                finally:
+                    self._profile_lock.release()
+
+            logger.debug(
+                "틱 단계 시간 (%s): %s",
+                label,
+                {k: round(v, 4) for k, v in record.phases.items()},
+                extra={"duration": total},
+            )
+
+    def _write(self, label, total, record, profiler, snapshot):
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stem = self.output_dir / (
+                f"{datetime.now():%Y%m%d_%H%M%S_%f}_{threading.get_ident()}_{label}"
+            )
+
+            profiler.dump_stats(f"{stem}.pstats")
+
+            top = snapshot.statistics("lineno")[:PROFILE_TOP_ALLOCATIONS]
+            with open(f"{stem}.alloc.txt", "w", encoding="utf-8") as f:
+                f.write("\n".join(str(stat) for stat in top))
+
+            with open(f"{stem}.phases.json", "w", encoding="utf-8") as f:
+                json.dump(
+                    {"label": label, "total": total, "phases": record.phases},
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                )
+
+            logger.info("틱 프로파일 저장: %s", stem)
+        except Exception as e:
+            logger.error("틱 프로파일 저장 실패: %s", e)
+
+
+PROFILER = TickProfiler()
@@ -0,0 +1,91 @@
+"""토큰 버킷 기반 요청률 제한"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class TokenBucket:
+    """토큰 버킷 (rate: 초당 충전 토큰 수, capacity: 최대 버스트)"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """토큰이 있으면 즉시 차감하고 True"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """토큰을 얻기까지 기다려야 하는 시간 (초)"""
+        with self._lock:
+            self._refill()
+            missing = tokens - self._tokens
+            return max(0.0, missing / self.rate) if self.rate > 0 else float("inf")
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        토큰을 얻을 때까지 대기
+
+        Returns:
+            timeout 안에 얻으면 True
+        """
+        end = None if timeout is None else self.clock() + timeout
+        while True:
+            if self.try_acquire(tokens):
+                return True
+            wait = self.wait_time(tokens)
+            if end is not None:
+                left = end - self.clock()
+                if left <= 0 or wait > left:
+                    return False
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 (프로세스 내 모든 스크래퍼가 공유)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return bucket
+
+    def configure(self, host: str, rate: float, capacity: float):
+        """특정 호스트의 제한 변경"""
+        with self._lock:
+            self._buckets[host] = TokenBucket(rate, capacity)
+
+    def try_acquire(self, host: str) -> bool:
+        return self.bucket(host).try_acquire()
+
+    def acquire(self, host: str, timeout: Optional[float] = None) -> bool:
+        return self.bucket(host).acquire(timeout=timeout)
@@ -1,13 +1,22 @@
 """크롤링/알림 주기 실행기 (백오프, 지터 포함)"""
 
+import logging
 import time
 import random
 import threading
+from concurrent.futures import Future, wait
 from datetime import datetime, timedelta
 from typing import Optional, Callable, List
+from core.clock import Clock, SYSTEM_CLOCK
+from core.deadline import Deadline, deadline_scope
 from core.models import TrackingState, PriceResult
+from core.price_index import PRICE_INDEX
 from core.state_store import StateStore
 from core.normalizer import Normalizer
+from core.metrics import TICK_SECONDS
+from core.profiling import PROFILER
+from notify.mail_scheduler import PRIORITY_DIGEST, PRIORITY_STATUS
+from scrapers.registry import SITE_REGISTRY
 from config.constants import (
     JITTER_MIN,
     JITTER_MAX,
@@ -15,8 +24,12 @@ from config.constants import (
     STATE_ACTIVE,
     STATE_NEEDS_CONFIRMATION,
     STATE_BLOCKED_SUSPECTED,
+    CRAWL_TICK_BUDGET,
+    CRAWL_SKIP_RETRY,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class Scheduler:
     """주기 실행 스케줄러"""
@@ -25,76 +38,155 @@ class Scheduler:
         self,
         state: TrackingState,
         state_store: StateStore,
-        scrapers: dict,  # {site: scraper}
+        scrapers: Optional[dict],  # {site: scraper}
         emailer,
         on_status_change: Optional[Callable] = None,
+        clock: Optional[Clock] = None,
+        rng: Optional[random.Random] = None,
+        pipeline=None,
+        prefetch=None,
+        price_index=None,
+        mail_scheduler=None,
     ):
         """
         Args:
             state: 추적 상태
             state_store: 상태 저장소
-            scrapers: 사이트별 스크래퍼 딕셔너리
+            scrapers: 사이트별 스크래퍼 딕셔너리 (None이면 사이트 등록부에서 처음 쓸 때 생성)
             emailer: 이메일 발송기
             on_status_change: 상태 변경 콜백 (UI 업데이트용)
+            clock: 시계 (기본: 실제 시계, 시뮬레이션에서는 VirtualClock)
+            rng: 지터용 난수 생성기
+            pipeline: 크롤링 파이프라인 (core.pipeline.CrawlPipeline, 기본: 틱 안에서 순차 실행)
+            prefetch: 선행 조회 캐시 (core.prefetch.PrefetchCache, 첫 크롤링에서만 재사용)
+            price_index: 상품별 최저가 집계 (core.price_index.PriceIndex, 기본: 메모리 전용 공용 인덱스)
+            mail_scheduler: 발송 대기열 (notify.mail_scheduler.MailScheduler, 기본: 틱 안에서 직접 발송)
         """
         self.state = state
         self.state_store = state_store
-        self.scrapers = scrapers
+        self.scrapers = SITE_REGISTRY.scrapers() if scrapers is None else scrapers
         self.emailer = emailer
         self.on_status_change = on_status_change
+        self.clock = clock or SYSTEM_CLOCK
+        self.rng = rng or random.Random()
+        self.pipeline = pipeline
+        self.prefetch = prefetch
+        self.price_index = PRICE_INDEX if price_index is None else price_index
+        self.mail_scheduler = mail_scheduler
+        self.pending_mail: List[Future] = []
+        # 마지막으로 상태 알림을 보낸 상태 (같은 상태로 중복 발송하지 않음)
+        self._alerted_status = state.status
+
+        # 파이프라인 단계와 스케줄러 스레드가 상태를 함께 다루므로 잠금으로 보호
+        self.state_lock = threading.RLock()
+        self.crawl_in_flight = False
+        # 마지막 크롤링 틱 시작 시각 (다음 크롤링 시각의 기준)
+        self._crawl_started_at = self.clock.now()
+        # 이번 틱의 지터 대기 시간 (TICK_SECONDS에서 제외)
+        self._jitter_slept = 0.0
 
         self.running = False
         self.thread: Optional[threading.Thread] = None
 
         # 다음 실행 시각 계산
-        self.next_crawl_at = datetime.now()
-        self.next_notify_at = datetime.now()
+        self.next_crawl_at = self.clock.now()
+        self.next_notify_at = self.clock.now()
 
     def start(self):
         """스케줄러 시작"""
         if self.running:
-            print("[WARN] 스케줄러가 이미 실행 중입니다.")
+            logger.warning("스케줄러가 이미 실행 중입니다.")
             return
 
         self.running = True
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
-        print("[INFO] 스케줄러 시작")
+        logger.info("스케줄러 시작")
 
     def stop(self):
         """스케줄러 중지"""
         self.running = False
         if self.thread:
             self.thread.join(timeout=5)
-        print("[INFO] 스케줄러 중지")
+        self.price_index.flush()
+        logger.info("스케줄러 중지")
 
     def _run_loop(self):
         """메인 루프"""
         while self.running:
-            now = datetime.now()
-
-            # 크롤링 실행 시각 체크
-            if now >= self.next_crawl_at:
-                self._crawl_tick()
-                self._schedule_next_crawl()
-
-            # 알림 실행 시각 체크
-            if now >= self.next_notify_at:
-                self._notify_tick()
-                self._schedule_next_notify()
+            self.run_pending()
 
             # 1초 대기
-            time.sleep(1)
+            self.clock.sleep(1)
+
+    def run_pending(self):
+        """실행 시각이 된 크롤링/알림 틱 실행 (루프 1회분)"""
+        now = self.clock.now()
+
+        # 크롤링 실행 시각 체크
+        if now >= self.next_crawl_at:
+            if self.pipeline is not None and self.crawl_in_flight:
+                # 이전 크롤링이 아직 처리 중이면 잠시 뒤 다시 확인
+                # (완료 시 crawl_completed가 다음 시각을 다시 계산한다)
+                logger.info(
+                    "이전 크롤링 처리 중, 이번 틱 건너뜀",
+                    extra={"tracker": self.state.keyword},
+                )
+                self.next_crawl_at = now + timedelta(seconds=CRAWL_SKIP_RETRY)
+            else:
+                self._crawl_started_at = now
+                self._timed_tick("crawl", self._crawl_tick)
+                self._schedule_next_crawl(now)
+
+        # 알림 실행 시각 체크
+        if now >= self.next_notify_at:
+            self._timed_tick("notify", self._notify_tick)
+            self._schedule_next_notify()
+
+    def next_due(self) -> datetime:
+        """다음 틱 실행 시각"""
+        return min(self.next_crawl_at, self.next_notify_at)
+
+    def _timed_tick(self, tick: str, func: Callable):
+        """틱 실행 시간 기록 (지터 대기는 의도된 지연이므로 제외)"""
+        self._jitter_slept = 0.0
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            with PROFILER.tick(tick):
+                func()
+            outcome = "ok"
+        finally:
+            elapsed = time.perf_counter() - start - self._jitter_slept
+            TICK_SECONDS.observe(max(0.0, elapsed), tick=tick, outcome=outcome)
 
     def _crawl_tick(self):
         """크롤링 실행"""
-        # 지터 적용 (랜덤 지연)
-        jitter = random.uniform(JITTER_MIN, JITTER_MAX)
-        time.sleep(jitter)
+        prefetched = self._take_prefetched()
+
+        # 지터 적용 (랜덤 지연, 모든 사이트를 선행 조회 결과로 처리하면 요청이 없으므로 생략)
+        jitter = 0.0
+        if not prefetched or len(prefetched) < len(self.state.selected_products):
+            jitter = self.rng.uniform(JITTER_MIN, JITTER_MAX)
+            slept = time.perf_counter()
+            with PROFILER.phase("wait"):
+                self.clock.sleep(jitter)
+            self._jitter_slept = time.perf_counter() - slept
+
+        logger.info(
+            "크롤링 시작 (지터: %.1f초)", jitter, extra={"tracker": self.state.keyword}
+        )
 
-        print(f"[INFO] 크롤링 시작 (지터: {jitter:.1f}초)")
+        if self.pipeline is not None:
+            # 요청/파싱/검증/저장/콜백은 파이프라인 단계에서 처리
+            self.crawl_in_flight = True
+            self.pipeline.submit(self)
+            return
 
         results: List[PriceResult] = []
+        changed = False
+        # 틱 전체 시간 예산: 각 요청은 남은 시간만 기다린다 (지터 대기는 제외)
+        deadline = Deadline(CRAWL_TICK_BUDGET)
 
         for site, product_url in self.state.selected_products.items():
             scraper = self.scrapers.get(site)
@@ -102,63 +194,182 @@ class Scheduler:
                 continue
 
             try:
-                result = scraper.fetch(product_url)
+                result = prefetched.get(site)
+                if result is None:
+                    # 네트워크/DOM 생성 시간은 스크래퍼 내부의 fetch/parse 단계로 분리된다
+                    with PROFILER.phase("parse"), deadline_scope(deadline):
+                        result = scraper.fetch(product_url)
 
                 if result:
                     results.append(result)
-                    self._validate_result(site, result)
+                    with PROFILER.phase("validate"):
+                        changed |= self.apply_result(site, result)
+                elif deadline.expired():
+                    self.log_late(site)
                 else:
-                    self._handle_fetch_failure(site)
+                    changed |= self.apply_failure(site)
 
             except Exception as e:
-                print(f"[ERROR] 크롤링 오류 ({site}): {e}")
-                self._handle_fetch_failure(site)
-
-        # 결과 저장
-        if results:
-            for result in results:
-                self.state.update_price(result.site, result.price)
+                logger.error(
+                    "크롤링 오류 (%s): %s",
+                    site,
+                    e,
+                    extra={
+                        "tracker": self.state.keyword,
+                        "site": site,
+                        "url": product_url,
+                    },
+                )
+                changed |= self.apply_failure(site)
 
-            self.state.reset_backoff()
-            self.state_store.save(self.state)
+        if self.apply_results(results) or changed:
+            self._save_state()
 
             if self.on_status_change:
                 self.on_status_change(self.state)
 
-    def _validate_result(self, site: str, result: PriceResult):
-        """결과 검증 (오매칭 감지)"""
+        self._check_status_alert()
+
+    def _take_prefetched(self) -> dict:
+        """
+        첫 크롤링에서 완료된 선행 조회 결과 꺼내기 (이후 틱은 항상 새로 요청)
+
+        파이프라인 사용 시에는 파이프라인 단계가 요청을 처리하므로 쓰지 않는다.
+        """
+        prefetch, self.prefetch = self.prefetch, None
+        if prefetch is None or self.pipeline is not None:
+            return {}
+
+        prefetched = {}
+        for site, product_url in self.state.selected_products.items():
+            result = prefetch.pop(site, product_url)
+            if result:
+                prefetched[site] = result
+        if prefetched:
+            logger.info(
+                "선행 조회 결과 재사용: %s",
+                ", ".join(prefetched),
+                extra={"tracker": self.state.keyword},
+            )
+        return prefetched
+
+    def apply_result(self, site: str, result: PriceResult) -> bool:
+        """
+        조회 결과 검증 (오매칭 감지). 저장/콜백은 호출 측에서 한 번에 처리한다.
+
+        Returns:
+            상태가 바뀌었으면 True
+        """
+        changed = self._check_title_drift(site, result)
+
         old_price = self.state.last_prices.get(site)
 
         # 가격 급변 체크
         if old_price and Normalizer.check_abnormal_price_change(
             old_price, result.price
         ):
-            print(f"[WARN] 가격 급변 감지 ({site}): {old_price} → {result.price}")
+            logger.warning(
+                "가격 급변 감지 (%s): %s → %s",
+                site,
+                old_price,
+                result.price,
+                extra={"tracker": self.state.keyword, "site": site},
+            )
             self.state.status = STATE_NEEDS_CONFIRMATION
-            self.state_store.save(self.state)
+            changed = True
+
+        return changed
+
+    def _check_title_drift(self, site: str, result: PriceResult) -> bool:
+        """최초 선택 상품명 서명과 비교해 다른 상품으로 바뀌었는지 확인"""
+        if not result.title:
+            return False
+
+        signature = self.state.title_signatures.get(site)
+        if not signature:
+            # 서명이 없던 기존 상태는 첫 조회 결과를 기준으로 삼는다
+            # (결과 반영과 함께 저장되므로 상태 변경으로 보지 않는다)
+            self.state.title_signatures[site] = Normalizer.title_signature(result.title)
+            return False
+
+        if Normalizer.check_signature_mismatch(signature, result.title):
+            logger.warning(
+                "상품명 변경 감지 (%s): %s",
+                site,
+                result.title,
+                extra={"tracker": self.state.keyword, "site": site},
+            )
+            self.state.status = STATE_NEEDS_CONFIRMATION
+            return True
 
-            if self.on_status_change:
-                self.on_status_change(self.state)
+        return False
 
-    def _handle_fetch_failure(self, site: str):
-        """크롤링 실패 처리"""
+    def apply_failure(self, site: str) -> bool:
+        """크롤링 실패 처리 (백오프 증가, 항상 상태 변경)"""
         self.state.increment_backoff()
 
         # 백오프 카운트가 임계값을 넘으면 차단 의심
         if self.state.backoff_count >= len(BACKOFF_DELAYS):
             self.state.status = STATE_BLOCKED_SUSPECTED
-            print(f"[WARN] 차단 의심 ({site})")
+            logger.warning(
+                "차단 의심 (%s)",
+                site,
+                extra={"tracker": self.state.keyword, "site": site},
+            )
+
+        return True
+
+    def apply_results(self, results: List[PriceResult]) -> bool:
+        """
+        성공한 조회 결과를 가격에 반영하고 백오프 초기화
 
-        self.state_store.save(self.state)
+        Returns:
+            반영할 결과가 있었으면 True
+        """
+        if not results:
+            return False
+
+        for result in results:
+            self.state.update_price(result.site, result.price, self._epoch())
+            # 다나와 product_url은 최저가 쇼핑몰 링크라 선택한 상품 URL로 집계
+            product_url = self.state.selected_products.get(
+                result.site, result.product_url
+            )
+            previous_low = self.price_index.all_time_low(product_url)
+            self.price_index.observe(result, product_url)
+            if previous_low is not None and result.price < previous_low:
+                logger.info(
+                    "역대 최저가 (%s): %s원",
+                    result.site,
+                    f"{result.price:,}",
+                    extra={"tracker": self.state.keyword, "site": result.site},
+                )
+
+        self.state.reset_backoff()
+        return True
+
+    def log_late(self, site: str):
+        """마감 초과는 사이트 이상이 아니므로 백오프하지 않고 다음 틱에 재시도"""
+        logger.warning(
+            "크롤링 마감 초과 (%s), late 처리",
+            site,
+            extra={"tracker": self.state.keyword, "site": site},
+        )
+
+    def crawl_completed(self):
+        """파이프라인 처리 완료 (백오프가 반영된 다음 크롤링 시각 재계산)
 
-        if self.on_status_change:
-            self.on_status_change(self.state)
+        처리 시간만큼 주기가 밀리지 않도록 틱 시작 시각을 기준으로 계산한다.
+        """
+        self.crawl_in_flight = False
+        self._check_status_alert()
+        self._schedule_next_crawl(self._crawl_started_at)
 
     def _notify_tick(self):
         """알림 발송"""
         # 상태가 정상이 아니면 알림 스킵
         if self.state.status != STATE_ACTIVE:
-            print(f"[INFO] 상태 비정상 ({self.state.status}), 알림 스킵")
+            logger.info("상태 비정상 (%s), 알림 스킵", self.state.status)
             return
 
         # 최신 가격 결과 수집
@@ -173,41 +384,137 @@ class Scheduler:
                         title=f"{self.state.keyword} ({site})",
                         price=price,
                         product_url=url,
-                        fetched_at=self.state.last_crawl_at
-                        or datetime.now().isoformat(),
+                        fetched_at=self.state.last_crawl_at or self._epoch(),
                     )
                 )
 
         if not results:
-            print("[WARN] 알림할 가격 정보 없음")
+            logger.warning("알림할 가격 정보 없음")
             return
 
         # 이메일 발송
         from notify.templates import create_price_alert_email
 
-        subject, body = create_price_alert_email(self.state.keyword, results)
+        history = {
+            r.product_url: self.price_index.history(r.product_url) for r in results
+        }
+        subject, body, html = create_price_alert_email(
+            self.state.keyword, results, history
+        )
+
+        def on_sent():
+            with self.state_lock:
+                self.state.update_notify(self._epoch())
+            for result in results:
+                self.price_index.mark_notified(result.product_url, result.price)
+            self._save_state()
+            logger.info("알림 발송 완료")
+
+        # 발송이 지연되는 동안 다음 알림이 생기면 대기 중인 메일을 최신 가격으로 교체
+        self._send_mail(
+            subject,
+            body,
+            PRIORITY_DIGEST,
+            ("digest", self.state.email, self.state.keyword),
+            on_sent,
+            html=html,
+        )
+
+    def _check_status_alert(self):
+        """상태가 비정상으로 바뀌었으면 상태 알림 발송 (정상 복귀 시 다시 알릴 수 있게 초기화)"""
+        status = self.state.status
+        if status == self._alerted_status:
+            return
+        self._alerted_status = status
+        if status == STATE_ACTIVE:
+            return
+
+        from notify.templates import create_status_alert_email
+
+        message = {
+            STATE_NEEDS_CONFIRMATION: "가격 변동이 크거나 상품명이 달라져 선택한 상품을 다시 확인해야 합니다.",
+            STATE_BLOCKED_SUSPECTED: "연속으로 가격 조회에 실패했습니다. 사이트 접속이 차단되었을 수 있습니다.",
+        }.get(status, "")
+        subject, body = create_status_alert_email(self.state.keyword, status, message)
+        self._send_mail(
+            subject,
+            body,
+            PRIORITY_STATUS,
+            ("status", self.state.email, self.state.keyword),
+        )
+
+    def _send_mail(
+        self,
+        subject: str,
+        body: str,
+        priority: int,
+        key: tuple,
+        on_sent: Optional[Callable[[], None]] = None,
+        html: Optional[str] = None,
+    ):
+        """발송 대기열이 있으면 넣고 (완료 시 on_sent), 없으면 바로 발송"""
+        if self.mail_scheduler is None:
+            with PROFILER.phase("notify"):
+                success = self.emailer.send(self.state.email, subject, body, html=html)
+            if success and on_sent:
+                on_sent()
+            return
+
+        def on_done(success: bool):
+            if success and on_sent:
+                on_sent()
+
+        future = self.mail_scheduler.submit(
+            self.emailer,
+            self.state.email,
+            subject,
+            body,
+            priority=priority,
+            key=key,
+            on_done=on_done,
+            html=html,
+        )
+        self.pending_mail = [f for f in self.pending_mail if not f.done()]
+        if future not in self.pending_mail:
+            self.pending_mail.append(future)
+
+    def wait_mail(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 발송 완료 대기 (작업자가 임대 반납 전에 알림 시각을 저장하도록)
+
+        Returns:
+            시간 안에 모두 끝났는지
+        """
+        done, not_done = wait(self.pending_mail, timeout)
+        self.pending_mail = list(not_done)
+        return not not_done
 
-        success = self.emailer.send(self.state.email, subject, body)
+    def _epoch(self) -> int:
+        """현재 시각 (epoch 초, 주입된 시계 기준)"""
+        return int(self.clock.time())
 
-        if success:
-            self.state.update_notify()
+    def _save_state(self):
+        """상태 저장 (프로파일링 persist 단계)"""
+        with PROFILER.phase("persist"), self.state_lock:
             self.state_store.save(self.state)
-            print("[INFO] 알림 발송 완료")
+            self.price_index.save_if_due()
 
-    def _schedule_next_crawl(self):
-        """다음 크롤링 시각 계산"""
+    def _schedule_next_crawl(self, since: Optional[datetime] = None):
+        """다음 크롤링 시각 계산 (since 기준, 기본값은 현재 시각)"""
         # 백오프 적용
         delay_minutes = self.state.crawl_interval
 
         if self.state.backoff_count > 0:
             backoff_idx = min(self.state.backoff_count - 1, len(BACKOFF_DELAYS) - 1)
             delay_minutes = BACKOFF_DELAYS[backoff_idx]
-            print(f"[INFO] 백오프 적용: {delay_minutes}분 대기")
+            logger.info("백오프 적용: %s분 대기", delay_minutes)
 
-        self.next_crawl_at = datetime.now() + timedelta(minutes=delay_minutes)
+        if since is None:
+            since = self.clock.now()
+        self.next_crawl_at = since + timedelta(minutes=delay_minutes)
 
     def _schedule_next_notify(self):
         """다음 알림 시각 계산"""
-        self.next_notify_at = datetime.now() + timedelta(
+        self.next_notify_at = self.clock.now() + timedelta(
             minutes=self.state.notify_interval
         )
@@ -0,0 +1,263 @@
+"""가상 시간 스케줄러 시뮬레이션
+
+수천 개 추적 대상을 가짜 스크래퍼/이메일 발송기와 가상 시계로 돌려
+호스트별 요청률, 이메일 발송 수, 시뮬레이션 하루당 스케줄러 CPU 비용을 측정한다.
+
+실행: python -m core.simulation --trackers 2000 --days 7 --crawl 15
+"""
+
+import argparse
+import heapq
+import logging
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.clock import VirtualClock
+from core.models import PriceResult, TrackingState
+from core.scheduler import Scheduler
+from config.constants import STATE_ACTIVE
+
+# 시뮬레이션 시작 시각 (고정값으로 재현성 확보)
+SIM_EPOCH = 1_767_225_600  # 2026-01-01 00:00 UTC
+
+
+class SimulationContext:
+    """현재 실행 중인 추적 대상의 가상 시계를 가짜 구성요소에 공유"""
+
+    def __init__(self):
+        self.clock: Optional[VirtualClock] = None
+
+
+class FakeScraper:
+    """네트워크 없이 가격을 돌려주는 스크래퍼 (요청 시각을 호스트별로 기록)"""
+
+    def __init__(
+        self,
+        site: str,
+        host: str,
+        context: SimulationContext,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.site = site
+        self.host = host
+        self.context = context
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.request_times: List[float] = []
+
+    def get_site_name(self) -> str:
+        return self.site
+
+    def search(self, keyword: str, limit: int = 10):
+        return []
+
+    def fetch(self, product_url: str) -> Optional[PriceResult]:
+        now = self.context.clock.time()
+        self.request_times.append(now)
+
+        if self.rng.random() < self.failure_rate:
+            return None
+
+        return PriceResult(
+            site=self.site,
+            title=product_url,
+            price=100_000 + self.rng.randrange(-2_000, 2_000),
+            product_url=product_url,
+            fetched_at=int(now),
+        )
+
+
+class FakeEmailer:
+    """발송 대신 개수만 세는 이메일 발송기"""
+
+    def __init__(self):
+        self.sent = 0
+        self.recipients: Counter = Counter()
+
+    def send(self, recipient: str, subject: str, body: str, html=None) -> bool:
+        self.sent += 1
+        self.recipients[recipient] += 1
+        return True
+
+
+class MemoryStateStore:
+    """디스크 I/O 없는 상태 저장소"""
+
+    def __init__(self):
+        self.saves = 0
+        self.state: Optional[TrackingState] = None
+
+    def save(self, state: TrackingState) -> bool:
+        self.saves += 1
+        self.state = state
+        return True
+
+    def load(self) -> Optional[TrackingState]:
+        return self.state
+
+    def delete(self) -> bool:
+        self.state = None
+        return True
+
+    def exists(self) -> bool:
+        return self.state is not None
+
+
+@dataclass
+class SimulationReport:
+    """시뮬레이션 결과"""
+
+    trackers: int
+    days: float
+    ticks: int
+    emails: int
+    state_saves: int
+    cpu_seconds: float
+    requests_per_host: Dict[str, int] = field(default_factory=dict)
+    peak_per_minute: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def cpu_per_day(self) -> float:
+        return self.cpu_seconds / self.days if self.days else 0.0
+
+    def summary(self) -> str:
+        minutes = self.days * 1440
+        lines = [
+            f"추적 대상: {self.trackers:,}개, 기간: {self.days:g}일, 틱: {self.ticks:,}회",
+            f"이메일 발송: {self.emails:,}통, 상태 저장: {self.state_saves:,}회",
+            f"스케줄러 CPU: {self.cpu_seconds:.2f}초 (하루당 {self.cpu_per_day:.2f}초)",
+        ]
+        for host, count in sorted(self.requests_per_host.items()):
+            lines.append(
+                f"{host}: 총 {count:,}회, 평균 {count / minutes:.2f}회/분, "
+                f"최대 {self.peak_per_minute.get(host, 0)}회/분"
+            )
+        return "\n".join(lines)
+
+
+def run_simulation(
+    trackers: int = 1000,
+    days: float = 7,
+    crawl_interval: int = 15,
+    notify_interval: int = 1440,
+    sites=("danawa", "gmarket"),
+    failure_rate: float = 0.0,
+    seed: int = 0,
+) -> SimulationReport:
+    """
+    가상 시간으로 스케줄러 실행
+
+    추적 대상마다 별도의 VirtualClock을 두어 한 대상의 지터 대기가
+    다른 대상의 시각을 밀지 않게 하고, 다음 실행 시각 순으로 틱을 처리한다.
+    """
+    hosts = {"danawa": "prod.danawa.com", "gmarket": "item.gmarket.co.kr"}
+    context = SimulationContext()
+    scrapers = {
+        site: FakeScraper(site, hosts.get(site, site), context, failure_rate, seed + i)
+        for i, site in enumerate(sites)
+    }
+    emailer = FakeEmailer()
+    rng = random.Random(seed)
+
+    schedulers: List[Scheduler] = []
+    stores: List[MemoryStateStore] = []
+    for i in range(trackers):
+        state = TrackingState(
+            keyword=f"product-{i}",
+            selected_sites=list(sites),
+            crawl_interval=crawl_interval,
+            notify_interval=notify_interval,
+            email=f"user{i % 100}@gmail.com",
+            selected_products={
+                site: f"https://{hosts.get(site, site)}/p/{i}" for site in sites
+            },
+            last_prices={},
+            last_crawl_at=None,
+            last_notify_at=None,
+            status=STATE_ACTIVE,
+        )
+        store = MemoryStateStore()
+        # 시작 시각을 크롤링 주기 안에서 분산 (동시 시작 폭주 방지)
+        clock = VirtualClock(SIM_EPOCH + rng.uniform(0, crawl_interval * 60))
+        scheduler = Scheduler(
+            state, store, scrapers, emailer, clock=clock, rng=random.Random(seed + i)
+        )
+        schedulers.append(scheduler)
+        stores.append(store)
+
+    end = SIM_EPOCH + days * 86400
+    heap = [(s.next_due().timestamp(), i) for i, s in enumerate(schedulers)]
+    heapq.heapify(heap)
+
+    # 틱마다 나오는 INFO 로그는 시뮬레이션 CPU 측정을 왜곡하므로 억제
+    scheduler_logger = logging.getLogger("core.scheduler")
+    previous_level = scheduler_logger.level
+    scheduler_logger.setLevel(logging.WARNING)
+
+    ticks = 0
+    cpu_start = time.process_time()
+    try:
+        while heap:
+            due, i = heapq.heappop(heap)
+            if due >= end:
+                break
+
+            scheduler = schedulers[i]
+            scheduler.clock.advance_to(due)
+            context.clock = scheduler.clock
+            scheduler.run_pending()
+            ticks += 1
+
+            heapq.heappush(heap, (scheduler.next_due().timestamp(), i))
+    finally:
+        scheduler_logger.setLevel(previous_level)
+    cpu_seconds = time.process_time() - cpu_start
+
+    requests_per_host: Dict[str, int] = {}
+    peak_per_minute: Dict[str, int] = {}
+    for scraper in scrapers.values():
+        per_minute = defaultdict(int)
+        for t in scraper.request_times:
+            per_minute[int(t // 60)] += 1
+        requests_per_host[scraper.host] = len(scraper.request_times)
+        peak_per_minute[scraper.host] = max(per_minute.values(), default=0)
+
+    return SimulationReport(
+        trackers=trackers,
+        days=days,
+        ticks=ticks,
+        emails=emailer.sent,
+        state_saves=sum(store.saves for store in stores),
+        cpu_seconds=cpu_seconds,
+        requests_per_host=requests_per_host,
+        peak_per_minute=peak_per_minute,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가상 시간 스케줄러 시뮬레이션")
+    parser.add_argument("--trackers", type=int, default=1000)
+    parser.add_argument("--days", type=float, default=7)
+    parser.add_argument("--crawl", type=int, default=15, help="크롤링 주기 (분)")
+    parser.add_argument("--notify", type=int, default=1440, help="알림 주기 (분)")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = run_simulation(
+        trackers=args.trackers,
+        days=args.days,
+        crawl_interval=args.crawl,
+        notify_interval=args.notify,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,168 @@
-"""최소 상태 저장/로드 (JSON 기반)"""
+"""최소 상태 저장/로드 (기본 JSON, 코덱 교체 가능)
 
-import json
+파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로, 여러 추적 대상을
+save_many로 저장할 때도 전부 반영되거나 전혀 반영되지 않는다.
+
+한 파일에 여러 추적 대상(UI, 일괄 등록, 작업자 코디네이터 내보내기)이 함께
+저장되므로 save/merge_many는 파일을 읽어 (키워드, 이메일)이 같은 대상만 교체하고
+나머지는 그대로 다시 쓴다. 읽기-병합-쓰기 구간은 프로세스 간 잠금 파일
+(POSIX flock, 없으면 프로세스 내 잠금만)으로 보호한다.
+"""
+
+import logging
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 from core.models import TrackingState
+from core.codec import Codec, JsonCodec, loads_many
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def state_key(state: TrackingState) -> tuple:
+    """상태 파일 안의 추적 대상 식별자"""
+    return state.keyword, state.email
 
 
 class StateStore:
     """상태 저장소 (가격 히스토리는 저장하지 않음)"""
 
-    def __init__(self, filepath: str = "data/state.json"):
+    def __init__(
+        self, filepath: str = "data/state.json", codec: Optional[Codec] = None
+    ):
+        """
+        Args:
+            filepath: 상태 파일 경로
+            codec: 저장 코덱 (기본: 사람이 읽을 수 있는 JSON, 로드는 포맷 자동 판별)
+        """
         self.filepath = Path(filepath)
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or JsonCodec(indent=2)
+        self._lock = threading.Lock()
 
     def save(self, state: TrackingState) -> bool:
-        """상태 저장"""
+        """상태 저장 (같은 추적 대상만 교체, 파일의 다른 대상은 유지)"""
+        return self.merge_many([state])
+
+    def merge_many(self, states: Iterable[TrackingState]) -> bool:
+        """여러 추적 대상을 기존 내용에 병합 저장 (같은 키는 교체, 나머지 유지)"""
+        try:
+            with self._locked():
+                merged = {state_key(s): s for s in self._read_all()}
+                merged.update({state_key(s): s for s in states})
+                self._write_states(list(merged.values()))
+            return True
+        except Exception as e:
+            logger.error("상태 저장 실패: %s", e)
+            return False
+
+    def merge_runtime(self, states: Iterable[TrackingState]) -> bool:
+        """
+        다른 곳(작업자 큐)에서 실행한 결과만 병합 저장
+
+        파일에 이미 있는 대상은 가격/시각/상태(RUNTIME_FIELDS)만 바꾸고 이메일,
+        주기, 선택 상품 같은 설정은 파일(UI에서 고친 값) 그대로 둔다.
+        파일에 없는 대상은 통째로 추가한다.
+        """
         try:
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump(state.to_dict(), f, indent=2, ensure_ascii=False)
+            with self._locked():
+                merged = {state_key(s): s for s in self._read_all()}
+                for state in states:
+                    current = merged.get(state_key(state))
+                    if current is None:
+                        merged[state_key(state)] = state
+                    else:
+                        current.copy_runtime(state)
+                self._write_states(list(merged.values()))
             return True
         except Exception as e:
-            print(f"[ERROR] 상태 저장 실패: {e}")
+            logger.error("상태 저장 실패: %s", e)
             return False
 
-    def load(self) -> Optional[TrackingState]:
-        """상태 로드"""
+    def save_many(self, states: Iterable[TrackingState]) -> bool:
+        """여러 추적 대상을 한 번에 저장 (원자적 교체, 기존 내용은 대체)"""
+        try:
+            with self._locked():
+                self._write(self.codec.encode_many(list(states)))
+            return True
+        except Exception as e:
+            logger.error("상태 일괄 저장 실패: %s", e)
+            return False
+
+    @contextmanager
+    def _locked(self):
+        """읽기-병합-쓰기 구간 잠금 (프로세스 내 + 가능하면 프로세스 간)"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            lock_path = self.filepath.with_name(self.filepath.name + ".lock")
+            with open(lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_all(self) -> List[TrackingState]:
+        """저장된 모든 추적 대상 (파일이 없으면 빈 목록, 읽기 오류는 예외)"""
         if not self.filepath.exists():
+            return []
+        with open(self.filepath, "rb") as f:
+            return loads_many(f.read(), TrackingState)
+
+    def _write_states(self, states: List[TrackingState]):
+        """병합한 추적 대상 쓰기 (하나면 기존 단일 객체 포맷 유지)"""
+        if len(states) == 1:
+            self._write(self.codec.encode(states[0]))
+        else:
+            self._write(self.codec.encode_many(states))
+
+    def _write(self, raw: bytes):
+        """임시 파일에 쓰고 교체 (중간에 실패해도 기존 파일 유지)"""
+        tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+
+    def load(
+        self, keyword: Optional[str] = None, email: Optional[str] = None
+    ) -> Optional[TrackingState]:
+        """
+        추적 대상 1개 로드
+
+        keyword/email을 주면 그 대상, 없으면 가장 최근에 크롤링한 대상을 반환한다.
+        파일의 다른 대상은 그대로 남아 있다 (전체는 load_all).
+        """
+        states = self.load_all()
+        if keyword is not None or email is not None:
+            states = [
+                s
+                for s in states
+                if keyword in (None, s.keyword) and email in (None, s.email)
+            ]
+        if not states:
             return None
+        if len(states) > 1:
+            logger.info("상태 파일에 추적 대상 %d개, 가장 최근 대상 로드", len(states))
+        return max(states, key=lambda s: s.last_crawl_at or 0)
+
+    def load_all(self) -> List[TrackingState]:
+        """저장된 모든 추적 대상 로드 (단일 상태 파일이면 1개)"""
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return TrackingState.from_dict(data)
+            return self._read_all()
         except Exception as e:
-            print(f"[ERROR] 상태 로드 실패: {e}")
-            return None
+            logger.error("상태 로드 실패: %s", e)
+            return []
 
     def delete(self) -> bool:
         """상태 삭제"""
@@ -43,7 +171,7 @@ class StateStore:
                 os.remove(self.filepath)
             return True
         except Exception as e:
-            print(f"[ERROR] 상태 삭제 실패: {e}")
+            logger.error("상태 삭제 실패: %s", e)
             return False
 
     def exists(self) -> bool:
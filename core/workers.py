@@ -0,0 +1,450 @@
+"""다중 프로세스 크롤링 작업자와 코디네이터
+
+코디네이터는 상태 파일의 추적 대상을 LeaseQueue(SQLite)에 올리고 작업자 프로세스를
+띄운 뒤, 주기적으로 큐의 최신 상태를 상태 파일로 내보낸다. 작업자는 실행 시각이 된
+추적 대상을 임대해 Scheduler 틱 한 번(크롤링/알림)을 실행하고 다음 실행 시각을 기록한다.
+다른 호스트에서는 같은 DB 파일을 가리키는 작업자만 따로 띄우면 된다.
+
+작업자는 처리 수(WORKER_MAX_TASKS)나 RSS(WORKER_MAX_RSS_MB) 한도를 넘으면
+진행 중인 대상만 마치고 재시작 종료 코드로 끝나며, 코디네이터(또는 worker 명령)가
+새 프로세스로 교체한다. 파싱으로 단편화된 힙은 프로세스를 바꿔야 돌려받을 수 있다.
+
+    python -m core.workers coordinator --workers 4
+    python -m core.workers worker --db /shared/queue.db
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Set
+
+from core.clock import SYSTEM_CLOCK, Clock
+from core.lease_queue import LeaseQueue
+from core.memory import MemoryWatermark
+from core.metrics import WORKER_RECYCLES
+from core.models import TrackingState
+from core.scheduler import Scheduler
+from core.state_store import StateStore
+from notify.mail_scheduler import MAIL_SCHEDULER
+from config.constants import (
+    LEASE_DB_PATH,
+    LEASE_SECONDS,
+    LEASE_HEARTBEAT,
+    WORKER_THREADS,
+    WORKER_POLL_INTERVAL,
+    WORKER_MAX_TASKS,
+    WORKER_MAX_RSS_MB,
+    COORDINATOR_EXPORT_INTERVAL,
+    SMTP_USER_ENV,
+    SMTP_PASSWORD_ENV,
+    WARM_UP_ON_START,
+)
+
+logger = logging.getLogger(__name__)
+
+# 한도 도달로 스스로 끝난 작업자의 종료 코드 (이 코드로 끝난 작업자만 재시작)
+RECYCLE_EXIT_CODES = {"memory": 3, "tasks": 4}
+
+
+class LeasedStateStore:
+    """Scheduler가 쓰는 저장소 인터페이스를 임대 큐 저장으로 연결"""
+
+    def __init__(
+        self,
+        queue: LeaseQueue,
+        owner: str,
+        tracker_id: str,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        self.queue = queue
+        self.owner = owner
+        self.tracker_id = tracker_id
+        self.clock = clock
+
+    def save(self, state: TrackingState) -> bool:
+        saved = self.queue.save(self.owner, self.tracker_id, state, self.clock.time())
+        if not saved:
+            logger.warning(
+                "임대를 잃어 상태 저장 생략", extra={"tracker": state.keyword}
+            )
+        return saved
+
+
+class NullEmailer:
+    """발신 계정이 설정되지 않은 작업자의 이메일 발송기 (발송하지 않음)"""
+
+    # Emailer와 같은 속성 (발송 대기열이 계정 구분/지표 레이블에 사용)
+    sender_email = ""
+    domain = "none"
+    smtp_config: dict = {}
+
+    def send(
+        self, recipient: str, subject: str, body: str, html: Optional[str] = None
+    ) -> bool:
+        logger.warning("발신 계정 미설정 (%s), 알림 생략", SMTP_USER_ENV)
+        return False
+
+
+class LeaseWorker:
+    """임대 큐에서 추적 대상을 가져와 처리하는 작업자"""
+
+    def __init__(
+        self,
+        queue: LeaseQueue,
+        scrapers: dict,
+        emailer,
+        owner: Optional[str] = None,
+        threads: int = WORKER_THREADS,
+        lease_seconds: float = LEASE_SECONDS,
+        clock: Optional[Clock] = None,
+        max_tasks: int = WORKER_MAX_TASKS,
+        max_rss_mb: int = WORKER_MAX_RSS_MB,
+    ):
+        """
+        Args:
+            queue: 임대 큐
+            scrapers: 사이트별 스크래퍼
+            emailer: 이메일 발송기
+            owner: 임대 소유자 이름 (기본: 호스트명-pid-임의값)
+            threads: 동시에 처리할 추적 대상 수
+            lease_seconds: 임대 유효 시간 (heartbeat로 연장)
+            clock: 시계 (임대 시각 계산에도 사용, 모든 작업자가 같은 시계여야 함)
+            max_tasks: 이만큼 처리하면 재시작 요청 (0이면 무제한)
+            max_rss_mb: RSS가 이를 넘으면 재시작 요청 (0이면 무제한)
+        """
+        self.queue = queue
+        self.scrapers = scrapers
+        self.emailer = emailer
+        self.owner = owner or (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        )
+        self.threads = threads
+        self.lease_seconds = lease_seconds
+        self.clock = clock or SYSTEM_CLOCK
+        self.max_tasks = max_tasks
+        self.max_rss = max_rss_mb * 2**20
+        self.memory = MemoryWatermark(self.owner)
+        # 한도를 넘어 재시작이 필요하면 사유 (memory | tasks)
+        self.recycle_reason: Optional[str] = None
+
+        self.processed = 0
+        self._active: Set[str] = set()
+        self._active_lock = threading.Lock()
+        self._slot_free = threading.Event()
+
+    def run(self, stop_event=None, max_idle: Optional[float] = None):
+        """
+        작업 루프
+
+        Args:
+            stop_event: set되면 진행 중인 대상만 마치고 종료
+            max_idle: 이 시간(초) 동안 처리할 대상이 없으면 종료 (기본: 무한)
+        """
+        stop_event = stop_event or threading.Event()
+        # 재시작 종료 시 공유 stop_event를 건드리지 않도록 heartbeat는 별도 이벤트로 멈춘다
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop, args=(finished,), daemon=True
+        )
+        heartbeat.start()
+        logger.info("작업자 시작: %s", self.owner)
+
+        idle_since = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="worker")
+        try:
+            while not stop_event.is_set():
+                self.recycle_reason = self._recycle_reason()
+                if self.recycle_reason:
+                    break
+
+                with self._active_lock:
+                    free = self.threads - len(self._active)
+                leased = self.queue.lease(
+                    self.owner, free, self.lease_seconds, self.clock.time()
+                )
+
+                for tracker_id, state, crawl_at in leased:
+                    # 제출 전에 등록해야 빨리 끝난 작업의 제거와 순서가 꼬이지 않는다
+                    with self._active_lock:
+                        self._active.add(tracker_id)
+                    pool.submit(self._process, tracker_id, state, crawl_at)
+
+                if leased:
+                    idle_since = time.monotonic()
+                    continue
+
+                if free <= 0:
+                    # 모든 슬롯 사용 중: 하나가 끝나면 바로 다음 대상을 임대
+                    self._slot_free.wait(WORKER_POLL_INTERVAL)
+                    self._slot_free.clear()
+                    idle_since = time.monotonic()
+                    continue
+
+                with self._active_lock:
+                    busy = bool(self._active)
+                if busy:
+                    idle_since = time.monotonic()
+                elif max_idle is not None and time.monotonic() - idle_since > max_idle:
+                    break
+                stop_event.wait(WORKER_POLL_INTERVAL)
+        finally:
+            pool.shutdown(wait=True)
+            finished.set()
+            released = self.queue.release(self.owner)
+            self.memory.sample()
+            logger.info(
+                "작업자 종료: %s (처리 %d, 반납 %d, %s)",
+                self.owner,
+                self.processed,
+                released,
+                self.memory.summary(),
+            )
+            self.memory.close()
+
+    def _recycle_reason(self) -> Optional[str]:
+        """처리 수/메모리 한도를 넘었으면 재시작 사유"""
+        if self.max_tasks and self.processed >= self.max_tasks:
+            return "tasks"
+        rss = self.memory.sample()
+        if self.max_rss and rss > self.max_rss:
+            return "memory"
+        return None
+
+    def _heartbeat_loop(self, finished):
+        interval = min(LEASE_HEARTBEAT, self.lease_seconds / 3)
+        while not finished.wait(interval):
+            with self._active_lock:
+                active = list(self._active)
+            owned = set(
+                self.queue.heartbeat(
+                    self.owner, active, self.lease_seconds, self.clock.time()
+                )
+            )
+            for tracker_id in active:
+                if tracker_id not in owned:
+                    logger.warning("임대 만료 (%s), 결과는 반영되지 않음", tracker_id)
+
+    def _process(self, tracker_id: str, state: TrackingState, crawl_at: float):
+        """
+        추적 대상 1개의 틱 실행 후 다음 실행 시각 기록
+
+        알림만 할 시각에 깨어난 경우에도 크롤링하지 않도록, 크롤링은 큐에 기록된
+        다음 크롤링 시각(crawl_at)이 지났을 때만 한다.
+        """
+        try:
+            # 임대 직후 다시 확인 (임대 획득과 실행 사이에 만료되면 중복 크롤링 방지)
+            if not self.queue.heartbeat(
+                self.owner, [tracker_id], self.lease_seconds, self.clock.time()
+            ):
+                return
+
+            scheduler = Scheduler(
+                state,
+                LeasedStateStore(self.queue, self.owner, tracker_id, self.clock),
+                self.scrapers,
+                self.emailer,
+                clock=self.clock,
+                # 발신 계정이 없으면 대기열/한도 없이 바로 생략
+                mail_scheduler=(
+                    None if isinstance(self.emailer, NullEmailer) else MAIL_SCHEDULER
+                ),
+            )
+            # 크롤링은 큐에 기록된 시각(백오프 반영), 알림은 마지막 발송 기준으로 재계산
+            scheduler.next_crawl_at = datetime.fromtimestamp(crawl_at)
+            if state.last_notify_at:
+                scheduler.next_notify_at = datetime.fromtimestamp(
+                    state.last_notify_at
+                ) + timedelta(minutes=state.notify_interval)
+            scheduler.run_pending()
+            # 발송 완료 콜백이 알림 시각을 기록하므로 임대 반납 전에 기다린다
+            # (한도 초과로 더 지연되면 다음 실행에서 같은 key로 합쳐진다)
+            scheduler.wait_mail(self.lease_seconds / 2)
+
+            due_at = scheduler.next_due().timestamp()
+            crawl_at = scheduler.next_crawl_at.timestamp()
+            if self.queue.complete(self.owner, tracker_id, state, due_at, crawl_at):
+                with self._active_lock:
+                    self.processed += 1
+        except Exception as e:
+            logger.error(
+                "추적 대상 처리 실패 (%s): %s",
+                tracker_id,
+                e,
+                extra={"tracker": state.keyword},
+            )
+        finally:
+            with self._active_lock:
+                self._active.discard(tracker_id)
+            self._slot_free.set()
+
+
+def _default_scrapers() -> dict:
+    from scrapers.registry import SITE_REGISTRY
+
+    return SITE_REGISTRY.scrapers()
+
+
+def _default_emailer():
+    user = os.environ.get(SMTP_USER_ENV)
+    password = os.environ.get(SMTP_PASSWORD_ENV)
+    if not user or not password:
+        return NullEmailer()
+
+    from notify.emailer import Emailer
+
+    return Emailer(user, password)
+
+
+def worker_main(db_path: str, threads: int = WORKER_THREADS, stop_event=None):
+    """작업자 프로세스 진입점 (multiprocessing 대상, 한도 도달 시 재시작 종료 코드)"""
+    from config.logging_config import setup_logging
+
+    setup_logging()
+    scrapers = _default_scrapers()
+    queue = LeaseQueue(db_path)
+    if WARM_UP_ON_START:
+        from scrapers.base import warm_up_all
+
+        # 첫 임대 배치 전에 연결/쿠키를 준비 (재시작된 작업자도 첫 요청이 느리지 않게)
+        # 큐의 추적 대상이 쓰는 사이트만 예열해 나머지 사이트는 만들지 않는다
+        sites = {site for state in queue.states() for site in state.selected_products}
+        warm_up_all(scrapers, background=False, sites=sites)
+    worker = LeaseWorker(queue, scrapers, _default_emailer(), threads=threads)
+    worker.run(stop_event)
+    if worker.recycle_reason:
+        logger.info("작업자 재시작 요청 (%s): %s", worker.recycle_reason, worker.owner)
+        sys.exit(RECYCLE_EXIT_CODES[worker.recycle_reason])
+
+
+def _spawn_worker(index: int, db_path: str, threads: int, stop_event):
+    process = multiprocessing.Process(
+        target=worker_main,
+        args=(db_path, threads, stop_event),
+        name=f"price-alert-worker-{index}",
+    )
+    process.start()
+    return process
+
+
+def _replace_recycled(processes: list, db_path: str, threads: int, stop_event):
+    """한도 도달로 끝난 작업자를 새 프로세스로 교체 (그 밖의 종료는 그대로 둠)"""
+    if stop_event.is_set():
+        return
+    reasons = {code: reason for reason, code in RECYCLE_EXIT_CODES.items()}
+    for index, process in enumerate(processes):
+        if process.is_alive() or process.exitcode not in reasons:
+            continue
+        WORKER_RECYCLES.inc(reason=reasons[process.exitcode])
+        logger.info("작업자 교체 (%s): %s", reasons[process.exitcode], process.name)
+        processes[index] = _spawn_worker(index, db_path, threads, stop_event)
+
+
+class Coordinator:
+    """상태 파일 ↔ 임대 큐 동기화와 작업자 프로세스 관리"""
+
+    def __init__(self, queue: LeaseQueue, store: StateStore):
+        self.queue = queue
+        self.store = store
+
+    def sync(self) -> int:
+        """상태 파일의 추적 대상을 큐에 반영 (새 대상 등록, 바뀐 설정 갱신)"""
+        added, updated = self.queue.sync(self.store.load_all())
+        logger.info("임대 큐 동기화: %d개 추가, %d개 설정 갱신", added, updated)
+        return added
+
+    def export(self) -> bool:
+        """
+        큐의 실행 결과를 상태 파일에 병합
+
+        설정은 상태 파일(UI에서 고친 값)을 기준으로 하고 가격/시각/상태만 내보낸다.
+        큐에 없는 UI 추적 대상은 유지한다.
+        """
+        return self.store.merge_runtime(self.queue.states())
+
+    def run(self, workers: int, threads: int = WORKER_THREADS):
+        """작업자 프로세스를 띄우고 종료(Ctrl+C)까지 처리량을 기록"""
+        self.sync()
+        db_path = str(self.queue.db_path)
+        stop_event = multiprocessing.Event()
+        processes = [
+            _spawn_worker(i, db_path, threads, stop_event) for i in range(workers)
+        ]
+
+        last = self.queue.stats()
+        last_export = time.monotonic()
+        try:
+            while True:
+                time.sleep(WORKER_POLL_INTERVAL)
+                _replace_recycled(processes, db_path, threads, stop_event)
+                if not any(p.is_alive() for p in processes):
+                    break
+                if time.monotonic() - last_export < COORDINATOR_EXPORT_INTERVAL:
+                    continue
+
+                last_export = time.monotonic()
+                stats = self.queue.stats()
+                rate = (stats["crawls"] - last["crawls"]) / COORDINATOR_EXPORT_INTERVAL
+                logger.info(
+                    "처리량 %.2f건/초 (대기 %d, 임대 %d, 전체 %d)",
+                    rate,
+                    stats["due"],
+                    stats["leased"],
+                    stats["total"],
+                )
+                last = stats
+                self.export()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop_event.set()
+            for process in processes:
+                process.join()
+            self.export()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다중 프로세스 크롤링 작업자")
+    parser.add_argument("--db", default=LEASE_DB_PATH, help="임대 큐 SQLite 경로")
+    parser.add_argument("--threads", type=int, default=WORKER_THREADS)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_coord = sub.add_parser("coordinator", help="큐 동기화 + 작업자 실행")
+    p_coord.add_argument("--state", default="data/state.json", help="상태 파일 경로")
+    p_coord.add_argument("--workers", type=int, default=2, help="작업자 프로세스 수")
+
+    sub.add_parser("worker", help="작업자만 실행 (다른 호스트에서)")
+
+    args = parser.parse_args()
+    if args.command == "worker":
+        # 한도 도달로 끝나면 같은 자리에서 새 작업자 프로세스로 교체
+        stop_event = multiprocessing.Event()
+        processes = [_spawn_worker(0, args.db, args.threads, stop_event)]
+        try:
+            while True:
+                processes[0].join(WORKER_POLL_INTERVAL)
+                _replace_recycled(processes, args.db, args.threads, stop_event)
+                if not processes[0].is_alive():
+                    break
+        except KeyboardInterrupt:
+            stop_event.set()
+            processes[0].join()
+        return
+
+    from config.logging_config import setup_logging
+
+    setup_logging()
+    Coordinator(LeaseQueue(args.db), StateStore(args.state)).run(
+        args.workers, args.threads
+    )
+
+
+if __name__ == "__main__":
+    main()
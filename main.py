@@ -1,11 +1,23 @@
 """최저가 알림이 프로그램 엔트리 포인트"""
 
+import os
 import tkinter as tk
 from ui.app import PriceAlertApp
+from core.metrics import start_metrics_server
+from core.profiling import PROFILER
+from config.logging_config import setup_logging
+from config.constants import METRICS_PORT_ENV
 
 
 def main():
     """메인 함수"""
+    setup_logging()
+    PROFILER.install_signal_handler()
+
+    metrics_port = os.environ.get(METRICS_PORT_ENV)
+    if metrics_port:
+        start_metrics_server(int(metrics_port))
+
     root = tk.Tk()
     app = PriceAlertApp(root)
     app.run()
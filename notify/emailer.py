@@ -1,18 +1,37 @@
 """이메일 발송 (SMTP 기반)"""
 
+import logging
 import smtplib
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
+from core.metrics import EMAIL_SENDS, EMAIL_SECONDS
+
+logger = logging.getLogger(__name__)
 
 
 class Emailer:
     """이메일 발송 클래스"""
 
     # SMTP 설정 (도메인별)
+    # per_minute/burst/per_day: 발신 계정당 발송 한도 (notify.mail_scheduler가 사용,
+    # 제공자 공개 한도보다 보수적으로 잡아 계정 일시 제한을 피한다)
     SMTP_CONFIG = {
-        "gmail.com": {"host": "smtp.gmail.com", "port": 587},
-        "naver.com": {"host": "smtp.naver.com", "port": 587},
+        "gmail.com": {
+            "host": "smtp.gmail.com",
+            "port": 587,
+            "per_minute": 20,
+            "burst": 10,
+            "per_day": 400,
+        },
+        "naver.com": {
+            "host": "smtp.naver.com",
+            "port": 587,
+            "per_minute": 10,
+            "burst": 5,
+            "per_day": 300,
+        },
     }
 
     def __init__(self, sender_email: str, sender_password: str):
@@ -29,28 +48,49 @@ class Emailer:
         if domain not in self.SMTP_CONFIG:
             raise ValueError(f"지원하지 않는 이메일 도메인: {domain}")
 
+        self.domain = domain
         self.smtp_config = self.SMTP_CONFIG[domain]
 
-    def send(self, recipient: str, subject: str, body: str) -> bool:
+    def send(
+        self, recipient: str, subject: str, body: str, html: Optional[str] = None
+    ) -> bool:
         """
         이메일 발송
 
         Args:
             recipient: 수신자 이메일
             subject: 제목
-            body: 본문
+            body: 본문 (텍스트)
+            html: HTML 본문 (있으면 텍스트와 함께 multipart/alternative로 발송)
 
         Returns:
             성공 여부
         """
+        start = time.perf_counter()
+        success = self._send(recipient, subject, body, html)
+
+        outcome = "ok" if success else "error"
+        EMAIL_SENDS.inc(domain=self.domain, outcome=outcome)
+        EMAIL_SECONDS.observe(
+            time.perf_counter() - start, domain=self.domain, outcome=outcome
+        )
+        return success
+
+    def _send(
+        self, recipient: str, subject: str, body: str, html: Optional[str] = None
+    ) -> bool:
+        """SMTP 발송 본체"""
         try:
             # 메시지 생성
-            msg = MIMEMultipart()
+            msg = MIMEMultipart("alternative" if html else "mixed")
             msg["From"] = self.sender_email
             msg["To"] = recipient
             msg["Subject"] = subject
 
             msg.attach(MIMEText(body, "plain", "utf-8"))
+            if html:
+                # 메일 클라이언트는 마지막(가장 풍부한) 대안을 우선 표시
+                msg.attach(MIMEText(html, "html", "utf-8"))
 
             # SMTP 연결 및 발송
             with smtplib.SMTP(
@@ -60,17 +100,17 @@ class Emailer:
                 server.login(self.sender_email, self.sender_password)
                 server.send_message(msg)
 
-            print(f"[INFO] 이메일 발송 성공: {recipient}")
+            logger.info("이메일 발송 성공: %s", recipient)
             return True
 
         except smtplib.SMTPAuthenticationError:
-            print("[ERROR] 이메일 인증 실패 (앱 비밀번호를 확인하세요)")
+            logger.error("이메일 인증 실패 (앱 비밀번호를 확인하세요)")
             return False
         except smtplib.SMTPException as e:
-            print(f"[ERROR] 이메일 발송 실패 (SMTP): {e}")
+            logger.error("이메일 발송 실패 (SMTP): %s", e)
             return False
         except Exception as e:
-            print(f"[ERROR] 이메일 발송 실패: {e}")
+            logger.error("이메일 발송 실패: %s", e)
             return False
 
     @staticmethod
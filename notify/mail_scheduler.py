@@ -0,0 +1,308 @@
+"""발신 계정별 이메일 발송 속도 조절 (우선순위 + 한도 초과 시 지연 발송)
+
+Gmail/네이버 SMTP는 짧은 시간에 많이 보내면 계정을 일시 제한하고, 그 뒤로는
+모든 발송이 실패한다. 발신 계정마다 분당/일일 토큰 버킷(Emailer.SMTP_CONFIG의
+도메인별 한도)을 두고, 한도를 넘는 메일은 버리지 않고 대기열에 남겨 토큰이
+생기면 보낸다.
+
+- 우선순위: 상태 알림(PRIORITY_STATUS)이 정기 가격 알림(PRIORITY_DIGEST)보다 먼저
+- 같은 key의 메일이 아직 대기 중이면 내용만 최신으로 바꾼다 (지연 중 중복 알림 방지)
+- 발송 실패는 MAIL_RETRY_DELAYS 간격으로 재시도한 뒤 실패로 끝낸다
+- 발송은 전용 스레드 1개가 순서대로 처리한다 (계정 한도 안에서는 SMTP 연결이 병목)
+"""
+
+import bisect
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from core.metrics import EMAIL_DEFERRALS
+from core.rate_limit import TokenBucket
+from config.constants import MAIL_RETRY_DELAYS
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_STATUS = 0  # 상태 알림 (차단 의심, 재확인 필요 등)
+PRIORITY_DIGEST = 1  # 정기 가격 알림
+
+
+@dataclass
+class MailJob:
+    """대기 중인 메일 1통"""
+
+    priority: int
+    seq: int
+    emailer: object
+    recipient: str
+    subject: str
+    body: str
+    html: Optional[str] = None
+    key: Optional[Hashable] = None
+    on_done: Optional[Callable[[bool], None]] = None
+    future: Future = field(default_factory=Future)
+    attempts: int = 0
+    not_before: float = 0.0  # 재시도 대기 (monotonic)
+    deferred: bool = False  # 한도 초과로 미뤄진 적이 있는지 (지표/로그 1회용)
+
+    @property
+    def order(self) -> Tuple[int, int]:
+        return self.priority, self.seq
+
+
+class _Account:
+    """발신 계정 1개의 분당/일일 한도"""
+
+    def __init__(self, config: dict, clock: Callable[[], float]):
+        per_minute = config.get("per_minute", 20)
+        per_day = config.get("per_day", 500)
+        self.minute = TokenBucket(per_minute / 60, config.get("burst", 5), clock)
+        self.day = TokenBucket(per_day / 86400, per_day, clock)
+
+    def wait_time(self) -> float:
+        return max(self.minute.wait_time(), self.day.wait_time())
+
+    def take(self):
+        self.minute.try_acquire()
+        self.day.try_acquire()
+
+
+class MailScheduler:
+    """계정별 한도와 우선순위를 지키는 발송 대기열"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._pending: List[MailJob] = []  # (priority, seq) 순 정렬
+        self._by_key: Dict[Hashable, MailJob] = {}
+        self._accounts: Dict[str, _Account] = {}
+        self._failed: List[Tuple[MailJob, Exception]] = []  # 발송 전 오류난 메일
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def submit(
+        self,
+        emailer,
+        recipient: str,
+        subject: str,
+        body: str,
+        priority: int = PRIORITY_DIGEST,
+        key: Optional[Hashable] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+        html: Optional[str] = None,
+    ) -> Future:
+        """
+        발송 요청 (즉시 반환)
+
+        Args:
+            emailer: 발신 계정의 Emailer (send/sender_email/smtp_config)
+            priority: PRIORITY_STATUS | PRIORITY_DIGEST
+            key: 같은 key가 대기 중이면 그 메일의 내용을 교체
+            on_done: 발송 완료(성공 여부) 콜백, 발송 스레드에서 호출
+            html: HTML 본문 (body와 함께 multipart/alternative로 발송)
+
+        Returns:
+            발송 성공 여부를 담는 Future
+        """
+        with self._cond:
+            job = self._by_key.get(key) if key is not None else None
+            if job is not None:
+                job.subject, job.body, job.html = subject, body, html
+                job.on_done = on_done
+                if priority < job.priority:
+                    self._pending.remove(job)
+                    job.priority = priority
+                    self._insert(job)
+                return job.future
+
+            job = MailJob(
+                priority=priority,
+                seq=next(self._seq),
+                emailer=emailer,
+                recipient=recipient,
+                subject=subject,
+                body=body,
+                html=html,
+                key=key,
+                on_done=on_done,
+            )
+            self._insert(job)
+            if key is not None:
+                self._by_key[key] = job
+            self._ensure_thread()
+            self._cond.notify()
+        return job.future
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def stop(self, timeout: Optional[float] = None):
+        """발송 스레드 종료 (대기 중인 메일은 남는다)"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _insert(self, job: MailJob):
+        keys = [j.order for j in self._pending]
+        self._pending.insert(bisect.bisect(keys, job.order), job)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="mail-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def _account(self, emailer) -> _Account:
+        account = self._accounts.get(emailer.sender_email)
+        if account is None:
+            account = self._accounts[emailer.sender_email] = _Account(
+                emailer.smtp_config, self.clock
+            )
+        return account
+
+    def _next_job(self) -> Tuple[Optional[MailJob], float]:
+        """
+        지금 보낼 수 있는 가장 높은 우선순위 메일을 꺼내고 토큰 차감 (잠금 안에서 호출)
+
+        한도에 걸린 계정의 메일은 건너뛰므로 다른 계정 메일이 막히지 않는다.
+        발신 계정 정보를 읽을 수 없는 메일은 대기열에서 빼 _failed로 옮긴다.
+
+        Returns:
+            (메일 또는 None, 없으면 다음 확인까지 대기 시간)
+        """
+        now = self.clock()
+        wait = None
+        blocked = set()
+        for job in list(self._pending):
+            try:
+                account_id = job.emailer.sender_email
+                if account_id in blocked:
+                    continue
+                if job.not_before > now:
+                    delay = job.not_before - now
+                else:
+                    account = self._account(job.emailer)
+                    delay = account.wait_time()
+                    if delay <= 0:
+                        self._remove(job)
+                        account.take()
+                        return job, 0.0
+                    # 같은 계정의 뒤쪽(낮은 우선순위) 메일이 앞지르지 않도록 계정 전체를 보류
+                    blocked.add(account_id)
+                    if not job.deferred:
+                        job.deferred = True
+                        EMAIL_DEFERRALS.inc(domain=job.emailer.domain, reason="quota")
+                        logger.info(
+                            "발송 한도 초과, %.0f초 후 발송: %s", delay, job.subject
+                        )
+            except Exception as e:
+                self._remove(job)
+                self._failed.append((job, e))
+                continue
+            wait = delay if wait is None else min(wait, delay)
+        return None, wait
+
+    def _remove(self, job: MailJob):
+        """대기열에서 빼기 (이후 같은 key 메일은 새 메일로 대기)"""
+        self._pending.remove(job)
+        if job.key is not None and self._by_key.get(job.key) is job:
+            del self._by_key[job.key]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    job, wait = self._next_job()
+                    if job is not None or self._failed:
+                        break
+                    self._cond.wait(wait)
+                failed, self._failed = self._failed, []
+
+            # 잘못된 메일 하나가 발송 스레드를 멈추지 않도록 해당 메일만 실패 처리
+            for bad, error in failed:
+                logger.error("이메일 발송 작업 오류 (%s): %s", bad.subject, error)
+                self._finish(bad, False, error)
+            if job is None:
+                continue
+            try:
+                self._deliver(job)
+            except Exception as e:
+                logger.error("이메일 발송 작업 오류 (%s): %s", job.subject, e)
+                self._finish(job, False, e)
+
+    def _deliver(self, job: MailJob):
+        """발송 (실패 시 재시도 간격이 남아 있으면 대기열로 되돌림)"""
+        success = job.emailer.send(job.recipient, job.subject, job.body, html=job.html)
+        if not success and job.attempts < len(MAIL_RETRY_DELAYS):
+            with self._cond:
+                newer = self._by_key.get(job.key) if job.key is not None else None
+                if newer is None:
+                    delay = MAIL_RETRY_DELAYS[job.attempts]
+                    job.attempts += 1
+                    job.not_before = self.clock() + delay
+                    self._insert(job)
+                    if job.key is not None:
+                        self._by_key[job.key] = job
+            if newer is not None:
+                # 발송 중에 같은 key의 새 메일이 들어왔으면 지난 내용은 다시 보내지
+                # 않고, 결과는 새 메일을 따른다
+                logger.info("이메일 발송 실패, 새 메일로 대체: %s", job.subject)
+                _follow(newer.future, job.future)
+                return
+            EMAIL_DEFERRALS.inc(domain=job.emailer.domain, reason="retry")
+            logger.warning(
+                "이메일 발송 실패, %d초 후 재시도 (%d/%d): %s",
+                delay,
+                job.attempts,
+                len(MAIL_RETRY_DELAYS),
+                job.subject,
+            )
+            return
+        self._finish(job, success)
+
+    def _finish(
+        self, job: MailJob, success: bool, error: Optional[BaseException] = None
+    ):
+        """완료 콜백 호출 후 Future 완료 (오류면 예외로)"""
+        if job.on_done:
+            try:
+                job.on_done(success)
+            except Exception as e:
+                logger.error("이메일 발송 콜백 오류: %s", e)
+        if job.future.done():
+            return
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(success)
+
+
+def _follow(source: Future, target: Future):
+    """source가 끝나면 같은 결과로 target 완료"""
+
+    def copy(done: Future):
+        if target.done():
+            return
+        error = done.exception()
+        if error is not None:
+            target.set_exception(error)
+        else:
+            target.set_result(done.result())
+
+    source.add_done_callback(copy)
+
+
+# 공용 발송 대기열 (계정 한도는 프로세스 안에서 공유)
+MAIL_SCHEDULER = MailScheduler()
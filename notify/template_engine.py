@@ -0,0 +1,119 @@
+"""이메일 템플릿 엔진 (한 번 컴파일해 캐시, 렌더링은 str.format_map 1회)
+
+템플릿 문법은 str.format과 같다 ({keyword}, {price:,}). 컴파일할 때 문법과 필드
+이름을 검사해 두고, 렌더링은 컨텍스트를 넣어 format_map만 호출한다.
+반복 영역(상품 행)은 행 템플릿을 항목마다 렌더링해 이어 붙인다.
+
+HTML 템플릿은 컨텍스트의 문자열 값을 렌더링 시 이스케이프한다. 이미 렌더링한
+HTML 조각은 Markup으로 감싸 다시 이스케이프되지 않게 한다.
+"""
+
+import html
+from functools import lru_cache
+from string import Formatter
+from typing import Iterable, Mapping, Optional, Sequence
+
+_FORMATTER = Formatter()
+
+# 가격 추이 그래프 막대 (낮은 가격 → 높은 가격)
+SPARK_BARS = "▁▂▃▄▅▆▇█"
+
+
+class TemplateError(ValueError):
+    """템플릿 문법 오류 또는 컨텍스트에 없는 필드"""
+
+
+class Markup(str):
+    """이스케이프하지 않을 HTML 조각"""
+
+
+class _Escaped:
+    """HTML 템플릿용 컨텍스트 (문자열 값만 꺼낼 때 이스케이프)"""
+
+    __slots__ = ("context",)
+
+    def __init__(self, context: Mapping):
+        self.context = context
+
+    def __getitem__(self, key):
+        value = self.context[key]
+        if isinstance(value, str) and not isinstance(value, Markup):
+            return html.escape(value)
+        return value
+
+
+class Template:
+    """컴파일된 템플릿 1개"""
+
+    __slots__ = ("name", "source", "fields", "html")
+
+    def __init__(self, source: str, html: bool = False, name: str = "<template>"):
+        """
+        Args:
+            source: str.format 문법의 템플릿
+            html: True면 문자열 값을 HTML 이스케이프
+            name: 오류 메시지용 이름
+        """
+        self.name = name
+        self.source = source
+        self.html = html
+        try:
+            self.fields = frozenset(
+                _field_root(field)
+                for _, field, _, _ in _FORMATTER.parse(source)
+                if field is not None
+            )
+        except ValueError as e:
+            raise TemplateError(f"{name}: 템플릿 문법 오류: {e}") from e
+        if "" in self.fields:
+            raise TemplateError(f"{name}: 이름 없는 필드({{}})는 쓸 수 없습니다")
+
+    def render(self, context: Mapping) -> str:
+        """컨텍스트로 렌더링 (필드가 빠져 있으면 TemplateError)"""
+        try:
+            return self.source.format_map(_Escaped(context) if self.html else context)
+        except KeyError as e:
+            raise TemplateError(f"{self.name}: 컨텍스트에 없는 필드 {e}") from None
+
+    def render_each(self, items: Iterable[Mapping], sep: str = "") -> str:
+        """항목마다 렌더링해 이어 붙이기 (HTML이면 Markup)"""
+        text = sep.join([self.render(item) for item in items])
+        return Markup(text) if self.html else text
+
+
+def _field_root(field: str) -> str:
+    """'row.price' / 'rows[0]' → 'row' / 'rows'"""
+    for i, ch in enumerate(field):
+        if ch in ".[":
+            return field[:i]
+    return field
+
+
+@lru_cache(maxsize=None)
+def compile_template(source: str, html: bool = False, name: str = "<template>"):
+    """템플릿 컴파일 (같은 원본은 한 번만 컴파일)"""
+    return Template(source, html=html, name=name)
+
+
+def sparkline(
+    prices: Sequence[int], low: Optional[int] = None, high: Optional[int] = None
+) -> str:
+    """
+    가격 추이를 유니코드 막대 문자열로 (메일 클라이언트가 SVG/스크립트를 막아도 보인다)
+
+    Args:
+        prices: 관측 가격 (오래된 순)
+        low, high: 이미 계산한 최저/최고가 (없으면 계산)
+
+    Returns:
+        관측이 2개 미만이면 빈 문자열
+    """
+    if len(prices) < 2:
+        return ""
+    low = min(prices) if low is None else low
+    high = max(prices) if high is None else high
+    if low == high:
+        return SPARK_BARS[len(SPARK_BARS) // 2 - 1] * len(prices)
+    scale = (len(SPARK_BARS) - 1) / (high - low)
+    bars = SPARK_BARS
+    return "".join([bars[int((price - low) * scale + 0.5)] for price in prices])
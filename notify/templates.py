@@ -1,45 +1,136 @@
 """이메일 템플릿"""
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 from core.models import PriceResult
+from notify.template_engine import compile_template, sparkline
+from scrapers.registry import SITE_REGISTRY
 
+# === 가격 알림 (텍스트 + HTML, 모듈 로드 시 1회 컴파일) ===
 
-def create_price_alert_email(keyword: str, results: List[PriceResult]) -> tuple:
-    """
-    가격 알림 이메일 생성
+_PRICE_SUBJECT = compile_template("[최저가 알림] {keyword}", name="price_subject")
 
-    Returns:
-        (subject, body) 튜플
-    """
-    subject = f"[최저가 알림] {keyword}"
-
-    # 사이트별 정보
-    site_info = []
-    for result in results:
-        site_name = "다나와" if result.site == "danawa" else "지마켓"
-        site_info.append(
-            f"""
-【{site_name}】
-상품명: {result.title}
-가격: {result.price:,}원
-링크: {result.product_url}
-조회시각: {result.fetched_at}
-        """.strip()
-        )
+_PRICE_TEXT_ROW = compile_template(
+    """【{site_name}】
+상품명: {title}
+가격: {price:,}원
+링크: {product_url}
+조회시각: {fetched_at}{trend_text}""",
+    name="price_text_row",
+)
 
-    body = f"""
-안녕하세요, 최저가 알림이입니다.
+_PRICE_TEXT = compile_template(
+    """안녕하세요, 최저가 알림이입니다.
 
 관심상품 '{keyword}'의 최신 가격 정보를 알려드립니다.
 
-{chr(10).join(site_info)}
+{items}
 
 ---
 본 알림은 자동으로 발송되었습니다.
-배송비, 카드할인, 쿠폰 등은 포함되지 않은 표시가 기준입니다.
-    """.strip()
+배송비, 카드할인, 쿠폰 등은 포함되지 않은 표시가 기준입니다.""",
+    name="price_text",
+)
+
+_PRICE_HTML_ROW = compile_template(
+    """<tr>
+<td style="padding:8px;border-bottom:1px solid #eee;white-space:nowrap">{site_name}</td>
+<td style="padding:8px;border-bottom:1px solid #eee"><a href="{product_url}">{title}</a></td>
+<td style="padding:8px;border-bottom:1px solid #eee;text-align:right;white-space:nowrap"><b>{price:,}원</b></td>
+<td style="padding:8px;border-bottom:1px solid #eee;white-space:nowrap;color:#1a73e8;letter-spacing:-1px" title="{trend_title}">{sparkline}</td>
+<td style="padding:8px;border-bottom:1px solid #eee;white-space:nowrap;color:#888">{fetched_at}</td>
+</tr>""",
+    html=True,
+    name="price_html_row",
+)
+
+_PRICE_HTML = compile_template(
+    """<!DOCTYPE html>
+<html><body style="font-family:sans-serif;font-size:14px;color:#222">
+<p>안녕하세요, 최저가 알림이입니다.</p>
+<p>관심상품 '<b>{keyword}</b>'의 최신 가격 정보를 알려드립니다.</p>
+<table style="border-collapse:collapse">
+<tr style="background:#f5f5f5"><th style="padding:8px">사이트</th><th style="padding:8px">상품명</th><th style="padding:8px">가격</th><th style="padding:8px">추이</th><th style="padding:8px">조회시각</th></tr>
+{rows}
+</table>
+<p style="color:#888;font-size:12px">본 알림은 자동으로 발송되었습니다.<br>
+배송비, 카드할인, 쿠폰 등은 포함되지 않은 표시가 기준입니다.</p>
+</body></html>""",
+    html=True,
+    name="price_html",
+)
+
+
+def build_price_context(
+    keyword: str,
+    results: List[PriceResult],
+    history: Optional[Dict[str, Sequence[int]]] = None,
+) -> dict:
+    """
+    가격 알림 렌더링 컨텍스트 생성 (수신자와 무관하므로 같은 상품이면 재사용 가능)
 
-    return subject, body
+    Args:
+        keyword: 관심상품 키워드
+        results: 사이트별 최신 가격
+        history: 상품 URL별 최근 관측 가격 (오래된 순, PriceIndex.history)
+    """
+    history = history or {}
+    rows = []
+    for result in results:
+        prices = history.get(result.product_url, ())
+        spark = trend_text = trend_title = ""
+        if len(prices) >= 2:
+            low, high = min(prices), max(prices)
+            spark = sparkline(prices, low, high)
+            trend_text = f"\n추이: {spark} (최근 {len(prices)}회 {low:,}~{high:,}원)"
+            trend_title = f"최근 {len(prices)}회 {low:,}~{high:,}원"
+        rows.append(
+            {
+                "site_name": SITE_REGISTRY.display_name(result.site),
+                "title": result.title,
+                "price": result.price,
+                "product_url": result.product_url,
+                "fetched_at": result.fetched_at_iso,
+                "sparkline": spark or "-",
+                "trend_text": trend_text,
+                "trend_title": trend_title,
+            }
+        )
+    return {"keyword": keyword, "rows": rows}
+
+
+def render_price_alert(context: dict) -> tuple:
+    """
+    컨텍스트로 가격 알림 렌더링
+
+    Returns:
+        (subject, text, html) 튜플
+    """
+    rows = context["rows"]
+    subject = _PRICE_SUBJECT.render(context)
+    text = _PRICE_TEXT.render(
+        {
+            "keyword": context["keyword"],
+            "items": _PRICE_TEXT_ROW.render_each(rows, "\n"),
+        }
+    )
+    html = _PRICE_HTML.render(
+        {"keyword": context["keyword"], "rows": _PRICE_HTML_ROW.render_each(rows, "\n")}
+    )
+    return subject, text, html
+
+
+def create_price_alert_email(
+    keyword: str,
+    results: List[PriceResult],
+    history: Optional[Dict[str, Sequence[int]]] = None,
+) -> tuple:
+    """
+    가격 알림 이메일 생성
+
+    Returns:
+        (subject, text, html) 튜플 (multipart/alternative로 함께 발송)
+    """
+    return render_price_alert(build_price_context(keyword, results, history))
 
 
 def create_test_email() -> tuple:
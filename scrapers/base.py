@@ -1,25 +1,268 @@
 """스크래퍼 기본 인터페이스"""
 
+import logging
+import functools
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import contextmanager
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    TimeoutError,
+    as_completed,
+    wait,
+)
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import quote, urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from core.models import Candidate, PriceResult
-from config.constants import USER_AGENT, REQUEST_TIMEOUT
+from core.models import Candidate, PriceResult, FetchOutcome
+from core.deadline import Deadline, current_deadline, deadline_scope
+from core.rate_limit import HostRateLimiter, TokenBucket
+from core.metrics import (
+    HTTP_REQUESTS,
+    HTTP_SECONDS,
+    HTTP_BYTES,
+    HTTP_HEDGES,
+    PARSE_SECONDS,
+    SCRAPE_SECONDS,
+)
+from core.profiling import PROFILER
+from scrapers.fixtures import FixtureStore, ReplayAdapter
+from scrapers.session_store import CookieStore
+from config.constants import (
+    USER_AGENT,
+    REQUEST_TIMEOUT,
+    HTML_PARSER,
+    RECORD_DIR_ENV,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_STATUSES,
+    FETCH_MAX_WORKERS,
+    FETCH_OK,
+    FETCH_FAILED,
+    FETCH_LATE,
+    SEARCH_MAX_PAGES,
+    MIN_REQUEST_BUDGET,
+    HEDGE_REQUESTS,
+    HEDGE_QUANTILE,
+    HEDGE_MIN_SAMPLES,
+    LATENCY_WINDOW,
+    HEDGE_RATE_LIMIT,
+    HEDGE_RATE_BURST,
+    SESSION_DIR,
+    COOKIE_SAVE_INTERVAL,
+    WARM_UP_CONNECTIONS,
+    WARM_UP_TIMEOUT,
+)
+
+try:
+    import brotli  # noqa: F401 - urllib3가 br 응답을 풀 수 있을 때만 협상
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyWindow:
+    """호스트별 최근 응답 지연 기록 (헤지 시점 계산용)"""
+
+    def __init__(self, size: int = LATENCY_WINDOW):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위 지연 (기록이 HEDGE_MIN_SAMPLES 미만이면 None)"""
+        with self._lock:
+            if len(self._samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# 같은 호스트를 쓰는 스크래퍼 인스턴스끼리 지연 기록/헤지 허용량을 공유
+_LATENCIES: Dict[str, LatencyWindow] = {}
+_LATENCIES_LOCK = threading.Lock()
+HEDGE_LIMITER = HostRateLimiter(HEDGE_RATE_LIMIT, HEDGE_RATE_BURST)
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _latency_window(host: str) -> LatencyWindow:
+    with _LATENCIES_LOCK:
+        window = _LATENCIES.get(host)
+        if window is None:
+            window = _LATENCIES[host] = LatencyWindow()
+        return window
+
+
+def _hedge_pool() -> ThreadPoolExecutor:
+    """헤지 요청용 공용 스레드 풀 (처음 사용할 때 생성)"""
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=POOL_MAXSIZE * 2, thread_name_prefix="hedge"
+            )
+        return _hedge_executor
+
+
+def warm_up_all(
+    scrapers: dict, background: bool = True, sites: Optional[Iterable[str]] = None
+):
+    """
+    스크래퍼 연결 예열 (UI는 화면을 막지 않도록 백그라운드에서)
+
+    Args:
+        scrapers: {사이트: 스크래퍼} (등록부의 LazyScrapers면 꺼낼 때 생성)
+        background: 백그라운드 스레드에서 실행할지 여부
+        sites: 예열할 사이트 (기본: 전부). 추적 중인 사이트만 넘기면 쓰지 않는
+            사이트 모듈/세션은 만들지 않는다
+
+    Returns:
+        background면 예열 스레드, 아니면 None (완료 후 반환)
+    """
+    names = [
+        name for name in (scrapers if sites is None else sites) if name in scrapers
+    ]
+
+    def run():
+        for name in names:
+            try:
+                scrapers[name].warm_up()
+            except Exception as e:
+                logger.warning("연결 예열 오류: %s", e)
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def instrumented(op: str):
+    """search/fetch 전체 소요 시간을 사이트/결과별로 기록하는 데코레이터"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(self, *args, **kwargs)
+                outcome = "ok" if result else "empty"
+                return result
+            finally:
+                SCRAPE_SECONDS.observe(
+                    time.perf_counter() - start,
+                    site=self.get_site_name(),
+                    op=op,
+                    outcome=outcome,
+                )
+
+        return wrapper
+
+    return decorator
 
 
 class BaseScraper(ABC):
     """스크래퍼 기본 클래스"""
 
-    def __init__(self):
+    # 검색 URL 구성 (사이트별로 지정)
+    BASE_SEARCH_URL = ""
+    SEARCH_QUERY_PARAM = "query"
+    SEARCH_PAGE_PARAM = "page"
+    # 시작 시 미리 연결해 둘 주소 (검색/상품 페이지 호스트)
+    WARM_UP_URLS: tuple = ()
+
+    def __init__(
+        self,
+        record_dir: Optional[str] = None,
+        replay_dir: Optional[str] = None,
+        hedge: bool = HEDGE_REQUESTS,
+        session_dir: Optional[str] = SESSION_DIR,
+        timeout: float = REQUEST_TIMEOUT,
+        parser: str = HTML_PARSER,
+        rate_limit: Optional[float] = None,
+        rate_burst: float = 1,
+    ):
+        """
+        Args:
+            record_dir: 원본 응답 기록 디렉터리 (기본: 환경변수 PRICE_ALERT_RECORD_DIR)
+            replay_dir: 기록된 응답으로 재생 (네트워크 미사용)
+            hedge: 호스트 p95 지연을 넘긴 요청에 두 번째 요청을 보낼지 여부
+            session_dir: 사이트별 쿠키 저장 디렉터리 (None이면 저장하지 않음, 재생 시 미사용)
+            timeout: 요청 타임아웃 (초)
+            parser: BeautifulSoup 파서 이름 (lxml | html.parser | html5lib)
+            rate_limit: 이 스크래퍼의 요청 허용량 (초당, None이면 제한 없음)
+            rate_burst: rate_limit의 최대 버스트
+        """
+        self.hedge = hedge
+        self.timeout = timeout
+        self.parser = parser
+        self.rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(rate_limit, rate_burst) if rate_limit else None
+        )
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": USER_AGENT,
                 "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+                "Accept-Encoding": ACCEPT_ENCODING,
             }
         )
 
+        # 호스트당 keep-alive 연결 수를 고정 (pool_block: 초과 요청은 새 연결 대신 대기)
+        # 재시도는 마감 시간 안에서 _send_with_retries가 직접 한다
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        record_dir = record_dir or os.environ.get(RECORD_DIR_ENV)
+        self.recorder: Optional[FixtureStore] = (
+            FixtureStore(record_dir) if record_dir else None
+        )
+        if replay_dir:
+            adapter = ReplayAdapter(FixtureStore(replay_dir))
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+        # 이전 실행의 쿠키 복원 (재시작 직후에도 같은 방문자로 보이도록)
+        self.cookie_store: Optional[CookieStore] = None
+        self._cookies_saved_at = 0.0
+        if session_dir and not replay_dir:
+            self.cookie_store = CookieStore(
+                os.path.join(session_dir, f"{self.get_site_name()}.json")
+            )
+            restored = self.cookie_store.load(self.session.cookies)
+            if restored:
+                logger.debug(
+                    "쿠키 %d개 복원", restored, extra={"site": self.get_site_name()}
+                )
+
     @abstractmethod
     def search(self, keyword: str, limit: int = 10) -> List[Candidate]:
         """
@@ -34,6 +277,47 @@ class BaseScraper(ABC):
         """
         pass
 
+    @abstractmethod
+    def search_page(self, keyword: str, page: int = 1) -> List[Candidate]:
+        """
+        검색 결과 한 페이지의 후보 목록
+
+        Args:
+            keyword: 검색 키워드
+            page: 1부터 시작하는 페이지 번호
+
+        Returns:
+            Candidate 객체 리스트 (결과가 없으면 빈 리스트)
+        """
+        pass
+
+    def search_url(self, keyword: str, page: int = 1) -> str:
+        """검색 URL (1페이지는 페이지 파라미터 없이 기존 URL 그대로)"""
+        url = f"{self.BASE_SEARCH_URL}?{self.SEARCH_QUERY_PARAM}={quote(keyword)}"
+        if page > 1:
+            url += f"&{self.SEARCH_PAGE_PARAM}={page}"
+        return url
+
+    def iter_search(
+        self, keyword: str, max_pages: int = SEARCH_MAX_PAGES
+    ) -> Iterator[Candidate]:
+        """
+        검색 결과를 페이지 단위로 지연 조회하는 제너레이터
+
+        다음 후보가 필요해질 때만 다음 페이지를 요청하고, 새 후보가 없는
+        페이지(마지막 페이지 이후 같은 결과 반복 포함)에서 멈춘다.
+        """
+        seen = set()
+        for page in range(1, max_pages + 1):
+            fresh = [
+                c for c in self.search_page(keyword, page) if c.product_url not in seen
+            ]
+            if not fresh:
+                return
+            for candidate in fresh:
+                seen.add(candidate.product_url)
+                yield candidate
+
     @abstractmethod
     def fetch(self, product_url: str) -> Optional[PriceResult]:
         """
@@ -47,22 +331,352 @@ class BaseScraper(ABC):
         """
         pass
 
-    def _get_html(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[FetchOutcome]:
         """
-        URL에서 HTML 가져오기 (공통 로직)
+        여러 상품 URL 일괄 조회 (완료되는 순서대로 반환)
 
-        Returns:
+        Args:
+            urls: 상품 페이지 URL 목록
+            max_workers: 동시 요청 수 (기본: FETCH_MAX_WORKERS, 풀 크기 이하 권장)
+            deadline: 배치 마감 시간 (초). 각 요청은 남은 시간만 기다리고,
+                넘기면 남은 항목은 late로 반환 (호출 측 deadline_scope보다 길 수 없음)
+
+        Yields:
+            FetchOutcome (status: ok | failed | late)
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
+
+        workers = min(max_workers or FETCH_MAX_WORKERS, len(urls))
+        batch_start = time.perf_counter()
+        batch_deadline = current_deadline()
+        if deadline is not None:
+            batch_deadline = Deadline(deadline).earliest(batch_deadline)
+
+        def task(url):
+            start = time.perf_counter()
+            # 마감 시간은 스레드 로컬이므로 작업 스레드에서 다시 적용
+            with deadline_scope(batch_deadline):
+                try:
+                    result = self.fetch(url)
+                except Exception as e:
+                    logger.error("일괄 조회 오류 (%s): %s", url, e, extra={"url": url})
+                    result = None
+            return result, time.perf_counter() - start
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"fetch-{self.get_site_name()}"
+        )
+        futures = {executor.submit(task, url): url for url in urls}
+        pending = set(futures)
+        timeout = batch_deadline.remaining() if batch_deadline else None
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                url = futures[future]
+                result, elapsed = future.result()
+                if result:
+                    status = FETCH_OK
+                elif batch_deadline and batch_deadline.expired():
+                    status = FETCH_LATE
+                else:
+                    status = FETCH_FAILED
+                yield FetchOutcome(url, result, status, elapsed)
+        except TimeoutError:
+            elapsed = time.perf_counter() - batch_start
+            for future in pending:
+                yield FetchOutcome(futures[future], None, FETCH_LATE, elapsed)
+        finally:
+            # 마감 후에는 진행 중인 요청을 기다리지 않는다
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @contextmanager
+    def _get_dom(self, url: str) -> Iterator[Optional[BeautifulSoup]]:
+        """
+        URL에서 HTML을 가져와 DOM으로 제공 (공통 로직)
+
+        with 블록을 벗어나면 DOM을 해체하므로 블록 밖으로는 str/int로 변환한
+        값만 내보내야 한다.
+
+        Yields:
             BeautifulSoup 객체 또는 None
         """
+        response = self._get_response(url)
+        if response is None:
+            yield None
+            return
+        with self._dom(response.text, url) as soup:
+            yield soup
+
+    @contextmanager
+    def _dom(self, html: str, url: str = "") -> Iterator[Optional[BeautifulSoup]]:
+        """
+        HTML 문자열 → DOM, 블록이 끝나면 decompose()로 해체
+
+        BeautifulSoup 트리는 부모/형제 참조 순환이 많아 참조 카운트만으로는
+        바로 해제되지 않는다. 오래 실행되는 작업자에서 큰 페이지의 트리가
+        GC 주기까지 남아 메모리 단편화를 키우지 않도록 명시적으로 해체한다.
+        """
+        soup = self._parse_html(html, url)
+        try:
+            yield soup
+        finally:
+            if soup is not None:
+                soup.decompose()
+
+    def _get_response(self, url: str) -> Optional[requests.Response]:
+        """
+        HTTP 요청 (지표 기록, 기록 모드면 원본 응답 저장)
+
+        현재 deadline_scope가 있으면 타임아웃은 min(self.timeout, 남은 시간)이고
+        (재시도 포함), 마감을 넘긴 요청은 outcome=late로 기록한다. rate_limit이
+        있으면 토큰을 기다리며, 마감 안에 얻지 못하면 요청하지 않고 late로 기록한다.
+
+        Returns:
+            requests.Response 또는 None
+        """
+        site = self.get_site_name()
+        deadline = current_deadline()
+        timeout = self.timeout
+        if self.rate_limiter is not None and not self._throttle(deadline):
+            HTTP_REQUESTS.inc(site=site, outcome="late")
+            logger.warning(
+                "요청 허용량 대기 중 마감 초과 (%s)",
+                url,
+                extra={"site": site, "url": url},
+            )
+            return None
+        if deadline is not None:
+            timeout = min(timeout, deadline.remaining())
+            if timeout < MIN_REQUEST_BUDGET:
+                HTTP_REQUESTS.inc(site=site, outcome="late")
+                logger.warning(
+                    "마감 시간 초과로 요청 생략 (%s)",
+                    url,
+                    extra={"site": site, "url": url},
+                )
+                return None
+
+        start = time.perf_counter()
+        response = None
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "lxml")
+            with PROFILER.phase("fetch"):
+                response = self._send_with_retries(url, Deadline(timeout))
+                response.raise_for_status()
         except requests.RequestException as e:
-            print(f"[ERROR] HTTP 요청 실패 ({url}): {e}")
+            # 오류 응답도 연결을 풀에 돌려준다 (pool_block이라 새지 않게)
+            if response is not None:
+                response.close()
+            elapsed = time.perf_counter() - start
+            outcome = "late" if deadline and deadline.expired() else "error"
+            HTTP_REQUESTS.inc(site=site, outcome=outcome)
+            HTTP_SECONDS.observe(elapsed, site=site, outcome=outcome)
+            logger.error(
+                "HTTP 요청 실패 (%s): %s",
+                url,
+                e,
+                extra={"site": site, "url": url, "duration": elapsed},
+            )
             return None
+
+        elapsed = time.perf_counter() - start
+        _latency_window(urlparse(url).netloc).observe(elapsed)
+        HTTP_REQUESTS.inc(site=site, outcome="ok")
+        HTTP_SECONDS.observe(elapsed, site=site, outcome="ok")
+        HTTP_BYTES.inc(len(response.content), site=site)
+        logger.debug(
+            "HTTP 요청 완료 (%d bytes)",
+            len(response.content),
+            extra={"site": site, "url": url, "duration": elapsed},
+        )
+
+        if self.recorder is not None:
+            self.recorder.record(site, url, response)
+        if response.cookies:
+            self._save_cookies()
+
+        return response
+
+    def _save_cookies(self, force: bool = False):
+        """쿠키 저장 (새 쿠키를 받을 때마다 쓰지 않도록 COOKIE_SAVE_INTERVAL로 제한)"""
+        if self.cookie_store is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._cookies_saved_at < COOKIE_SAVE_INTERVAL:
+            return
+        self._cookies_saved_at = now
+        self.cookie_store.save(self.session.cookies)
+
+    def warm_up(
+        self, connections: int = WARM_UP_CONNECTIONS, timeout: float = WARM_UP_TIMEOUT
+    ) -> int:
+        """
+        WARM_UP_URLS 호스트마다 keep-alive 연결을 미리 열어 둔다
+
+        HEAD 요청을 호스트당 connections개 동시에 보내 DNS 조회/TLS 핸드셰이크를
+        첫 크롤링 전에 끝내고, 연결은 세션 풀에 남겨 첫 요청이 재사용하게 한다.
+        받은 쿠키는 바로 저장한다.
+
+        Returns:
+            연결에 성공한 요청 수
+        """
+        if not self.WARM_UP_URLS:
+            return 0
+        connections = max(1, min(connections, POOL_MAXSIZE))
+        site = self.get_site_name()
+
+        def head(url):
+            try:
+                self.session.head(url, timeout=timeout, allow_redirects=False)
+                return True
+            except requests.RequestException as e:
+                logger.debug("연결 예열 실패 (%s): %s", url, e, extra={"site": site})
+                return False
+
+        start = time.perf_counter()
+        urls = [url for url in self.WARM_UP_URLS for _ in range(connections)]
+        with ThreadPoolExecutor(
+            max_workers=len(urls), thread_name_prefix=f"warmup-{site}"
+        ) as executor:
+            warmed = sum(executor.map(head, urls))
+        self._save_cookies(force=True)
+        logger.info(
+            "연결 예열 완료 (%d/%d)",
+            warmed,
+            len(urls),
+            extra={"site": site, "duration": time.perf_counter() - start},
+        )
+        return warmed
+
+    def _send_with_retries(self, url: str, budget: Deadline) -> requests.Response:
+        """
+        GET + 연결 오류/429/5xx 재시도 (최대 HTTP_RETRIES회)
+
+        시도마다 타임아웃을 새로 주지 않고 budget의 남은 시간만 준다. 재시도 대기
+        (백오프, Retry-After) 후 MIN_REQUEST_BUDGET도 남지 않으면 마지막 응답을
+        돌려주거나 마지막 오류를 그대로 올린다. 재시도도 rate_limit 토큰을 쓴다.
+        """
+        site = self.get_site_name()
+        attempt = 0
+        while True:
+            response, error = None, None
+            try:
+                response = self._send(url, budget.remaining())
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            if error is None and response.status_code not in HTTP_RETRY_STATUSES:
+                return response
+
+            attempt += 1
+            delay = self._retry_delay(response, attempt)
+            if (
+                attempt > HTTP_RETRIES
+                or budget.remaining() - delay < MIN_REQUEST_BUDGET
+            ):
+                if error is not None:
+                    raise error
+                return response
+
+            if response is not None:
+                response.close()
+            logger.debug(
+                "HTTP 재시도 %d/%d (%s)",
+                attempt,
+                HTTP_RETRIES,
+                error or response.status_code,
+                extra={"site": site, "url": url},
+            )
+            with PROFILER.phase("wait"):
+                time.sleep(delay)
+            if self.rate_limiter is not None and not self._throttle(budget):
+                raise requests.Timeout(f"재시도 허용량 대기 중 마감 초과: {url}")
+            if budget.remaining() < MIN_REQUEST_BUDGET:
+                raise requests.Timeout(f"재시도 전 마감 초과: {url}")
+
+    @staticmethod
+    def _retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+        """재시도 대기 시간 (Retry-After 초 값 우선, 없으면 지수 백오프)"""
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass  # HTTP 날짜 형식은 백오프로 대신한다
+        if attempt <= 1:
+            return 0.0
+        return HTTP_RETRY_BACKOFF * 2 ** (attempt - 1)
+
+    def _send(self, url: str, timeout: float) -> requests.Response:
+        """
+        GET 요청 (헤지 사용 시 p95 지연을 넘기면 같은 요청을 한 번 더 보냄)
+
+        먼저 성공한 응답을 돌려주고, 늦은 쪽은 타임아웃까지 백그라운드에서 끝난다.
+        헤지 요청도 일반 요청처럼 이 스크래퍼의 rate_limit 토큰을 쓰고, 그와 별도로
+        호스트별 HEDGE_LIMITER 허용량 안에서만 보낸다.
+        """
+        if not self.hedge:
+            return self.session.get(url, timeout=timeout)
+
+        host = urlparse(url).netloc
+        delay = _latency_window(host).quantile(HEDGE_QUANTILE)
+        if delay is None or delay >= timeout:
+            return self.session.get(url, timeout=timeout)
+
+        pool = _hedge_pool()
+        start = time.perf_counter()
+        primary = pool.submit(self.session.get, url, timeout=timeout)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        site = self.get_site_name()
+        if not self._acquire_hedge(host):
+            HTTP_HEDGES.inc(site=site, outcome="limited")
+            return primary.result()
+
+        HTTP_HEDGES.inc(site=site, outcome="sent")
+        hedge_timeout = max(MIN_REQUEST_BUDGET, timeout - (time.perf_counter() - start))
+        hedge = pool.submit(self.session.get, url, timeout=hedge_timeout)
+
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is hedge:
+                        HTTP_HEDGES.inc(site=site, outcome="won")
+                    return future.result()
+        raise error
+
+    def _acquire_hedge(self, host: str) -> bool:
+        """헤지 요청 토큰 (사이트 허용량을 먼저 확인해 초과 요청이 나가지 않게)"""
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            return False
+        return HEDGE_LIMITER.try_acquire(host)
+
+    def _throttle(self, deadline: Optional[Deadline]) -> bool:
+        """사이트 요청 허용량 대기 (마감이 있으면 남은 시간까지만)"""
+        with PROFILER.phase("wait"):
+            return self.rate_limiter.acquire(
+                timeout=None if deadline is None else deadline.remaining()
+            )
+
+    def _parse_html(self, html: str, url: str = "") -> Optional[BeautifulSoup]:
+        """HTML 문자열을 DOM으로 변환"""
+        site = self.get_site_name()
+        try:
+            with PARSE_SECONDS.time(site=site), PROFILER.phase("parse"):
+                return BeautifulSoup(html, self.parser)
         except Exception as e:
-            print(f"[ERROR] HTML 파싱 실패: {e}")
+            logger.error("HTML 파싱 실패: %s", e, extra={"site": site, "url": url})
             return None
 
     @abstractmethod
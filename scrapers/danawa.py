@@ -1,46 +1,108 @@
 """다나와 스크래퍼(실제 HTML 파싱 적용 완료)"""
 
-from typing import List, Optional
-from datetime import datetime
-from urllib.parse import quote
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import List, Optional, Tuple
 import re
 
-from scrapers.base import BaseScraper
-from core.models import Candidate, PriceResult
+import requests
+from bs4 import BeautifulSoup
+from scrapers.base import BaseScraper, instrumented
+from core.models import (
+    Candidate,
+    PriceResult,
+    DetailedPriceResult,
+    MallPriceTable,
+    now_epoch,
+)
 from core.normalizer import Normalizer
+from core.metrics import PARSE_SHORTCUTS
+from config.constants import REGION_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# class 속성에 list__mall-price가 있는 <ul 여는 태그 (태그 밖 스크립트/문자열은 제외)
+_MALL_PRICE_OPEN = re.compile(
+    rb"""<ul\b[^>]*?\bclass\s*=\s*["']?[^"'>]*?(?<![\w-])list__mall-price(?![\w-])""",
+    re.IGNORECASE,
+)
+_UL_TAG = re.compile(rb"<(/?)ul(?=[\s>/])", re.IGNORECASE)
+
+
+def mall_price_region(body: bytes) -> Optional[bytes]:
+    """
+    원본 바이트에서 ul.list__mall-price 영역만 잘라낸다 (DOM 생성 없음)
+
+    class 속성에 list__mall-price가 있는 <ul 여는 태그부터 짝이 맞는 </ul>의
+    닫는 >까지를 반환하고, 찾지 못하면 None
+    """
+    match = _MALL_PRICE_OPEN.search(body)
+    if match is None:
+        return None
+    start = match.start()
+
+    depth = 1
+    for tag in _UL_TAG.finditer(body, match.end()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = body.find(b">", tag.end())
+            return body[start : end + 1] if end >= 0 else None
+    return None
 
 
 class DanawaScraper(BaseScraper):
     """다나와 가격 비교 사이트 스크래퍼"""
 
     BASE_SEARCH_URL = "https://search.danawa.com/dsearch.php"
+    SEARCH_QUERY_PARAM = "query"
+    SEARCH_PAGE_PARAM = "page"
+    WARM_UP_URLS = ("https://search.danawa.com/", "https://prod.danawa.com/")
+
+    def __init__(self, *args, region_cache_size: int = REGION_CACHE_SIZE, **kwargs):
+        """
+        Args:
+            region_cache_size: 가격 영역 해시 캐시 크기 (0이면 매번 파싱)
+        """
+        super().__init__(*args, **kwargs)
+        self.region_cache_size = region_cache_size
+        # {상품 URL: (영역 해시, 직전 PriceResult)} (LRU)
+        self._region_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._region_lock = threading.Lock()
 
     def get_site_name(self) -> str:
         return "danawa"
 
+    @instrumented("search")
     def search(self, keyword: str, limit: int = 10) -> List[Candidate]:
+        """다나와 검색 상위 limit개 (1페이지만 요청, 더 보기는 iter_search)"""
+        return self.search_page(keyword)[:limit]
+
+    def search_page(self, keyword: str, page: int = 1) -> List[Candidate]:
         """
-        다나와 검색 결과 파싱 (실제 상품만)
+        다나와 검색 결과 한 페이지 파싱 (실제 상품만)
 
         - ul.product_list > li.prod_item 중에서
         id가 productItem{숫자} 형태인 항목만 실제 상품으로 취급
         (adSmartAreaTop, adSmartAreaBottomB 같은 추천/광고 영역은 자동 제외)
         - 가격은 input#min_price_{pcode} 값 우선 사용
         """
+        with self._get_dom(self.search_url(keyword, page)) as soup:
+            if not soup:
+                return []
+            return self._extract_candidates(soup)
+
+    def _extract_candidates(self, soup: BeautifulSoup) -> List[Candidate]:
+        """검색 결과 DOM에서 실제 상품 후보 추출"""
         candidates: List[Candidate] = []
-        search_url = f"{self.BASE_SEARCH_URL}?query={quote(keyword)}"
-        soup = self._get_html(search_url)
-        if not soup:
-            return candidates
 
         # 실제 상품만: id="productItem123456" 형태만 허용
         product_id_pattern = re.compile(r"^productItem(\d+)$")
 
         items = soup.select("ul.product_list > li.prod_item")
         for item in items:
-            if len(candidates) >= limit:
-                break
-
             try:
                 item_id = (item.get("id") or "").strip()
                 m = product_id_pattern.match(item_id)
@@ -96,11 +158,12 @@ class DanawaScraper(BaseScraper):
                 )
 
             except Exception as e:
-                print(f"[WARN] 다나와 후보 파싱 오류: {e}")
+                logger.warning("다나와 후보 파싱 오류: %s", e)
                 continue
 
         return candidates
 
+    @instrumented("fetch")
     def fetch(self, product_url: str) -> Optional[PriceResult]:
         """
         다나와 상품 상세 페이지에서 '쇼핑몰별 최저가'의 최저가(첫 항목/lowest 배지)를 가져온다.
@@ -109,11 +172,138 @@ class DanawaScraper(BaseScraper):
         - 없으면 첫 번째 li를 fallback
         - price: .box__price .text__num
         - buy_link: a.link__full-cover[href]  (다나와 브릿지 링크)
+
+        광고/추천 영역은 자주 바뀌어도 쇼핑몰 가격 목록은 그대로인 경우가 많으므로,
+        목록 영역 바이트의 해시가 직전 조회와 같으면 DOM을 만들지 않고
+        직전 결과를 조회 시각만 바꿔 재사용한다.
         """
-        soup = self._get_html(product_url)
-        if not soup:
+        response = self._get_response(product_url)
+        if response is None:
             return None
+        return self.parse_fetch(product_url, response)
 
+    @instrumented("fetch_detailed")
+    def fetch_detailed(self, product_url: str) -> Optional[DetailedPriceResult]:
+        """
+        fetch와 같은 요청 한 번으로 쇼핑몰별 전체 가격까지 반환
+
+        Returns:
+            DetailedPriceResult (result는 fetch와 동일) 또는 None
+        """
+        response = self._get_response(product_url)
+        if response is None:
+            return None
+        return self.parse_fetch_detailed(product_url, response)
+
+    def parse_fetch(
+        self, product_url: str, response: requests.Response
+    ) -> Optional[PriceResult]:
+        """받아 둔 상품 페이지 응답에서 가격 추출 (영역 해시가 같으면 파싱 생략)"""
+        detail = self.parse_fetch_detailed(product_url, response)
+        return detail.result if detail else None
+
+    def parse_fetch_detailed(
+        self, product_url: str, response: requests.Response
+    ) -> Optional[DetailedPriceResult]:
+        """받아 둔 상품 페이지 응답에서 최저가 + 쇼핑몰별 가격 추출"""
+        digest = self._region_digest(response.content)
+        if digest is not None:
+            cached = self._cached_result(product_url, digest)
+            if cached is not None:
+                return cached
+
+        with self._dom(response.text, product_url) as soup:
+            if not soup:
+                return None
+            detail = self._extract_detail(soup, product_url)
+
+        if detail is not None and digest is not None:
+            self._store_result(product_url, digest, detail)
+        return detail
+
+    def _region_digest(self, body: bytes) -> Optional[bytes]:
+        """쇼핑몰 가격 영역 해시 (캐시 비활성화/영역 없음이면 None)"""
+        if not self.region_cache_size:
+            return None
+        region = mall_price_region(body)
+        if region is None:
+            PARSE_SHORTCUTS.inc(site=self.get_site_name(), outcome="unavailable")
+            return None
+        return hashlib.blake2b(region, digest_size=16).digest()
+
+    def _cached_result(
+        self, product_url: str, digest: bytes
+    ) -> Optional[DetailedPriceResult]:
+        """영역 해시가 직전과 같으면 직전 결과 (조회 시각 갱신)"""
+        with self._region_lock:
+            entry = self._region_cache.get(product_url)
+            if entry is not None and entry[0] == digest:
+                self._region_cache.move_to_end(product_url)
+                hit = entry[1]
+            else:
+                hit = None
+
+        PARSE_SHORTCUTS.inc(site=self.get_site_name(), outcome="hit" if hit else "miss")
+        if hit is None:
+            return None
+        logger.debug(
+            "가격 영역 변화 없음, 파싱 생략",
+            extra={"site": self.get_site_name(), "url": product_url},
+        )
+        return replace(hit, result=replace(hit.result, fetched_at=now_epoch()))
+
+    def _store_result(
+        self, product_url: str, digest: bytes, detail: DetailedPriceResult
+    ):
+        with self._region_lock:
+            self._region_cache[product_url] = (digest, detail)
+            self._region_cache.move_to_end(product_url)
+            while len(self._region_cache) > self.region_cache_size:
+                self._region_cache.popitem(last=False)
+
+    @staticmethod
+    def _mall_row(li, product_url: str) -> Tuple[str, Optional[int], str, bool]:
+        """
+        쇼핑몰 항목 li → (쇼핑몰, 가격, 링크, 최저가 표식 여부), 가격을 못 읽으면 가격 None
+
+        항목마다 CSS 셀렉터를 컴파일하지 않도록 find로 탐색한다. 가격/표식은
+        기존 셀렉터(.box__price .text__num, .box__price.lowest)와 같게 항목 안의
+        모든 .box__price를 본다.
+        """
+        price_boxes = li.find_all(class_="box__price")
+
+        # 가격: .box__price 안의 첫 번째 .text__num
+        price = None
+        for box in price_boxes:
+            price_num = box.find(class_="text__num")
+            if price_num:
+                price = Normalizer.parse_price(price_num.get_text(" ", strip=True))
+                break
+
+        # '최저가' 표식 (.box__price.lowest / .badge__lowest)
+        lowest = any("lowest" in box.get("class", ()) for box in price_boxes) or bool(
+            li.find(class_="badge__lowest")
+        )
+
+        # 쇼핑몰명: 로고 이미지 alt 우선, 없으면 로고 영역 텍스트
+        mall = ""
+        logo = li.find(class_="box__logo")
+        if logo:
+            img = logo.find("img", alt=True)
+            mall = (img["alt"] if img else logo.get_text(" ", strip=True)).strip()
+
+        # 쇼핑몰 링크(브릿지 링크), 비어있으면 최소한 product_url이라도 남김
+        link_elem = li.find("a", class_="link__full-cover")
+        link = (link_elem.get("href") or "").strip() if link_elem else ""
+        if link.startswith("//"):
+            link = "https:" + link
+
+        return mall, price, link or product_url, lowest
+
+    def _extract_detail(
+        self, soup: BeautifulSoup, product_url: str
+    ) -> Optional[DetailedPriceResult]:
+        """상세 페이지 DOM에서 상품명/최저가/구매 링크와 쇼핑몰별 가격 추출"""
         try:
             # 1) 상품명 (페이지 구조가 변할 수 있어 여러 셀렉터를 시도)
             title_raw = ""
@@ -127,48 +317,46 @@ class DanawaScraper(BaseScraper):
 
             title = Normalizer.clean_title(title_raw) if title_raw else ""
 
-            # 2) 쇼핑몰별 최저가 리스트
+            # 2) 쇼핑몰별 최저가 리스트 (모든 항목을 열 단위로 수집)
             mall_items = soup.select("ul.list__mall-price > li.list-item")
             if not mall_items:
                 return None
 
-            # 2-1) '최저가' 표식이 있는 항목 우선 (.box__price.lowest / .badge__lowest)
-            lowest_item = None
+            malls, prices, links = [], [], []
+            target = None
             for li in mall_items:
-                if li.select_one(".box__price.lowest") or li.select_one(
-                    ".badge__lowest"
-                ):
-                    lowest_item = li
-                    break
+                row = self._mall_row(li, product_url)
+                # 2-1) '최저가' 표식이 있는 항목 우선
+                if target is None and row[3]:
+                    target = row
+                # 표에는 가격을 읽을 수 있는 항목만 담는다
+                if row[1] is not None:
+                    malls.append(row[0])
+                    prices.append(row[1])
+                    links.append(row[2])
 
             # 2-2) 없으면 첫 번째 항목 fallback (요구사항: 첫 항목이 최저가)
-            target = lowest_item or mall_items[0]
+            if target is None:
+                target = self._mall_row(mall_items[0], product_url)
 
-            # 3) 가격 추출
-            price_num = target.select_one(".box__price .text__num")
-            if not price_num:
-                return None
-            price = Normalizer.parse_price(price_num.get_text(" ", strip=True))
+            # 3) 대상 항목의 가격을 읽지 못하면 실패 (다른 항목으로 대신하지 않음)
+            _, price, buy_url, _ = target
             if price is None:
                 return None
 
-            # 4) 최저가 쇼핑몰 링크(브릿지 링크)
-            link_elem = target.select_one("a.link__full-cover")
-            buy_url = (link_elem.get("href") or "").strip() if link_elem else ""
-            if buy_url.startswith("//"):
-                buy_url = "https:" + buy_url
-
-            # buy_url이 비어있으면 최소한 product_url이라도 남김
-            final_url = buy_url if buy_url else product_url
-
-            return PriceResult(
+            result = PriceResult(
                 site=self.get_site_name(),
                 title=title,
                 price=price,
-                product_url=final_url,  # ✅ "구매 링크" 용도로 최저가 쇼핑몰 링크를 반환
-                fetched_at=datetime.now().isoformat(),
+                product_url=buy_url,  # ✅ "구매 링크" 용도로 최저가 쇼핑몰 링크를 반환
+                fetched_at=now_epoch(),
             )
+            return DetailedPriceResult(result, MallPriceTable(malls, prices, links))
 
         except Exception as e:
-            print(f"[ERROR] 다나와 가격 조회 실패: {e}")
+            logger.error(
+                "다나와 가격 조회 실패: %s",
+                e,
+                extra={"site": "danawa", "url": product_url},
+            )
             return None
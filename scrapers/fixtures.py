@@ -0,0 +1,105 @@
+"""응답 기록/재생 (오프라인 파서 테스트·벤치마크용)
+
+- FixtureStore: 원본 응답 바이트를 디렉터리에 저장 (index.json + *.body)
+- ReplayAdapter: requests 세션에 마운트하면 저장된 응답을 네트워크 없이 돌려준다
+
+    scraper = DanawaScraper(replay_dir="benchmarks/fixtures")
+    scraper.fetch(url)  # 기록된 응답으로 파싱
+"""
+
+import hashlib
+import io
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+INDEX_FILE = "index.json"
+
+
+class FixtureStore:
+    """URL별 원본 응답 저장소"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._index: Dict[str, dict] = {}
+
+        index_path = self.directory / INDEX_FILE
+        if index_path.exists():
+            with open(index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def urls(self):
+        return list(self._index)
+
+    def entry(self, url: str) -> Optional[dict]:
+        return self._index.get(url)
+
+    def record(self, site: str, url: str, response: requests.Response):
+        """응답 저장 (같은 URL은 덮어쓴다)"""
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".body"
+        entry = {
+            "site": site,
+            "file": name,
+            "status": response.status_code,
+            "encoding": response.encoding,
+            "content_type": response.headers.get("Content-Type", ""),
+        }
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / name).write_bytes(response.content)
+            self._index[url] = entry
+            with open(self.directory / INDEX_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._index, f, indent=2, ensure_ascii=False)
+
+    def body(self, url: str) -> Optional[bytes]:
+        entry = self._index.get(url)
+        if not entry:
+            return None
+        return (self.directory / entry["file"]).read_bytes()
+
+
+class ReplayAdapter(BaseAdapter):
+    """FixtureStore에 기록된 응답을 돌려주는 transport adapter"""
+
+    def __init__(self, store: FixtureStore):
+        super().__init__()
+        self.store = store
+
+    def send(self, request, **kwargs):
+        entry = self.store.entry(request.url)
+        if entry is None:
+            raise requests.ConnectionError(
+                f"기록된 응답 없음 (replay): {request.url}", request=request
+            )
+
+        body = self.store.body(request.url)
+        response = requests.Response()
+        response.status_code = entry["status"]
+        # 본문을 이미 읽은 응답으로 만든다 (close()/iter_content가 raw를 쓸 수 있게)
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": entry.get("content_type", "")}
+        )
+        response.encoding = entry.get("encoding")
+        response.url = request.url
+        response.request = request
+        response.reason = "OK" if response.status_code < 400 else "Replay"
+        return response
+
+    def close(self):
+        pass
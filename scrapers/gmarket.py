@@ -1,39 +1,49 @@
 """지마켓 스크래퍼 (실제 구현 필요)"""
 
+import logging
 from typing import List, Optional
-from datetime import datetime
-from urllib.parse import quote
-from scrapers.base import BaseScraper
-from core.models import Candidate, PriceResult
+import requests
+from bs4 import BeautifulSoup
+from scrapers.base import BaseScraper, instrumented
+from core.models import Candidate, PriceResult, now_epoch
 from core.normalizer import Normalizer
 
+logger = logging.getLogger(__name__)
+
 
 class GmarketScraper(BaseScraper):
     """지마켓 스크래퍼"""
 
     BASE_SEARCH_URL = "https://browse.gmarket.co.kr/search"
+    SEARCH_QUERY_PARAM = "keyword"
+    SEARCH_PAGE_PARAM = "p"
+    WARM_UP_URLS = ("https://browse.gmarket.co.kr/", "https://item.gmarket.co.kr/")
 
     def get_site_name(self) -> str:
         return "gmarket"
 
+    @instrumented("search")
     def search(self, keyword: str, limit: int = 10) -> List[Candidate]:
+        """지마켓 검색 상위 limit개 (1페이지만 요청, 더 보기는 iter_search)"""
+        return self.search_page(keyword)[:limit]
+
+    def search_page(self, keyword: str, page: int = 1) -> List[Candidate]:
         """
-        지마켓 검색 결과 파싱
+        지마켓 검색 결과 한 페이지 파싱
 
         TODO: 실제 지마켓 HTML 구조에 맞게 구현 필요
         """
-        candidates = []
-
-        # 검색 URL 생성
-        search_url = f"{self.BASE_SEARCH_URL}?keyword={quote(keyword)}"
+        with self._get_dom(self.search_url(keyword, page)) as soup:
+            if not soup:
+                return []
+            return self._extract_candidates(soup)
 
-        # HTML 가져오기
-        soup = self._get_html(search_url)
-        if not soup:
-            return candidates
+    def _extract_candidates(self, soup: BeautifulSoup) -> List[Candidate]:
+        """검색 결과 DOM에서 후보 추출"""
+        candidates = []
 
         # TODO: 실제 셀렉터로 교체
-        items = soup.select(".box__item-container")[:limit]
+        items = soup.select(".box__item-container")
 
         for item in items:
             try:
@@ -64,21 +74,36 @@ class GmarketScraper(BaseScraper):
                 )
 
             except Exception as e:
-                print(f"[WARN] 지마켓 후보 파싱 오류: {e}")
+                logger.warning("지마켓 후보 파싱 오류: %s", e)
                 continue
 
         return candidates
 
+    @instrumented("fetch")
     def fetch(self, product_url: str) -> Optional[PriceResult]:
         """
         지마켓 상품 페이지에서 가격 조회
 
         TODO: 실제 지마켓 상품 페이지 구조에 맞게 구현
         """
-        soup = self._get_html(product_url)
-        if not soup:
+        response = self._get_response(product_url)
+        if response is None:
             return None
+        return self.parse_fetch(product_url, response)
+
+    def parse_fetch(
+        self, product_url: str, response: requests.Response
+    ) -> Optional[PriceResult]:
+        """받아 둔 상품 페이지 응답에서 가격 추출"""
+        with self._dom(response.text, product_url) as soup:
+            if not soup:
+                return None
+            return self._extract_price(soup, product_url)
 
+    def _extract_price(
+        self, soup: BeautifulSoup, product_url: str
+    ) -> Optional[PriceResult]:
+        """상품 페이지 DOM에서 상품명/가격 추출"""
         try:
             # TODO: 실제 셀렉터로 교체
             title_elem = soup.select_one(".itemtit")
@@ -98,11 +123,15 @@ class GmarketScraper(BaseScraper):
                 title=title,
                 price=price,
                 product_url=product_url,
-                fetched_at=datetime.now().isoformat(),
+                fetched_at=now_epoch(),
             )
 
         except Exception as e:
-            print(f"[ERROR] 지마켓 가격 조회 실패: {e}")
+            logger.error(
+                "지마켓 가격 조회 실패: %s",
+                e,
+                extra={"site": "gmarket", "url": product_url},
+            )
             return None
 
 
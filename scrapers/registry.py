@@ -0,0 +1,241 @@
+"""사이트 이름 → 스크래퍼 등록부 (사이트 모듈/세션은 처음 쓸 때 생성)
+
+사이트는 다음 순서로 모으며, 뒤에서 찾은 설정이 앞의 설정을 덮어쓴다.
+
+1. 기본 사이트 (BUILTIN_SITES)
+2. entry point 그룹 "price_alert.scrapers" (별도 패키지로 설치한 사이트,
+   이름 = 사이트, 값 = "모듈:클래스")
+3. 사이트 설정 파일 (SITES_CONFIG_PATH, 환경변수 PRICE_ALERT_SITES_FILE로 변경)
+
+설정 파일 예:
+
+    {
+      "danawa": {"settings": {"timeout": 10, "rate_limit": 0.5}},
+      "coupang": {"target": "my_sites.coupang:CoupangScraper",
+                  "display_name": "쿠팡", "aliases": ["쿠팡"]},
+      "gmarket": {"enabled": false}
+    }
+
+settings는 스크래퍼 생성자 인자로 전달된다 (timeout, rate_limit, rate_burst,
+parser, hedge, 사이트별 인자 등). 등록부는 "모듈:클래스" 문자열만 들고 있다가
+get/create 시점에 모듈을 import하므로, 쓰지 않는 사이트는 import하지 않는다.
+"""
+
+import importlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from config.constants import SITES_CONFIG_ENV, SITES_CONFIG_PATH
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "price_alert.scrapers"
+
+
+@dataclass(frozen=True)
+class SiteSpec:
+    """사이트 1개의 등록 정보"""
+
+    name: str  # 내부 이름 (상태 파일/지표 레이블)
+    target: str  # "모듈:클래스" (또는 팩토리 함수)
+    display_name: str = ""
+    aliases: tuple = ()  # 일괄 등록 파일에서 허용하는 다른 이름
+    enabled: bool = True
+    settings: dict = field(default_factory=dict)  # 생성자 인자
+
+    @property
+    def label(self) -> str:
+        return self.display_name or self.name
+
+
+BUILTIN_SITES = (
+    SiteSpec("danawa", "scrapers.danawa:DanawaScraper", "다나와", aliases=("다나와",)),
+    SiteSpec(
+        "gmarket", "scrapers.gmarket:GmarketScraper", "지마켓", aliases=("지마켓",)
+    ),
+)
+
+
+def _load_target(target: str) -> Callable:
+    module_name, _, attr = target.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attr.split(".") if attr else ():
+        obj = getattr(obj, part)
+    return obj
+
+
+class ScraperRegistry:
+    """사이트별 스크래퍼 팩토리와 공유 인스턴스 (스레드 안전)"""
+
+    def __init__(
+        self,
+        sites: Iterable[SiteSpec] = BUILTIN_SITES,
+        config_path: Optional[str] = None,
+        use_entry_points: bool = True,
+    ):
+        """
+        Args:
+            sites: 기본 사이트
+            config_path: 사이트 설정 파일 (기본: 환경변수 또는 SITES_CONFIG_PATH)
+            use_entry_points: 설치된 패키지의 entry point도 찾을지 여부
+        """
+        self._builtin = list(sites)
+        self.config_path = Path(
+            config_path or os.environ.get(SITES_CONFIG_ENV) or SITES_CONFIG_PATH
+        )
+        self.use_entry_points = use_entry_points
+        self._specs: Optional[Dict[str, SiteSpec]] = None
+        self._factories: Dict[str, Callable] = {}
+        self._instances: Dict[str, object] = {}
+        self._lock = threading.RLock()
+
+    # === 사이트 조회 (모듈 import 없음) ===
+
+    def sites(self) -> List[str]:
+        """사용하는 사이트 이름 (등록 순서)"""
+        return [name for name, spec in self._discover().items() if spec.enabled]
+
+    def spec(self, name: str) -> SiteSpec:
+        """사이트 등록 정보 (없거나 꺼져 있으면 KeyError)"""
+        spec = self._discover().get(name)
+        if spec is None or not spec.enabled:
+            raise KeyError(f"등록되지 않은 사이트: {name}")
+        return spec
+
+    def display_name(self, name: str) -> str:
+        """표시 이름 (등록되지 않은 사이트는 이름 그대로)"""
+        spec = self._discover().get(name)
+        return spec.label if spec else name
+
+    def resolve(self, text: str) -> Optional[str]:
+        """이름/표시 이름/별칭 → 사이트 이름"""
+        key = text.strip().lower()
+        if not key:
+            return None
+        for name in self.sites():
+            spec = self._specs[name]
+            if key in (name, spec.display_name.lower(), *map(str.lower, spec.aliases)):
+                return name
+        return None
+
+    def register(self, spec: SiteSpec):
+        """사이트 추가/교체 (이미 만든 인스턴스는 버린다)"""
+        with self._lock:
+            specs = self._discover()
+            specs[spec.name] = spec
+            self._factories.pop(spec.name, None)
+            self._instances.pop(spec.name, None)
+
+    # === 스크래퍼 생성 (처음 쓸 때 모듈 import) ===
+
+    def factory(self, name: str) -> Callable:
+        """사이트 스크래퍼 클래스/팩토리"""
+        with self._lock:
+            factory = self._factories.get(name)
+            if factory is None:
+                factory = self._factories[name] = _load_target(self.spec(name).target)
+            return factory
+
+    def create(self, name: str, **overrides):
+        """새 스크래퍼 (사이트 설정 + overrides를 생성자 인자로)"""
+        return self.factory(name)(**{**self.spec(name).settings, **overrides})
+
+    def get(self, name: str):
+        """공유 스크래퍼 (처음 호출할 때 생성, 세션/연결 재사용)"""
+        with self._lock:
+            scraper = self._instances.get(name)
+            if scraper is None:
+                scraper = self._instances[name] = self.create(name)
+                logger.debug("스크래퍼 생성", extra={"site": name})
+            return scraper
+
+    def scrapers(self, names: Optional[Iterable[str]] = None) -> "LazyScrapers":
+        """{사이트: 스크래퍼} 매핑 (값을 꺼낼 때 생성)"""
+        return LazyScrapers(self, self.sites() if names is None else list(names))
+
+    # === 탐색 ===
+
+    def _discover(self) -> Dict[str, SiteSpec]:
+        if self._specs is not None:
+            return self._specs
+        with self._lock:
+            if self._specs is None:
+                specs = {spec.name: spec for spec in self._builtin}
+                if self.use_entry_points:
+                    self._merge_entry_points(specs)
+                self._merge_config(specs)
+                self._specs = specs
+        return self._specs
+
+    def _merge_entry_points(self, specs: Dict[str, SiteSpec]):
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except Exception as e:
+            logger.warning("스크래퍼 entry point 조회 실패: %s", e)
+            return
+        for ep in found:
+            current = specs.get(ep.name)
+            specs[ep.name] = (
+                replace(current, target=ep.value)
+                if current
+                else SiteSpec(ep.name, ep.value)
+            )
+
+    def _merge_config(self, specs: Dict[str, SiteSpec]):
+        if not self.config_path.exists():
+            return
+        try:
+            with open(self.config_path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except Exception as e:
+            logger.error("사이트 설정 로드 실패 (%s): %s", self.config_path, e)
+            return
+
+        for name, item in config.items():
+            current = specs.get(name)
+            if current is None:
+                if "target" not in item:
+                    logger.error("사이트 설정에 target이 없습니다: %s", name)
+                    continue
+                current = SiteSpec(name, item["target"])
+            specs[name] = replace(
+                current,
+                target=item.get("target", current.target),
+                display_name=item.get("display_name", current.display_name),
+                aliases=tuple(item.get("aliases", current.aliases)),
+                enabled=item.get("enabled", current.enabled),
+                settings={**current.settings, **item.get("settings", {})},
+            )
+
+
+class LazyScrapers(Mapping):
+    """등록부의 스크래퍼를 꺼낼 때 생성하는 {사이트: 스크래퍼} 매핑"""
+
+    def __init__(self, registry: ScraperRegistry, names: List[str]):
+        self.registry = registry
+        self.names = names
+
+    def __getitem__(self, name: str):
+        if name not in self.names:
+            raise KeyError(name)
+        return self.registry.get(name)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name) -> bool:
+        return name in self.names
+
+
+# 공용 등록부 (프로세스 안에서 사이트별 스크래퍼 1개를 공유)
+SITE_REGISTRY = ScraperRegistry()
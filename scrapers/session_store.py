@@ -0,0 +1,96 @@
+"""스크래퍼별 쿠키 저장/복원 (재시작 후에도 같은 세션으로 보이도록)
+
+requests 세션의 쿠키를 사이트별 JSON 파일에 저장하고, 시작 시 만료되지 않은
+쿠키만 다시 넣는다. 파일은 임시 파일에 쓴 뒤 교체하므로 여러 작업자 프로세스가
+같은 파일을 써도 깨지지 않는다 (마지막 저장이 남는다).
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from requests.cookies import RequestsCookieJar, create_cookie
+
+logger = logging.getLogger(__name__)
+
+
+class CookieStore:
+    """쿠키 파일 1개"""
+
+    def __init__(self, filepath: str):
+        self.filepath = Path(filepath)
+        self._lock = threading.Lock()
+
+    def load(self, jar: RequestsCookieJar) -> int:
+        """
+        저장된 쿠키를 jar에 추가
+
+        Returns:
+            복원한 쿠키 수 (파일이 없거나 읽을 수 없으면 0)
+        """
+        if not self.filepath.exists():
+            return 0
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        except Exception as e:
+            logger.warning("쿠키 로드 실패 (%s): %s", self.filepath, e)
+            return 0
+
+        now = time.time()
+        restored = 0
+        for item in items:
+            if item.get("expires") is not None and item["expires"] <= now:
+                continue
+            jar.set_cookie(create_cookie(**item))
+            restored += 1
+        return restored
+
+    def save(self, jar: RequestsCookieJar) -> bool:
+        """
+        jar의 쿠키를 파일로 저장 (임시 파일에 쓰고 교체)
+
+        임시 파일은 저장할 때마다 고유한 이름으로 만들어 다른 프로세스의 저장과
+        섞이지 않는다.
+        """
+        items = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure,
+                "rest": {"HttpOnly": cookie.get_nonstandard_attr("HttpOnly")},
+            }
+            for cookie in list(jar)
+        ]
+        tmp_path = None
+        try:
+            with self._lock:
+                self.filepath.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=self.filepath.name + ".",
+                    suffix=".tmp",
+                    dir=self.filepath.parent,
+                )
+                with open(fd, "w", encoding="utf-8") as f:
+                    json.dump(items, f, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.filepath)
+                tmp_path = None
+            return True
+        except Exception as e:
+            logger.warning("쿠키 저장 실패 (%s): %s", self.filepath, e)
+            return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
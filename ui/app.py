@@ -1,17 +1,23 @@
 """Tkinter 메인 UI"""
 
+import time
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Optional, Dict
-from datetime import datetime
+from itertools import islice
+from typing import Optional, Dict, Iterator
 
 from ui.widgets import LabeledEntry, LabeledCombobox, CandidateListbox, StatusBar
-from core.models import TrackingState, Candidate
+from core.models import TrackingState, Candidate, to_iso
 from core.state_store import StateStore
+from core.matcher import ProductMatcher
+from core.normalizer import Normalizer
+from core.prefetch import PrefetchCache
+from core.price_index import PriceIndex
 from core.scheduler import Scheduler
-from scrapers.danawa import DanawaScraper
-from scrapers.gmarket import GmarketScraper
+from scrapers.base import warm_up_all
+from scrapers.registry import SITE_REGISTRY
 from notify.emailer import Emailer
+from notify.mail_scheduler import MAIL_SCHEDULER
 from notify.templates import create_test_email
 from config.constants import (
     CRAWL_INTERVALS,
@@ -19,7 +25,16 @@ from config.constants import (
     EMAIL_DOMAINS,
     DEFAULT_CRAWL_INTERVAL,
     DEFAULT_NOTIFY_INTERVAL,
+    DEFAULT_CANDIDATE_COUNT,
     STATE_ACTIVE,
+    CROSS_SITE_MATCH_THRESHOLD,
+    PREFETCH_WAIT,
+    PREFETCH_POLL,
+    PREFETCH_DEBOUNCE,
+    PRICE_INDEX_PATH,
+    PRICE_LOW_WINDOW_DAYS,
+    WARM_UP_ON_START,
+    ALL_SITES_LABEL,
 )
 
 
@@ -34,8 +49,28 @@ class PriceAlertApp:
         # 상태
         self.state_store = StateStore()
         self.scheduler: Optional[Scheduler] = None
-        self.scrapers = {"danawa": DanawaScraper(), "gmarket": GmarketScraper()}
+        # 사이트 등록부의 스크래퍼 (사이트 모듈/세션은 처음 쓸 때 생성)
+        self.scrapers = SITE_REGISTRY.scrapers()
+        if WARM_UP_ON_START:
+            # 저장된 추적 대상의 사이트만 연결을 열어 둔다 (나머지는 처음 쓸 때 생성)
+            warm_up_all(
+                self.scrapers,
+                sites={
+                    site
+                    for state in self.state_store.load_all()
+                    for site in state.selected_products
+                },
+            )
         self.emailer: Optional[Emailer] = None
+        # 사이트별 진행 중인 검색 (더 보기 시 다음 페이지부터 이어서 가져옴)
+        self.search_iters: Dict[str, Iterator[Candidate]] = {}
+        # 후보 선택 시 상품 페이지 선행 조회 (추적 시작/첫 크롤링에서 재사용)
+        self.prefetch = PrefetchCache()
+        # 선택이 빠르게 바뀌는 동안에는 선행 조회를 미룬다 (root.after 예약 id)
+        self._prefetch_after: Optional[str] = None
+        # 상품별 역대/기간 최저가 (재시작 후에도 유지)
+        self.price_index = PriceIndex(PRICE_INDEX_PATH)
+        self.price_index.load()
 
         self._setup_ui()
         self._load_saved_state()
@@ -55,8 +90,9 @@ class PriceAlertApp:
         self.keyword_entry.pack(fill=tk.X, pady=3)
 
         # 사이트 선택
+        site_labels = [SITE_REGISTRY.display_name(site) for site in self.scrapers]
         self.site_combo = LabeledCombobox(
-            input_frame, "사이트 선택:", values=["다나와", "지마켓", "둘 다"]
+            input_frame, "사이트 선택:", values=site_labels + [ALL_SITES_LABEL]
         )
         self.site_combo.pack(fill=tk.X, pady=3)
 
@@ -117,7 +153,11 @@ class PriceAlertApp:
         )
         candidate_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        self.candidate_list = CandidateListbox(candidate_frame)
+        self.candidate_list = CandidateListbox(
+            candidate_frame,
+            on_select=self._prefetch_selected,
+            on_load_more=self._load_more_candidates,
+        )
         self.candidate_list.pack(fill=tk.BOTH, expand=True)
 
         # === 제어 버튼 ===
@@ -170,25 +210,16 @@ class PriceAlertApp:
         self.candidate_list.clear()
 
         # 사이트 선택 변환
-        site_selection = self.site_combo.get()
-        sites = []
-        if site_selection == "다나와":
-            sites = ["danawa"]
-        elif site_selection == "지마켓":
-            sites = ["gmarket"]
-        else:
-            sites = ["danawa", "gmarket"]
-
-        # 검색 실행
-        all_candidates = []
-        for site in sites:
-            scraper = self.scrapers.get(site)
-            if scraper:
-                try:
-                    candidates = scraper.search(keyword, limit=10)
-                    all_candidates.extend(candidates)
-                except Exception as e:
-                    messagebox.showerror("검색 오류", f"{site} 검색 실패: {e}")
+        site = SITE_REGISTRY.resolve(self.site_combo.get())
+        sites = [site] if site else list(self.scrapers)
+
+        # 검색 실행 (사이트별로 첫 페이지만 요청하고 나머지는 더 보기 때 요청)
+        self.search_iters = {
+            site: self.scrapers[site].iter_search(keyword)
+            for site in sites
+            if site in self.scrapers
+        }
+        all_candidates = self._next_candidates()
 
         if not all_candidates:
             messagebox.showinfo(
@@ -198,8 +229,54 @@ class PriceAlertApp:
             return
 
         self.candidate_list.add_candidates(all_candidates)
+        self.candidate_list.set_has_more(bool(self.search_iters))
         self.status_bar.set_status(f"{len(all_candidates)}개 후보 검색 완료", "green")
 
+    def _next_candidates(self) -> list:
+        """사이트별 검색에서 다음 후보를 DEFAULT_CANDIDATE_COUNT개씩 가져오기"""
+        candidates = []
+        for site, results in list(self.search_iters.items()):
+            try:
+                batch = list(islice(results, DEFAULT_CANDIDATE_COUNT))
+            except Exception as e:
+                messagebox.showerror(
+                    "검색 오류", f"{SITE_REGISTRY.display_name(site)} 검색 실패: {e}"
+                )
+                batch = []
+            if len(batch) < DEFAULT_CANDIDATE_COUNT:
+                # 결과가 끝났거나 실패한 사이트는 더 이상 요청하지 않음
+                del self.search_iters[site]
+            candidates.extend(batch)
+        return candidates
+
+    def _load_more_candidates(self):
+        """후보 목록 끝에서 다음 검색 결과 이어 붙이기"""
+        self.status_bar.set_status("후보 더 불러오는 중...", "blue")
+        candidates = self._next_candidates()
+        self.candidate_list.append_candidates(candidates)
+        self.candidate_list.set_has_more(bool(self.search_iters))
+        self.status_bar.set_status(
+            f"{len(self.candidate_list.candidates)}개 후보 검색 완료", "green"
+        )
+
+    def _prefetch_selected(self):
+        """후보 선택 시 선행 조회 예약 (PREFETCH_DEBOUNCE초 동안 선택이 그대로일 때만)"""
+        if self._prefetch_after is not None:
+            self.root.after_cancel(self._prefetch_after)
+        self._prefetch_after = self.root.after(
+            int(PREFETCH_DEBOUNCE * 1000), self._prefetch_now
+        )
+
+    def _prefetch_now(self):
+        """선택한 후보의 상품 페이지를 백그라운드에서 미리 조회"""
+        if self._prefetch_after is not None:
+            self.root.after_cancel(self._prefetch_after)
+            self._prefetch_after = None
+        selected = self.candidate_list.get_selected()
+        scraper = selected and self.scrapers.get(selected.site)
+        if scraper:
+            self.prefetch.prefetch(selected.site, scraper, selected.product_url)
+
     def _start_tracking(self):
         """추적 시작"""
         # 선택 검증
@@ -207,6 +284,9 @@ class PriceAlertApp:
         if not selected:
             messagebox.showwarning("선택 오류", "추적할 상품을 선택하세요.")
             return
+        # 예약만 된 선행 조회는 지금 시작
+        if self._prefetch_after is not None:
+            self._prefetch_now()
 
         # 이메일 검증
         email_local = self.email_local_entry.get().strip()
@@ -230,21 +310,33 @@ class PriceAlertApp:
             self.notify_interval_combo.get(), NOTIFY_INTERVALS
         )
 
+        # 사이트별 선택 상품 (전체 선택이면 다른 사이트의 동일 상품 자동 매칭)
+        selected_products = {selected.site: selected.product_url}
+        title_signatures = {selected.site: Normalizer.title_signature(selected.title)}
+        if self.site_combo.get() == ALL_SITES_LABEL:
+            match = self._match_other_site(selected)
+            if match:
+                selected_products[match.site] = match.product_url
+                title_signatures[match.site] = Normalizer.title_signature(match.title)
+                self.prefetch.prefetch(
+                    match.site, self.scrapers[match.site], match.product_url
+                )
+
         # 상태 생성
         keyword = self.keyword_entry.get().strip()
         state = TrackingState(
             keyword=keyword,
-            selected_sites=[selected.site],
+            selected_sites=list(selected_products),
             crawl_interval=crawl_interval,
             notify_interval=notify_interval,
             email=email,
-            selected_products={selected.site: selected.product_url},
+            selected_products=selected_products,
             last_prices={},
             last_crawl_at=None,
             last_notify_at=None,
             status=STATE_ACTIVE,
+            title_signatures=title_signatures,
         )
-
         # 발신자 이메일 설정 (간단한 다이얼로그)
         sender_info = self._get_sender_credentials()
         if not sender_info:
@@ -263,6 +355,9 @@ class PriceAlertApp:
             scrapers=self.scrapers,
             emailer=self.emailer,
             on_status_change=self._update_status_display,
+            prefetch=self.prefetch,
+            price_index=self.price_index,
+            mail_scheduler=MAIL_SCHEDULER,
         )
 
         self.scheduler.start()
@@ -272,6 +367,60 @@ class PriceAlertApp:
         self._set_tracking_mode(True)
         self.status_bar.set_active()
         self._update_status_display(state)
+        self._seed_prefetched(self.scheduler)
+
+    def _seed_prefetched(self, scheduler: Scheduler, started: Optional[float] = None):
+        """
+        선행 조회 결과로 시작 가격 채우기
+
+        UI 스레드를 막지 않도록 진행 중인 조회는 PREFETCH_POLL초마다 root.after로
+        다시 확인하고, PREFETCH_WAIT초가 지나면 그만 기다린다. 그 사이 스케줄러가
+        먼저 크롤링한 사이트와 중지된 추적은 건드리지 않는다.
+        """
+        if self.scheduler is not scheduler:
+            return
+        started = time.monotonic() if started is None else started
+        waiting = time.monotonic() - started < PREFETCH_WAIT
+        state = scheduler.state
+
+        verified, pending = [], []
+        with scheduler.state_lock:
+            for site, product_url in state.selected_products.items():
+                if site in state.last_prices:
+                    continue
+                if waiting and not self.prefetch.done(product_url):
+                    pending.append(site)
+                    continue
+                result = self.prefetch.get(site, product_url)
+                if result:
+                    state.update_price(site, result.price, result.fetched_at)
+                    verified.append(f"[{site}] {result.title} - {result.price:,}원")
+            if verified:
+                self.state_store.save(state)
+
+        if verified:
+            self.status_bar.set_status(f"확인됨: {', '.join(verified)}", "green")
+            self._update_status_display(state)
+        if pending:
+            self.root.after(
+                int(PREFETCH_POLL * 1000), self._seed_prefetched, scheduler, started
+            )
+
+    def _match_other_site(self, selected: Candidate) -> Optional[Candidate]:
+        """선택 상품과 같은 상품을 다른 사이트 후보에서 찾기"""
+        matcher = ProductMatcher()
+        matcher.add_candidates(self.candidate_list.candidates)
+
+        match = matcher.best_match(
+            selected.title,
+            exclude_site=selected.site,
+            min_similarity=CROSS_SITE_MATCH_THRESHOLD,
+        )
+        if not match:
+            self.status_bar.set_warning("다른 사이트에서 같은 상품을 찾지 못했습니다")
+            return None
+
+        return match[1]
 
     def _stop_tracking(self):
         """추적 중지"""
@@ -370,17 +519,37 @@ class PriceAlertApp:
         self.status_text.config(state="normal")
         self.status_text.delete("1.0", tk.END)
 
+        prices = ", ".join(
+            self._price_summary(site, price, state.selected_products.get(site))
+            for site, price in state.last_prices.items()
+        )
         info = f"""
 키워드: {state.keyword}
 상태: {state.status}
-마지막 조회: {state.last_crawl_at or '없음'}
-마지막 알림: {state.last_notify_at or '없음'}
+마지막 조회: {to_iso(state.last_crawl_at) or '없음'}
+최근 가격: {prices or '없음'}
+마지막 알림: {to_iso(state.last_notify_at) or '없음'}
 추적 사이트: {', '.join(state.selected_sites)}
         """.strip()
 
         self.status_text.insert("1.0", info)
         self.status_text.config(state="disabled")
 
+    def _price_summary(self, site: str, price: int, product_url: str) -> str:
+        """사이트 현재 가격 + 역대/기간 최저가 (인덱스 조회)"""
+        text = f"{SITE_REGISTRY.display_name(site)} {price:,}원"
+        all_time = self.price_index.all_time_low(product_url)
+        if all_time is None:
+            return text
+        if self.price_index.is_new_low(product_url):
+            return f"{text} (역대 최저가)"
+
+        lows = [f"역대 최저 {all_time:,}원"]
+        window = self.price_index.window_low(product_url)
+        if window is not None:
+            lows.insert(0, f"{PRICE_LOW_WINDOW_DAYS}일 최저 {window:,}원")
+        return f"{text} ({', '.join(lows)})"
+
     def _load_saved_state(self):
         """저장된 상태 로드 (재시작용)"""
         # 간단한 구현: 저장된 상태 표시만
@@ -392,3 +561,5 @@ class PriceAlertApp:
     def run(self):
         """앱 실행"""
         self.root.mainloop()
+        # 저장 간격 안에 쌓인 최저가 집계 저장
+        self.price_index.flush()
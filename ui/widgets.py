@@ -61,21 +61,35 @@ class LabeledCombobox(tk.Frame):
 
 
 class CandidateListbox(tk.Frame):
-    """후보 선택 리스트박스"""
-
-    def __init__(self, parent, on_select: Optional[Callable] = None):
+    """후보 선택 리스트박스 (끝까지 스크롤하거나 '더 보기'로 다음 후보 불러오기)"""
+
+    def __init__(
+        self,
+        parent,
+        on_select: Optional[Callable] = None,
+        on_load_more: Optional[Callable] = None,
+    ):
         super().__init__(parent)
+        self.on_load_more = on_load_more
+        self.has_more = False
+        self._loading = False
+
+        # 더 보기 버튼
+        self.more_btn = tk.Button(
+            self, text="더 보기", command=self.load_more, state="disabled"
+        )
+        self.more_btn.pack(side=tk.BOTTOM, fill=tk.X)
 
         # 스크롤바
-        scrollbar = tk.Scrollbar(self)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar = tk.Scrollbar(self)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # 리스트박스
         self.listbox = tk.Listbox(
-            self, height=10, selectmode=tk.SINGLE, yscrollcommand=scrollbar.set
+            self, height=10, selectmode=tk.SINGLE, yscrollcommand=self._on_scroll
         )
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.listbox.yview)
+        self.scrollbar.config(command=self.listbox.yview)
 
         # 선택 이벤트
         if on_select:
@@ -83,17 +97,45 @@ class CandidateListbox(tk.Frame):
 
         self.candidates: List[Candidate] = []
 
+    def _on_scroll(self, first, last):
+        """스크롤 위치 갱신, 목록 끝에 닿으면 다음 후보 불러오기"""
+        self.scrollbar.set(first, last)
+        # 스크롤이 생긴 목록(first > 0)에서 끝까지 내렸을 때만
+        if float(first) > 0 and float(last) >= 1.0:
+            self.after_idle(self.load_more)
+
+    def set_has_more(self, has_more: bool):
+        """더 불러올 후보가 남았는지 표시"""
+        self.has_more = has_more
+        self.more_btn.config(state="normal" if has_more else "disabled")
+
+    def load_more(self):
+        """on_load_more 호출 (이미 불러오는 중이거나 남은 후보가 없으면 무시)"""
+        if not self.has_more or self._loading or not self.on_load_more:
+            return
+        self._loading = True
+        try:
+            self.on_load_more()
+        finally:
+            self._loading = False
+
     def clear(self):
         """리스트 초기화"""
         self.listbox.delete(0, tk.END)
         self.candidates = []
+        self.set_has_more(False)
 
     def add_candidates(self, candidates: List[Candidate]):
         """후보 추가"""
-        self.candidates = candidates
+        self.candidates = []
         self.listbox.delete(0, tk.END)
+        self.append_candidates(candidates)
+
+    def append_candidates(self, candidates: List[Candidate]):
+        """기존 목록 뒤에 후보 추가 (선택 유지)"""
+        self.candidates.extend(candidates)
 
-        for i, candidate in enumerate(candidates):
+        for candidate in candidates:
             price_text = (
                 f"{candidate.price:,}원" if candidate.price else "가격 정보 없음"
             )